@@ -3,6 +3,10 @@
 import argparse
 from collections.abc import Sequence
 
+from ai_paper_downloader import logs
+from ai_paper_downloader import openreview_cache
+from ai_paper_downloader import progress
+
 CONFERENCE_CHOICES = (
     "AAAI",
     "DMLR",
@@ -14,6 +18,8 @@ CONFERENCE_CHOICES = (
     "NeurIPS",
     "TMLR",
 )
+# Mirrors parser.soup.BACKEND_CHOICES without importing bs4 for --help.
+HTML_BACKEND_CHOICES = ("auto", "html.parser", "lxml")
 YEAR_CHOICES = (
     "2026",
     "2025",
@@ -37,19 +43,25 @@ def _build_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         "--conference",
-        dest="conference",
-        help="Conference name to download papers from",
-        default="none",
-        choices=CONFERENCE_CHOICES,
+        dest="conferences",
+        help=(
+            "Comma-separated conference names to download papers from, "
+            f"out of {', '.join(CONFERENCE_CHOICES)}"
+        ),
+        metavar="CONFERENCE[,CONFERENCE...]",
+        type=_conference_list,
         required=True,
     )
 
     parser.add_argument(
         "--year",
-        dest="year",
-        help="Year of the conference",
-        default="none",
-        choices=YEAR_CHOICES,
+        dest="years",
+        help=(
+            "Comma-separated years or inclusive ranges such as 2020-2025, "
+            f"from {YEAR_CHOICES[-1]} to {YEAR_CHOICES[0]}"
+        ),
+        metavar="YEAR[-YEAR][,...]",
+        type=_year_list,
         required=True,
     )
 
@@ -80,14 +92,317 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--seconds-between-downloads",
         dest="seconds_between_downloads",
-        help="The number of seconds to wait between downloading papers",
+        help=(
+            "The minimum number of seconds between requests to the same host "
+            "(shorthand for --rate-limit 1/SECONDS)"
+        ),
+        type=float,
+        default=0,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        help="The number of PDFs to download concurrently",
+        type=int,
+        default=1,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--host-limit",
+        dest="host_limits",
+        help=(
+            "Maximum concurrent downloads from one host, as HOST=N; known "
+            "publisher hosts have conservative defaults"
+        ),
+        type=_host_limit,
+        action="append",
+        default=[],
+        required=False,
+    )
+
+    parser.add_argument(
+        "--pool-size",
+        dest="pool_size",
+        help="The number of keep-alive connections to pool per host",
+        type=int,
+        default=10,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--max-retries",
+        dest="max_retries",
+        help="The number of times to retry connection errors and 5xx responses",
+        type=int,
+        default=3,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--connect-timeout",
+        dest="connect_timeout",
+        help="Seconds to wait for a connection to a PDF host",
+        type=float,
+        default=10.0,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--read-timeout",
+        dest="read_timeout",
+        help=(
+            "Seconds to wait for the next bytes of a PDF response before the "
+            "paper is requeued"
+        ),
+        type=float,
+        default=60.0,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        dest="rate_limits",
+        help=(
+            "Maximum requests per second to each host (0 disables the "
+            "per-conference default), or to the hosts of one conference as "
+            "CONF=R; may be repeated"
+        ),
+        metavar="[CONF=]R",
+        type=_rate_limit,
+        action="append",
+        default=[],
+        required=False,
+    )
+
+    parser.add_argument(
+        "--burst",
+        dest="burst",
+        help="Number of requests a host may receive back-to-back before limiting",
+        type=int,
+        default=None,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--adaptive-concurrency",
+        dest="adaptive_concurrency",
+        help=(
+            "Start each host at one download and grow or shrink its "
+            "concurrency from latency and 429/503 feedback"
+        ),
+        action="store_true",
+        required=False,
+    )
+
+    parser.add_argument(
+        "--download-retries",
+        dest="download_retries",
+        help=(
+            "The number of times to requeue a paper after a transient download "
+            "error, with exponential backoff"
+        ),
+        type=int,
+        default=2,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--retry-failed",
+        dest="retry_failed",
+        help=(
+            "Only re-attempt papers recorded in failed_downloads.jsonl, "
+            "without parsing the conference HTML"
+        ),
+        action="store_true",
+        required=False,
+    )
+
+    parser.add_argument(
+        "--min-pdf-size",
+        dest="min_pdf_size",
+        help="Treat existing PDFs smaller than this many bytes as missing",
+        type=int,
+        default=0,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        help=(
+            "The number of processes parsing multi-file proceedings "
+            "(AAAI, JAIR, DMLR); 0 uses every CPU core"
+        ),
+        type=int,
         default=0,
         required=False,
     )
 
+    parser.add_argument(
+        "--html-backend",
+        dest="html_backend",
+        help=(
+            "The HTML parser backend; auto uses lxml when it is installed "
+            "and html.parser otherwise"
+        ),
+        default="auto",
+        choices=HTML_BACKEND_CHOICES,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--no-parse-cache",
+        dest="no_parse_cache",
+        help="Always re-parse the HTML instead of reusing cached parse results",
+        action="store_true",
+        required=False,
+    )
+
+    parser.add_argument(
+        "--openreview-cache",
+        dest="openreview_cache",
+        help=(
+            "How ICLR 2017-2023 OpenReview notes are cached: use recorded notes "
+            "and fetch missing ones, refresh them all, replay recorded notes "
+            "only (no network), or off"
+        ),
+        default="use",
+        choices=openreview_cache.CACHE_MODES,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--log-level",
+        dest="log_level",
+        help="Only log messages at or above this level; DEBUG adds per-paper skips",
+        default="INFO",
+        choices=logs.LOG_LEVELS,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--log-format",
+        dest="log_format",
+        help="Log plain text lines or one JSON object per line",
+        default="text",
+        choices=logs.LOG_FORMATS,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--progress-interval",
+        dest="progress_interval",
+        help=(
+            "Minimum seconds between two per-download progress lines "
+            "(0 logs every download)"
+        ),
+        type=float,
+        default=logs.PROGRESS_INTERVAL,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--status-interval",
+        dest="status_interval",
+        help=(
+            "Seconds between throughput and ETA summaries when output is not "
+            "a terminal; a terminal shows a live status line (0 disables both)"
+        ),
+        type=float,
+        default=progress.STATUS_INTERVAL,
+        required=False,
+    )
+
     return parser
 
 
+def _unique(values: list[str]) -> tuple[str, ...]:
+    """Drop repeated values, keeping the first occurrence of each."""
+    return tuple(dict.fromkeys(values))
+
+
+def _conference_list(value: str) -> tuple[str, ...]:
+    """Parse a comma-separated list of conference names."""
+    conferences = [name.strip() for name in value.split(",")]
+    for name in conferences:
+        if name not in CONFERENCE_CHOICES:
+            raise argparse.ArgumentTypeError(f"unknown conference {name!r}")
+    return _unique(conferences)
+
+
+def _year_list(value: str) -> tuple[str, ...]:
+    """Parse comma-separated years and inclusive FIRST-LAST year ranges."""
+    years: list[str] = []
+    for part in value.split(","):
+        first, separator, last = part.strip().partition("-")
+        bounds = (first, last) if separator else (first, first)
+        for year in bounds:
+            if year not in YEAR_CHOICES:
+                raise argparse.ArgumentTypeError(f"unsupported year {year!r}")
+        if int(bounds[0]) > int(bounds[1]):
+            raise argparse.ArgumentTypeError(f"empty year range {part!r}")
+        years.extend(str(year) for year in range(int(bounds[0]), int(bounds[1]) + 1))
+    return _unique(years)
+
+
+def _host_limit(value: str) -> tuple[str, int]:
+    """Parse one HOST=N per-host concurrency limit."""
+    host, separator, limit = value.partition("=")
+    if not separator or not host or not limit.isdigit() or int(limit) < 1:
+        raise argparse.ArgumentTypeError(f"expected HOST=N, got {value!r}")
+    return host.lower(), int(limit)
+
+
+def _rate_limit(value: str) -> tuple[str | None, float]:
+    """Parse one R or CONF=R requests-per-second limit."""
+    conference, separator, rate = value.rpartition("=")
+    if separator and conference not in CONFERENCE_CHOICES:
+        raise argparse.ArgumentTypeError(f"unsupported conference {conference!r}")
+    try:
+        requests_per_second = float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected R or CONF=R, got {value!r}"
+        ) from None
+    if requests_per_second < 0:
+        raise argparse.ArgumentTypeError(f"expected R or CONF=R, got {value!r}")
+    return (conference if separator else None), requests_per_second
+
+
 def args(argv: Sequence[str]) -> argparse.Namespace:
-    """Parse command-line arguments."""
-    return _build_parser().parse_args(argv)
+    """Parse command-line arguments.
+
+    Repeated ``--rate-limit`` values are split into ``rate_limit``, the last
+    global one or None, and ``conference_rate_limits``, a map of conference
+    to the last rate given for it.
+    """
+    parser = _build_parser()
+    parsed = parser.parse_args(argv)
+    rate_limits = parsed.rate_limits
+    del parsed.rate_limits
+    parsed.rate_limit = None
+    parsed.conference_rate_limits = {}
+    for conference, rate in rate_limits:
+        if conference is None:
+            parsed.rate_limit = rate
+        else:
+            parsed.conference_rate_limits[conference] = rate
+    if parsed.retry_failed and parsed.no_download_pdf:
+        parser.error("--retry-failed cannot be combined with --no-download-pdf")
+    return parsed
+
+
+def targets(parsed: argparse.Namespace) -> list[argparse.Namespace]:
+    """Split batch arguments into one namespace per conference and year.
+
+    Each namespace carries a single ``conference`` and ``year`` alongside
+    the shared options, in the order the conferences and years were given.
+    """
+    return [
+        argparse.Namespace(**vars(parsed), conference=conference, year=year)
+        for conference in parsed.conferences
+        for year in parsed.years
+    ]
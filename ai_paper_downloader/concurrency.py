@@ -0,0 +1,120 @@
+import threading
+import time
+from collections.abc import Callable
+
+ADDITIVE_INCREASE = 1.0
+MULTIPLICATIVE_DECREASE = 0.5
+LATENCY_DECREASE = 0.9
+LATENCY_TOLERANCE = 2.0
+LATENCY_SMOOTHING = 0.2
+DEFAULT_RETRY_AFTER = 5.0
+
+
+class _HostState:
+    """Concurrency level, latency baseline and pause deadline of one host."""
+
+    def __init__(self, level: float, max_level: int):
+        self.level = level
+        self.max_level = max_level
+        self.peak = int(level)
+        self.latency: float | None = None
+        self.latency_floor: float | None = None
+        self.paused_until = 0.0
+        self.throttled = 0
+
+
+class ConcurrencyController:
+    """Tune per-host download concurrency with AIMD feedback.
+
+    Each host starts at ``initial_level`` parallel downloads and is capped at
+    its entry in ``host_limits`` (or ``max_level``). When ``adaptive`` is set,
+    every healthy response adds ``ADDITIVE_INCREASE / level`` (about one slot
+    per round of successful downloads), a response slower than
+    ``LATENCY_TOLERANCE`` times the best smoothed latency seen trims the level
+    by ``LATENCY_DECREASE``, and a throttling response halves it. Throttling
+    also pauses the host until its ``Retry-After`` deadline whether or not the
+    controller is adaptive.
+    """
+
+    def __init__(
+        self,
+        max_level: int,
+        host_limits: dict[str, int] | None = None,
+        adaptive: bool = False,
+        initial_level: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_level = max(1, max_level)
+        self.host_limits = host_limits or {}
+        self.adaptive = adaptive
+        self.initial_level = initial_level
+        self._clock = clock
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            max_level = max(
+                1, min(self.max_level, self.host_limits.get(host, self.max_level))
+            )
+            level = min(self.initial_level, max_level) if self.adaptive else max_level
+            state = _HostState(float(max(1, level)), max_level)
+            self._hosts[host] = state
+        return state
+
+    def capacity(self, host: str) -> int:
+        """Return how many downloads ``host`` may have in flight right now."""
+        with self._lock:
+            return int(self._state(host).level)
+
+    def paused_until(self, host: str) -> float:
+        """Return the clock time before which ``host`` must not be contacted."""
+        with self._lock:
+            return self._state(host).paused_until
+
+    def record_success(self, host: str, latency: float | None = None) -> None:
+        """Feed one successful download and its response latency."""
+        with self._lock:
+            state = self._state(host)
+            if latency is not None:
+                state.latency = (
+                    latency
+                    if state.latency is None
+                    else state.latency + LATENCY_SMOOTHING * (latency - state.latency)
+                )
+                if state.latency_floor is None or state.latency < state.latency_floor:
+                    state.latency_floor = state.latency
+
+            if not self.adaptive:
+                return
+
+            if (
+                state.latency is not None
+                and state.latency_floor is not None
+                and state.latency > state.latency_floor * LATENCY_TOLERANCE
+            ):
+                state.level = max(1.0, state.level * LATENCY_DECREASE)
+            else:
+                state.level = min(
+                    state.max_level, state.level + ADDITIVE_INCREASE / state.level
+                )
+            state.peak = max(state.peak, int(state.level))
+
+    def record_throttle(self, host: str, retry_after: float | None = None) -> None:
+        """Back off after a 429/503 response and pause until ``retry_after``."""
+        with self._lock:
+            state = self._state(host)
+            state.throttled += 1
+            delay = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+            state.paused_until = max(state.paused_until, self._clock() + delay)
+            if self.adaptive:
+                state.level = max(1.0, state.level * MULTIPLICATIVE_DECREASE)
+
+    def summary(self) -> dict[str, tuple[int, int, int]]:
+        """Return ``host -> (current level, peak level, throttled responses)``."""
+        with self._lock:
+            return {
+                host: (int(state.level), state.peak, state.throttled)
+                for host, state in self._hosts.items()
+            }
@@ -0,0 +1,499 @@
+import email.utils
+import heapq
+import itertools
+import os
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ai_paper_downloader.concurrency import ConcurrencyController
+from ai_paper_downloader.rate_limit import HostRateLimiter
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+)
+CHUNK_SIZE = 8192
+PART_SUFFIX = ".part"
+CONTENT_RANGE_REGEX = re.compile(r"bytes\s+(\d+)-\d+/(?:\d+|\*)")
+# Default concurrent downloads per known host; --host-limit overrides them.
+HOST_CONCURRENCY = {
+    "proceedings.neurips.cc": 4,
+    "ojs.aaai.org": 2,
+    "openreview.net": 2,
+    "arxiv.org": 1,
+}
+LOOKAHEAD_PER_WORKER = 16
+RETRY_STATUS_CODES = (500, 502, 504)
+THROTTLE_STATUS_CODES = (429, 503)
+MAX_THROTTLE_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+# Seconds to wait for a connection and between two bytes of a response.
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 60.0
+REQUEUE_BASE_DELAY = 2.0
+REQUEUE_MAX_DELAY = 120.0
+TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.RetryError,
+)
+
+
+class DownloadResult(NamedTuple):
+    """Outcome of one successful ``download_pdf`` call."""
+
+    latency: float
+    num_bytes: int
+    http_status: int
+
+
+class ThrottledError(requests.exceptions.HTTPError):
+    """Raised when a host answers 429/503, carrying its ``Retry-After`` delay."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        headers = self.response.headers if self.response is not None else {}
+        self.retry_after = parse_retry_after(headers.get("Retry-After"))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Convert a ``Retry-After`` header (seconds or HTTP date) to seconds."""
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value.strip())
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_transient(error: BaseException) -> bool:
+    """Return whether a download error is worth retrying later in the run."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    response = getattr(error, "response", None)
+    return (
+        isinstance(error, requests.exceptions.HTTPError)
+        and response is not None
+        and response.status_code >= 500
+    )
+
+
+def requeue_delay(
+    attempt: int, uniform: Callable[[float, float], float] = random.uniform
+) -> float:
+    """Return the jittered exponential backoff before retry ``attempt + 1``."""
+    delay = min(REQUEUE_MAX_DELAY, REQUEUE_BASE_DELAY * 2**attempt)
+    return uniform(delay / 2, delay)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter applying a default timeout to requests that set none."""
+
+    def __init__(self, timeout: tuple[float, float], **kwargs: Any):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> Any:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(
+    pool_size: int = 10,
+    max_retries: int = 3,
+    timeout: tuple[float, float] = (CONNECT_TIMEOUT, READ_TIMEOUT),
+) -> requests.Session:
+    """Create the keep-alive session shared by every download in a run.
+
+    Connections are pooled per host (``pool_size`` sockets each) and reused
+    across workers, so DNS, TCP and TLS setup happen once per connection
+    rather than once per PDF. Connection errors and 5xx responses are retried
+    by the adapter with exponential backoff; 429/503 are left to the
+    scheduler so it can slow the host down instead. urllib3 would otherwise
+    retry them itself whenever they carry ``Retry-After``, sleeping on the
+    worker thread before the scheduler ever sees the throttle. Every request
+    gets the ``(connect, read)`` ``timeout``, so a stalled server raises
+    ``Timeout`` and the paper is requeued instead of holding its worker and
+    host slot forever.
+    """
+    retries = Retry(
+        total=max_retries,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=False,
+    )
+    adapter = _TimeoutHTTPAdapter(
+        timeout,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def connection_stats(session: requests.Session) -> tuple[int, int]:
+    """Return (connections opened, requests sent) across the session's pools."""
+    connections = 0
+    requests_sent = 0
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+    return connections, requests_sent
+
+
+def download_pdf(
+    session: requests.Session,
+    pdf_url: str,
+    pdf_file_path: str,
+    rate_limiter: HostRateLimiter | None = None,
+    admitted: bool = False,
+) -> DownloadResult:
+    """Stream one PDF to disk, raising ``RequestException`` on failure.
+
+    Bytes are written to ``<pdf_file_path>.part`` and only renamed to the
+    final path once the body is complete, so an interrupted download never
+    looks finished. If a ``.part`` file is already present, the download is
+    resumed with a ``Range`` request; servers that ignore the range, or
+    answer with a range starting elsewhere, restart the file from scratch.
+    Every request first waits on ``rate_limiter``, except the first one when
+    ``admitted`` says the scheduler already took its token.
+    A 429/503 response raises ``ThrottledError``. Returns the time the
+    server took to send response headers, the bytes received and the final
+    HTTP status.
+    """
+    part_file_path = f"{pdf_file_path}{PART_SUFFIX}"
+    offset = os.path.getsize(part_file_path) if os.path.exists(part_file_path) else 0
+
+    headers = {"User-Agent": USER_AGENT}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+
+    if rate_limiter is not None and not admitted:
+        rate_limiter.acquire(pdf_url)
+    response = session.get(pdf_url, headers=headers, stream=True)
+    try:
+        if offset and (
+            response.status_code == 416
+            or (response.status_code == 206 and not _resumes_at(response, offset))
+        ):
+            # The partial file no longer matches the remote, or the server
+            # sent a different range than requested; start over.
+            response.close()
+            os.remove(part_file_path)
+            offset = 0
+            del headers["Range"]
+            if rate_limiter is not None:
+                rate_limiter.acquire(pdf_url)
+            response = session.get(pdf_url, headers=headers, stream=True)
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            raise ThrottledError(
+                f"{response.status_code} Throttled for url: {pdf_url}",
+                response=response,
+            )
+        response.raise_for_status()
+        if response.status_code == 206 and not _resumes_at(response, offset):
+            raise requests.exceptions.HTTPError(
+                f"Unexpected partial content for url: {pdf_url}", response=response
+            )
+        latency = response.elapsed.total_seconds()
+
+        resumed = offset > 0 and _resumes_at(response, offset)
+        num_bytes = 0
+        with open(part_file_path, "ab" if resumed else "wb") as pdf_file:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                pdf_file.write(chunk)
+                num_bytes += len(chunk)
+    finally:
+        response.close()
+
+    os.replace(part_file_path, pdf_file_path)
+    return DownloadResult(latency, num_bytes, response.status_code)
+
+
+def existing_files(directory: str, min_size: int = 0) -> set[str]:
+    """List regular files in ``directory`` once, as a set of names.
+
+    Replaces a per-paper ``os.path.exists`` call, which costs a metadata
+    round trip each on network filesystems. With ``min_size`` files smaller
+    than that many bytes (e.g. empty or truncated PDFs) are left out, which
+    needs a ``stat`` per entry.
+    """
+    names: set[str] = set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if min_size and entry.stat().st_size < min_size:
+                continue
+            names.add(entry.name)
+    return names
+
+
+def _resumes_at(response: requests.Response, offset: int) -> bool:
+    """Return whether a response is a partial body starting at ``offset``."""
+    if response.status_code != 206:
+        return False
+    match = CONTENT_RANGE_REGEX.match(response.headers.get("Content-Range", ""))
+    return match is not None and int(match.group(1)) == offset
+
+
+class _HostScheduler:
+    """Per-host job queues of the download loop.
+
+    Jobs are pulled lazily from ``jobs`` (with a bounded lookahead), grouped
+    by ``host_of(job)`` and started round-robin across hosts, so a slow host
+    only holds its own slots while other hosts keep downloading. How many
+    downloads a host may run at once, and when it may be contacted again
+    after throttling, come from the ``ConcurrencyController``. A host is also
+    skipped while ``admit`` reports that its next job has no rate-limit token
+    yet, so workers never sleep on a token while holding a slot. Throttled
+    jobs go back to the front of their host queue instead of failing, and
+    jobs that hit a transient error are retried up to ``retries`` times
+    after an exponential, jittered delay.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[Any],
+        host_of: Callable[[Any], str],
+        on_result: Callable[[Any, Exception | None], bool],
+        workers: int,
+        limit: int,
+        controller: ConcurrencyController,
+        retries: int = 0,
+        on_retry: Callable[[Any, Exception, float], None] | None = None,
+        admit: Callable[[Any], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.workers = max(1, workers)
+        self.limit = limit
+        self.controller = controller
+        self.running = 0
+        self.count = 0
+        self._jobs: Iterator[Any] = iter(jobs)
+        self._host_of = host_of
+        self._on_result = on_result
+        self._admit = admit
+        self._clock = clock
+        self._lookahead = self.workers * LOOKAHEAD_PER_WORKER
+        self._queues: dict[str, deque[tuple[Any, int]]] = {}
+        self._in_flight: dict[str, int] = {}
+        self._buffered = 0
+        self._exhausted = False
+        self._retries = retries
+        self._on_retry = on_retry
+        self._deferred: list[tuple[float, int, str, Any, int]] = []
+        self._sequence = itertools.count()
+        self._token_at: dict[str, float] = {}
+
+    def _fill(self) -> None:
+        while not self._exhausted and self._buffered < self._lookahead:
+            job = next(self._jobs, None)
+            if job is None:
+                self._exhausted = True
+                break
+            self._queues.setdefault(self._host_of(job), deque()).append((job, 0))
+            self._buffered += 1
+
+    def _ready_at(self, host: str) -> float:
+        """Return when ``host`` may next be contacted, as a clock time."""
+        return max(self.controller.paused_until(host), self._token_at.get(host, 0.0))
+
+    def _limit_reached(self) -> bool:
+        return self.limit != -1 and self.count + self.running >= self.limit
+
+    def finished(self) -> bool:
+        """Return whether every job has been started and settled."""
+        if self.running:
+            return False
+        if self._limit_reached():
+            return True
+        return self._exhausted and not self._queues and not self._deferred
+
+    def start_ready(self) -> list[tuple[str, Any, int]]:
+        """Claim every job that may start now as (host, job, attempt)."""
+        now = self._clock()
+        while self._deferred and self._deferred[0][0] <= now:
+            _, _, host, job, attempt = heapq.heappop(self._deferred)
+            self._queues.setdefault(host, deque()).appendleft((job, attempt))
+            self._buffered += 1
+
+        started: list[tuple[str, Any, int]] = []
+        progress = True
+        while progress:
+            progress = False
+            self._fill()
+            for host in list(self._queues):
+                if self.running >= self.workers or self._limit_reached():
+                    return started
+                if self._in_flight.get(host, 0) >= self.controller.capacity(host):
+                    continue
+                if self._ready_at(host) > now:
+                    continue
+                if self._admit is not None:
+                    # Take the rate-limit token here rather than on a worker.
+                    delay = self._admit(self._queues[host][0][0])
+                    if delay > 0:
+                        self._token_at[host] = now + delay
+                        continue
+
+                # Move the host to the back so the next slot goes elsewhere.
+                host_queue = self._queues.pop(host)
+                job, attempt = host_queue.popleft()
+                if host_queue:
+                    self._queues[host] = host_queue
+
+                self._buffered -= 1
+                self._in_flight[host] = self._in_flight.get(host, 0) + 1
+                self.running += 1
+                started.append((host, job, attempt))
+                progress = True
+        return started
+
+    def wakeup_delay(self) -> float | None:
+        """Return seconds until a waiting host or deferred retry is ready."""
+        now = self._clock()
+        delays = [
+            self._ready_at(host) - now
+            for host in self._queues
+            if self._ready_at(host) > now
+        ]
+        if self._deferred:
+            delays.append(max(0.0, self._deferred[0][0] - now))
+        return min(delays) if delays else None
+
+    def finish(
+        self,
+        host: str,
+        job: Any,
+        attempt: int,
+        latency: float | None,
+        error: BaseException | None,
+    ) -> None:
+        """Settle one started job and report it unless it was requeued."""
+        self._in_flight[host] -= 1
+        self.running -= 1
+
+        if error is not None and not isinstance(
+            error, requests.exceptions.RequestException
+        ):
+            raise error
+
+        if isinstance(error, ThrottledError):
+            self.controller.record_throttle(host, error.retry_after)
+            if attempt < MAX_THROTTLE_RETRIES:
+                self._queues.setdefault(host, deque()).appendleft((job, attempt + 1))
+                self._buffered += 1
+                if self._on_retry is not None:
+                    delay = self.controller.paused_until(host) - self._clock()
+                    self._on_retry(job, error, max(0.0, delay))
+                return
+        elif error is not None and is_transient(error) and attempt < self._retries:
+            delay = requeue_delay(attempt)
+            heapq.heappush(
+                self._deferred,
+                (self._clock() + delay, next(self._sequence), host, job, attempt + 1),
+            )
+            if self._on_retry is not None:
+                self._on_retry(job, error, delay)
+            return
+        elif error is None:
+            self.controller.record_success(host, latency)
+
+        if self._on_result(job, error):
+            self.count += 1
+
+
+def run_downloads(
+    jobs: Iterable[Any],
+    download: Callable[[Any], float | None],
+    on_result: Callable[[Any, Exception | None], bool],
+    workers: int = 1,
+    limit: int = -1,
+    host_of: Callable[[Any], str] | None = None,
+    controller: ConcurrencyController | None = None,
+    retries: int = 0,
+    on_retry: Callable[[Any, Exception, float], None] | None = None,
+    admit: Callable[[Any], float] | None = None,
+) -> int:
+    """Download jobs on a bounded thread pool and return the success count.
+
+    ``download`` runs on worker threads and may return the response latency
+    for ``controller``. ``on_result`` runs on the calling thread only, so it
+    is the single writer for CSV rows and failure logs; it receives the job
+    and the raised ``RequestException`` (or ``None``) and returns whether the
+    job counts toward ``limit``. No more than ``limit`` jobs are ever in
+    flight beyond those already counted, so the limit is exact even with
+    several workers. Without ``host_of`` every job shares one host.
+    Transient failures are requeued up to ``retries`` times and throttled
+    jobs until they are throttled ``MAX_THROTTLE_RETRIES`` times; each
+    requeue is reported to ``on_retry`` with its delay instead of to
+    ``on_result``.
+    ``admit`` takes a job's rate-limit token before it starts and returns 0,
+    or returns the seconds until the token is free; until then its host is
+    skipped, so ``download`` should not wait on the token again.
+    """
+    scheduler = _HostScheduler(
+        jobs,
+        host_of or (lambda _job: ""),
+        on_result,
+        workers,
+        limit,
+        controller or ConcurrencyController(workers),
+        retries,
+        on_retry,
+        admit,
+    )
+    pending: dict[Future[float | None], tuple[str, Any, int]] = {}
+
+    with ThreadPoolExecutor(max_workers=scheduler.workers) as executor:
+        while not scheduler.finished():
+            for host, job, attempt in scheduler.start_ready():
+                pending[executor.submit(download, job)] = (host, job, attempt)
+
+            if not pending:
+                time.sleep(scheduler.wakeup_delay() or 0)
+                continue
+
+            done, _ = wait(
+                pending, timeout=scheduler.wakeup_delay(), return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                host, job, attempt = pending.pop(future)
+                error = future.exception()
+                latency = None if error is not None else future.result()
+                scheduler.finish(host, job, attempt, latency, error)
+
+    return scheduler.count
@@ -0,0 +1,83 @@
+import json
+import os
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import TextIO
+
+from ai_paper_downloader.paper import Paper, intern_category
+
+FAILED_LOG_NAME = "failed_downloads.log"
+FAILED_RECORDS_NAME = "failed_downloads.jsonl"
+PAPER_FIELDS = Paper._fields
+
+
+def append_failure(
+    failed_log: TextIO, failed_records: TextIO, paper: Paper, error: Exception
+) -> None:
+    """Append one failure to the text log and the structured JSON-lines log."""
+    failed_log.write(f"{paper.title} | {paper.pdf_url} | {error}\n")
+    failed_log.flush()
+
+    record: dict[str, str | None] = paper._asdict()
+    record["error"] = str(error)
+    record["failed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    failed_records.write(json.dumps(record, ensure_ascii=False) + "\n")
+    failed_records.flush()
+
+
+def _read_records(records_path: str) -> dict[str, dict[str, str]]:
+    """Read failure records keyed by PDF URL, keeping the latest of each."""
+    records: dict[str, dict[str, str]] = {}
+    if not os.path.exists(records_path):
+        return records
+
+    with open(records_path, "r", encoding="utf-8") as records_file:
+        for line in records_file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write can leave a truncated last line.
+                continue
+            records.pop(record["pdf_url"], None)
+            records[record["pdf_url"]] = record
+    return records
+
+
+def load_failures(records_path: str) -> list[Paper]:
+    """Load the papers recorded as failed, one per PDF URL, oldest first."""
+    return [
+        Paper(
+            record["title"],
+            record["authors"],
+            intern_category(record["category"]),
+            record["pdf_url"],
+        )
+        for record in _read_records(records_path).values()
+    ]
+
+
+def compact_failures(
+    records_path: str, is_resolved: Callable[[dict[str, str]], bool]
+) -> int:
+    """Rewrite the records without duplicates or resolved papers.
+
+    Returns the number of papers still recorded as failed.
+    """
+    if not os.path.exists(records_path):
+        return 0
+
+    remaining = [
+        record
+        for record in _read_records(records_path).values()
+        if not is_resolved(record)
+    ]
+
+    temp_path = f"{records_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as records_file:
+        for record in remaining:
+            records_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    os.replace(temp_path, records_path)
+    return len(remaining)
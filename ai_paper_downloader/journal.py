@@ -0,0 +1,193 @@
+import itertools
+import sqlite3
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from ai_paper_downloader import generate_safe_filename
+from ai_paper_downloader.paper import Paper
+
+JOURNAL_NAME = "download_journal.sqlite3"
+# Longer than the filename hash so ids stay unique across a full catalog.
+PAPER_ID_LENGTH = 16
+BATCH_SIZE = 200
+
+STATUS_PARSED = "parsed"
+STATUS_DOWNLOADED = "downloaded"
+STATUS_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT PRIMARY KEY,
+    conference TEXT NOT NULL,
+    year TEXT NOT NULL,
+    title TEXT NOT NULL,
+    authors TEXT,
+    category TEXT,
+    pdf_url TEXT,
+    filename TEXT,
+    status TEXT NOT NULL,
+    csv_recorded INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER,
+    http_status INTEGER,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    parsed_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+DROP INDEX IF EXISTS papers_by_run;
+CREATE INDEX IF NOT EXISTS papers_by_csv_row ON papers (conference, year, csv_recorded);
+"""
+
+UPSERT_PARSED = """
+INSERT INTO papers (
+    paper_id, conference, year, title, authors, category, pdf_url, filename,
+    status, parsed_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (paper_id) DO UPDATE SET
+    authors = excluded.authors,
+    category = excluded.category,
+    pdf_url = excluded.pdf_url,
+    filename = excluded.filename,
+    updated_at = excluded.updated_at
+"""
+UPDATE_DOWNLOADED = """
+UPDATE papers SET status = ?, bytes = ?, http_status = ?, error = NULL,
+    attempts = attempts + 1, updated_at = ?
+WHERE paper_id = ?
+"""
+UPDATE_FAILED = """
+UPDATE papers SET status = ?, http_status = ?, error = ?,
+    attempts = attempts + 1, updated_at = ?
+WHERE paper_id = ?
+"""
+UPDATE_CSV_RECORDED = """
+UPDATE papers SET csv_recorded = 1, updated_at = ? WHERE paper_id = ?
+"""
+RESET_CSV_RECORDED = """
+UPDATE papers SET csv_recorded = 0, updated_at = ?
+WHERE conference = ? AND year = ? AND csv_recorded = 1
+"""
+
+
+def paper_id(conference: str, year: str, title: str) -> str:
+    """Return the journal key of a paper."""
+    return generate_safe_filename.generate_deterministic_hash(
+        conference, year, title, hash_len=PAPER_ID_LENGTH
+    )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class DownloadJournal:
+    """SQLite record of parse results, downloads and CSV rows per save dir.
+
+    Writes are buffered and committed in batches of ``batch_size`` in one
+    transaction, so journaling a 100k-paper catalog costs a few hundred
+    commits rather than one per paper. Call ``flush`` (or ``close``) to
+    commit whatever is still buffered. Callbacks registered with
+    ``on_commit`` run after each commit, so output that must never get ahead
+    of the journal (the CSV rows) can be written right behind it.
+    """
+
+    def __init__(self, journal_path: str, batch_size: int = BATCH_SIZE):
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(journal_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._pending: list[tuple[str, tuple[Any, ...]]] = []
+        self._commit_callbacks: list[Callable[[], None]] = []
+
+    def __enter__(self) -> "DownloadJournal":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def _queue(self, statement: str, params: tuple[Any, ...]) -> None:
+        self._pending.append((statement, params))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all buffered writes in a single transaction."""
+        if not self._pending:
+            return
+        with self._connection:
+            # Keep write order, but batch consecutive runs of one statement.
+            for statement, group in itertools.groupby(
+                self._pending, key=lambda item: item[0]
+            ):
+                self._connection.executemany(statement, [params for _, params in group])
+        self._pending = []
+        for callback in self._commit_callbacks:
+            callback()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` after every commit of buffered writes."""
+        self._commit_callbacks.append(callback)
+
+    def close(self) -> None:
+        """Flush buffered writes and close the database."""
+        self.flush()
+        self._connection.close()
+
+    def record_parsed(
+        self,
+        conference: str,
+        year: str,
+        papers: Iterable[tuple[str, Paper, str]],
+    ) -> None:
+        """Insert or refresh parsed papers given as (paper_id, paper, filename)."""
+        now = _now()
+        for pid, paper, filename in papers:
+            self._queue(
+                UPSERT_PARSED,
+                (
+                    pid,
+                    conference,
+                    year,
+                    paper.title,
+                    paper.authors,
+                    paper.category,
+                    paper.pdf_url,
+                    filename,
+                    STATUS_PARSED,
+                    now,
+                    now,
+                ),
+            )
+
+    def mark_downloaded(
+        self, pid: str, num_bytes: int, http_status: int | None
+    ) -> None:
+        """Record a completed download."""
+        self._queue(
+            UPDATE_DOWNLOADED, (STATUS_DOWNLOADED, num_bytes, http_status, _now(), pid)
+        )
+
+    def mark_failed(self, pid: str, error: str, http_status: int | None) -> None:
+        """Record a failed download attempt."""
+        self._queue(UPDATE_FAILED, (STATUS_FAILED, http_status, error, _now(), pid))
+
+    def mark_csv_recorded(self, pid: str) -> None:
+        """Record that the paper's CSV row has been written."""
+        self._queue(UPDATE_CSV_RECORDED, (_now(), pid))
+
+    def reset_csv_recorded(self, conference: str, year: str) -> None:
+        """Forget the CSV rows of one conference/year, e.g. for a new CSV."""
+        self._queue(RESET_CSV_RECORDED, (_now(), conference, year))
+
+    def csv_recorded_ids(self, conference: str, year: str) -> set[str]:
+        """Return ids of papers of one conference/year already in the CSV."""
+        self.flush()
+        rows = self._connection.execute(
+            "SELECT paper_id FROM papers "
+            "WHERE conference = ? AND year = ? AND csv_recorded = 1",
+            (conference, year),
+        )
+        return {row[0] for row in rows}
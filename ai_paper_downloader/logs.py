@@ -0,0 +1,166 @@
+import contextlib
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from typing import Any, TextIO
+
+LOGGER_NAME = "ai_paper_downloader"
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+LOG_FORMATS = ("text", "json")
+# Default minimum seconds between two progress lines.
+PROGRESS_INTERVAL = 1.0
+CLEAR_LINE = "\r\x1b[K"
+
+
+def progress(**fields: Any) -> dict[str, Any]:
+    """Return ``extra`` marking a record as a rate-limited progress line.
+
+    ``fields`` are included as keys of the JSON-lines output.
+    """
+    return {"progress": True, "fields": fields}
+
+
+def fields(**values: Any) -> dict[str, Any]:
+    """Return ``extra`` adding structured ``values`` to a JSON-lines record."""
+    return {"fields": values}
+
+
+def status(**fields: Any) -> dict[str, Any]:
+    """Return ``extra`` marking a record as the live status line.
+
+    On a terminal the record replaces the previous status line instead of
+    adding a new one; elsewhere it is logged like any other record.
+    """
+    return {"status": True, "fields": fields}
+
+
+def live_status(log_format: str, stream: TextIO | None = None) -> bool:
+    """Return whether status records are drawn as one live terminal line."""
+    stream = stream or sys.stdout
+    return log_format == "text" and hasattr(stream, "isatty") and stream.isatty()
+
+
+class ProgressFilter(logging.Filter):
+    """Let at most one progress record through per ``interval`` seconds.
+
+    Records not marked with ``progress()`` always pass, so skips, failures
+    and summaries are never dropped. An interval of 0 passes everything.
+    """
+
+    def __init__(
+        self, interval: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        super().__init__()
+        self.interval = interval
+        self._clock = clock
+        self._last: float | None = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "progress", False) or self.interval <= 0:
+            return True
+        now = self._clock()
+        if self._last is not None and now - self._last < self.interval:
+            return False
+        self._last = now
+        return True
+
+
+class StatusStreamHandler(logging.StreamHandler):
+    """Stream handler keeping the latest status record as the bottom line.
+
+    With ``live`` set, status records overwrite the line below the log and
+    every other record is written above it, so the status never scrolls.
+    An empty status record erases the line and is otherwise dropped.
+    """
+
+    def __init__(self, stream: TextIO, live: bool = False):
+        super().__init__(stream)
+        self.live = live
+        self._status = ""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if getattr(record, "status", False) and not record.getMessage():
+            self.clear_status()
+            return
+        if not self.live:
+            super().emit(record)
+            return
+        try:
+            message = self.format(record)
+            if getattr(record, "status", False):
+                self._status = message
+                self.stream.write(f"{CLEAR_LINE}{message}")
+            else:
+                self.stream.write(f"{CLEAR_LINE}{message}\n{self._status}")
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def clear_status(self) -> None:
+        """Erase the status line, leaving the cursor at the line start."""
+        if self.live and self._status:
+            self.stream.write(CLEAR_LINE)
+            self.flush()
+        self._status = ""
+
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+@contextlib.contextmanager
+def configure(
+    level: str = "INFO",
+    log_format: str = "text",
+    progress_interval: float = PROGRESS_INTERVAL,
+    stream: TextIO | None = None,
+) -> Iterator[logging.Logger]:
+    """Route the package's log records through a queue for the block.
+
+    Callers only enqueue records; a listener thread formats and writes
+    them, so slow terminals never stall the download loop. Text output is
+    the bare message, as the CLI printed before; on a terminal, status
+    records form a live bottom line. Leaving the block flushes every queued
+    record, erases the status line and restores the previous handlers.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream = stream or sys.stdout
+    output = StatusStreamHandler(stream, live_status(log_format, stream))
+    output.setFormatter(
+        JsonFormatter() if log_format == "json" else logging.Formatter("%(message)s")
+    )
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(records)
+    queue_handler.addFilter(ProgressFilter(progress_interval))
+    listener = logging.handlers.QueueListener(records, output)
+
+    saved = (logger.handlers[:], logger.level, logger.propagate)
+    logger.handlers = [queue_handler]
+    logger.setLevel(level)
+    logger.propagate = False
+    listener.start()
+    try:
+        yield logger
+    finally:
+        listener.stop()
+        output.clear_status()
+        output.flush()
+        logger.handlers, level_before, logger.propagate = saved
+        logger.setLevel(level_before)
@@ -1,24 +1,42 @@
+import contextlib
 import csv
+import itertools
+import logging
 import os
 import sys
-import time
 from argparse import Namespace
+from collections.abc import Iterable, Iterator
 from typing import Any, TextIO
 
 import requests
 
 from ai_paper_downloader import command_args
+from ai_paper_downloader import concurrency
+from ai_paper_downloader import downloader
+from ai_paper_downloader import failed_downloads
 from ai_paper_downloader import generate_safe_filename
-from ai_paper_downloader.parser.aaai import AAAIParser
-from ai_paper_downloader.parser.dmlr import DMLRParser
-from ai_paper_downloader.parser.iclr import ICLRParser
-from ai_paper_downloader.parser.icml import ICMLParser
-from ai_paper_downloader.parser.ijcai import IJCAIParser
-from ai_paper_downloader.parser.jair import JAIRParser
-from ai_paper_downloader.parser.jmlr import JMLRParser
-from ai_paper_downloader.parser.neurips import NeurIPSParser
-from ai_paper_downloader.parser.tmlr import TMLRParser
-
+from ai_paper_downloader import journal
+from ai_paper_downloader import logs
+from ai_paper_downloader import openreview_cache
+from ai_paper_downloader import parse_cache
+from ai_paper_downloader import pipeline
+from ai_paper_downloader import progress
+from ai_paper_downloader import rate_limit
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser import registry
+from ai_paper_downloader.parser import soup
+
+logger = logging.getLogger(__name__)
+
+# Errors that make one conference/year unparseable, e.g. a year without
+# bundled HTML or without recorded notes in --openreview-cache replay. The
+# target is skipped and the rest of the batch goes on.
+TARGET_ERRORS = (
+    ValueError,
+    FileNotFoundError,
+    KeyError,
+    openreview_cache.OpenReviewCacheMiss,
+)
 CSV_FIELDS = [
     "Conference",
     "Year",
@@ -28,19 +46,23 @@ CSV_FIELDS = [
     "Category",
     "PDF_URL",
 ]
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-    "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-)
 
 
-def _print_run_banner(args: Namespace) -> None:
-    """Print a consistent run banner for CLI output."""
-    print("========================================================================")
-    print(
-        f"Conference: {args.conference} Year: {args.year} Save Directory: {args.save_dir}"
+def _log_run_banner(args: Namespace) -> None:
+    """Log a consistent run banner for CLI output."""
+    logger.info(
+        "========================================================================"
+    )
+    logger.info(
+        "Conference: %s Year: %s Save Directory: %s",
+        args.conference,
+        args.year,
+        args.save_dir,
+        extra=logs.fields(conference=args.conference, year=args.year),
+    )
+    logger.info(
+        "========================================================================"
     )
-    print("========================================================================")
 
 
 def _build_output_paths(args: Namespace) -> tuple[str, str]:
@@ -50,153 +72,649 @@ def _build_output_paths(args: Namespace) -> tuple[str, str]:
     return download_path, csv_file_path
 
 
-def _create_parser(conference: str, year: str) -> Any:
-    """Create the conference-specific parser instance for the requested year."""
-    if conference == "AAAI":
-        return AAAIParser(f"static_html/{conference}", year)
-    if conference == "DMLR":
-        return DMLRParser(f"static_html/{conference}", year)
-    if conference == "JAIR":
-        return JAIRParser(f"static_html/{conference}", year)
-    if conference == "TMLR":
-        return TMLRParser(f"static_html/{conference}", year)
-
-    html_file_path = f"static_html/{conference}/{year}.html"
-    parser_map = {
-        "ICLR": ICLRParser,
-        "ICML": ICMLParser,
-        "IJCAI": IJCAIParser,
-        "JMLR": JMLRParser,
-        "NeurIPS": NeurIPSParser,
-    }
-    return parser_map[conference](html_file_path, year)
+def _create_controller(args: Namespace) -> concurrency.ConcurrencyController:
+    """Create the per-host concurrency controller.
 
+    Known publisher hosts start from ``downloader.HOST_CONCURRENCY``;
+    ``--host-limit`` overrides them and adds limits for other hosts.
+    """
+    host_limits = {**downloader.HOST_CONCURRENCY, **dict(args.host_limits)}
+    return concurrency.ConcurrencyController(
+        int(args.workers), host_limits, adaptive=args.adaptive_concurrency
+    )
+
+
+def _is_downloaded(args: Namespace, existing: set[str], title: str) -> bool:
+    """Return whether the PDF for a paper title is in the existing-file set."""
+    safe_filename = generate_safe_filename.generate_safe_filename(
+        args.conference, args.year, title
+    )
+    return safe_filename in existing
+
+
+class _DownloadJob:
+    """One paper queued for download, plus its result once it completes."""
+
+    __slots__ = ("run", "paper", "safe_filename", "pdf_file_path", "result")
+
+    def __init__(
+        self,
+        run: "_TargetRun",
+        paper: Paper,
+        safe_filename: str,
+        pdf_file_path: str,
+    ):
+        self.run = run
+        self.paper = paper
+        self.safe_filename = safe_filename
+        self.pdf_file_path = pdf_file_path
+        self.result: downloader.DownloadResult | None = None
+
+
+class _ParsedPapers:
+    """Single pass over the parsed papers that journals and counts them.
+
+    Papers are journaled as the download loop reaches them, so the parser,
+    the journal and the downloads all advance together. A parse error in
+    ``TARGET_ERRORS`` ends the pass early and is kept in ``error`` instead
+    of aborting the whole batch.
+    """
+
+    def __init__(
+        self,
+        args: Namespace,
+        papers: Iterable[Paper],
+        download_journal: journal.DownloadJournal,
+    ):
+        self.args = args
+        self.papers = papers
+        self.journal = download_journal
+        self.count = 0
+        self.exhausted = False
+        self.error: Exception | None = None
+
+    def __iter__(self) -> Iterator[Paper]:
+        papers = iter(self.papers)
+        while True:
+            try:
+                paper = next(papers)
+            except StopIteration:
+                break
+            except TARGET_ERRORS as error:
+                logger.warning(
+                    "Stopped parsing %s %s: %s",
+                    self.args.conference,
+                    self.args.year,
+                    error,
+                )
+                self.error = error
+                return
+            self.count += 1
+            self.journal.record_parsed(
+                self.args.conference,
+                self.args.year,
+                [
+                    (
+                        journal.paper_id(
+                            self.args.conference, self.args.year, paper.title
+                        ),
+                        paper,
+                        generate_safe_filename.generate_safe_filename(
+                            self.args.conference, self.args.year, paper.title
+                        ),
+                    )
+                ],
+            )
+            yield paper
+        self.exhausted = True
+
+    def close(self) -> None:
+        """Stop the parser if the run ended before it finished."""
+        close = getattr(self.papers, "close", None)
+        if close is not None:
+            close()
 
-def _download_and_record(
-    args: Namespace,
-    paper: dict[str, str],
-    safe_filename: str,
-    pdf_file_path: str,
-    count: int,
-    num_papers_to_download: str | int,
-    csv_writer: Any,
-    csv_file: TextIO,
-    failed_log: TextIO,
-) -> bool:
-    """Download a PDF and append one CSV row, returning success status."""
-    if os.path.exists(pdf_file_path):
-        print(f"Skipping (already exists): {pdf_file_path}")
-        return False
 
+def _resumed(first: Paper | None, rest: Iterable[Paper]) -> Iterator[Paper]:
+    """Yield ``first`` (unless None) and then ``rest``, closing ``rest`` after."""
     try:
-        headers = {"User-Agent": USER_AGENT}
-        response = requests.get(paper["pdf_url"], headers=headers, stream=True)
-        response.raise_for_status()
+        if first is not None:
+            yield first
+        yield from rest
+    finally:
+        close = getattr(rest, "close", None)
+        if close is not None:
+            close()
+
+
+def _pending_downloads(run: "_TargetRun") -> Iterator[_DownloadJob]:
+    """Yield download jobs for papers whose PDF is not on disk yet."""
+    for paper in run.parsed:
+        safe_filename = generate_safe_filename.generate_safe_filename(
+            run.args.conference, run.args.year, paper.title
+        )
+        pdf_file_path = f"{run.download_path}/{safe_filename}"
+
+        if safe_filename in run.existing:
+            logger.debug("Skipping (already exists): %s", pdf_file_path)
+            run.already_downloaded += 1
+            continue
+
+        yield _DownloadJob(run, paper, safe_filename, pdf_file_path)
+
+
+class _RunRecorder:
+    """Single writer for CSV rows, failure logs and the download journal.
+
+    CSV rows are written at most once per paper: papers the journal already
+    marks as recorded for this conference and year are skipped, so reruns
+    (with or without ``--no-download-pdf``) never duplicate rows. The marks
+    are cleared when the CSV is created anew, so a deleted CSV is rebuilt. Rows are
+    held back until the journal commits their marks and written right after,
+    so a crash can never leave a row in the CSV that the journal does not
+    know about.
+    """
+
+    def __init__(
+        self,
+        args: Namespace,
+        csv_writer: Any,
+        csv_file: TextIO,
+        failed_log: TextIO,
+        failed_records: TextIO,
+        download_journal: journal.DownloadJournal,
+    ):
+        self.args = args
+        self.csv_writer = csv_writer
+        self.csv_file = csv_file
+        self.failed_log = failed_log
+        self.failed_records = failed_records
+        self.journal = download_journal
+        self.csv_recorded = download_journal.csv_recorded_ids(
+            args.conference, args.year
+        )
+        self._pending_rows: list[list[str]] = []
+        download_journal.on_commit(self.write_pending_rows)
+
+    def paper_id(self, paper: Paper) -> str:
+        """Return the journal key of a paper in this run."""
+        return journal.paper_id(self.args.conference, self.args.year, paper.title)
+
+    def record_row(self, paper: Paper, safe_filename: str) -> bool:
+        """Write the paper's CSV row unless it is already in the CSV."""
+        pid = self.paper_id(paper)
+        if pid in self.csv_recorded:
+            return False
+        self._pending_rows.append(_csv_row(self.args, paper, safe_filename))
+        self.csv_recorded.add(pid)
+        self.journal.mark_csv_recorded(pid)
+        return True
+
+    def write_pending_rows(self) -> None:
+        """Write the CSV rows whose journal marks have been committed."""
+        if not self._pending_rows:
+            return
+        self.csv_writer.writerows(self._pending_rows)
+        self.csv_file.flush()
+        self._pending_rows = []
+
+    def record_download(self, job: _DownloadJob) -> None:
+        """Journal a completed download and write its CSV row."""
+        http_status = job.result.http_status if job.result is not None else None
+        self.journal.mark_downloaded(
+            self.paper_id(job.paper), os.path.getsize(job.pdf_file_path), http_status
+        )
+        self.record_row(job.paper, job.safe_filename)
+
+    def record_failure(self, paper: Paper, error: Exception) -> None:
+        """Log and journal a download that failed for good."""
+        failed_downloads.append_failure(
+            self.failed_log, self.failed_records, paper, error
+        )
+        response = getattr(error, "response", None)
+        self.journal.mark_failed(
+            self.paper_id(paper),
+            str(error),
+            response.status_code if response is not None else None,
+        )
+
 
-        with open(pdf_file_path, "wb") as pdf_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                pdf_file.write(chunk)
+class _TargetRun:
+    """Paper source, output files and results of one conference and year.
 
-        print(
-            f"[{count + 1}/{num_papers_to_download}] Downloaded: {paper['title']} -> {pdf_file_path}"
+    A batch schedules the downloads of all its targets together, so every
+    job keeps a reference to its target to record results in the right
+    CSV, failure log and download directory.
+    """
+
+    def __init__(self, args: Namespace):
+        self.args = args
+        self.download_path, self.csv_file_path = _build_output_paths(args)
+        self.existing: set[str] = set()
+        self.failed_log_path = os.path.join(
+            self.download_path, failed_downloads.FAILED_LOG_NAME
+        )
+        self.failed_records_path = os.path.join(
+            self.download_path, failed_downloads.FAILED_RECORDS_NAME
         )
+        self.total_papers: int | None = None
+        self.listed_papers: int | None = None
+        self.already_downloaded = 0
+        self.parsed: _ParsedPapers | None = None
+        self.skipped: Exception | None = None
+        self.count = 0
+        self.remaining_failures: int | None = None
+        self.rate_limiter: rate_limit.HostRateLimiter | None = None
+
+    def _papers(self, html_backend: str | None) -> Iterable[Paper]:
+        """Return the recorded failures or the parsed papers of this target."""
+        if self.args.retry_failed:
+            failures = failed_downloads.load_failures(self.failed_records_path)
+            self.total_papers = len(failures)
+            logger.info("Total papers found: %d", self.total_papers)
+            return failures
+
+        notes_cache = None
+        if self.args.openreview_cache != "off":
+            notes_cache = openreview_cache.OpenReviewCache(
+                os.path.join(
+                    self.args.save_dir, openreview_cache.OPENREVIEW_CACHE_DIR_NAME
+                ),
+                self.args.openreview_cache,
+            )
 
-        _record_csv_row(args, paper, safe_filename, csv_writer, csv_file)
+        # Downloads start as soon as the parser yields its first papers.
+        parser = registry.create_parser(
+            self.args.conference,
+            self.args.year,
+            int(self.args.parse_workers),
+            html_backend,
+            notes_cache,
+        )
+        if self.args.no_parse_cache:
+            parsed_papers = parser.iter_papers()
+        else:
+            cache = parse_cache.ParseCache(
+                os.path.join(self.args.save_dir, parse_cache.PARSE_CACHE_DIR_NAME)
+            )
+            parsed_papers = cache.iter_papers(parser, self._set_listed_papers)
+        return pipeline.prefetch(parsed_papers)
+
+    def _set_listed_papers(self, count: int) -> None:
+        self.listed_papers = count
+
+    def expected_downloads(self) -> int | None:
+        """Return how many PDFs this target should download, None if unknown.
+
+        The paper count is known up front from the failure records or a
+        parse cache hit, and otherwise once the parse has finished. PDFs
+        skipped as already on disk are left out.
+        """
+        papers = self.total_papers
+        if papers is None and self.parsed is not None:
+            papers = self.parsed.count if self.parsed.exhausted else self.listed_papers
+        return None if papers is None else max(0, papers - self.already_downloaded)
+
+    def start(
+        self,
+        stack: contextlib.ExitStack,
+        download_journal: journal.DownloadJournal,
+        html_backend: str | None,
+    ) -> bool:
+        """Start the paper source and open the output files on ``stack``.
+
+        The first paper is parsed before any output file or directory is
+        created, so a target that cannot be parsed is skipped (returning
+        False) without leaving an empty CSV behind.
+        """
+        _log_run_banner(self.args)
+        try:
+            rest = iter(self._papers(html_backend))
+            papers = _resumed(next(rest, None), rest)
+        except TARGET_ERRORS as error:
+            logger.warning(
+                "Skipping %s %s: %s", self.args.conference, self.args.year, error
+            )
+            self.skipped = error
+            return False
 
-        time.sleep(int(args.seconds_between_downloads))
-    except requests.exceptions.RequestException as error:
-        print(f"Failed to download {paper['title']}: {error}")
-        failed_log.write(f"{paper['title']} | {paper['pdf_url']} | {error}\n")
-        failed_log.flush()
-        return False
+        os.makedirs(self.download_path, exist_ok=True)
+        self.existing = downloader.existing_files(
+            self.download_path, int(self.args.min_pdf_size)
+        )
+        write_headers = not os.path.exists(self.csv_file_path)
+        if write_headers:
+            # Rows the journal remembers from a deleted CSV are written again.
+            download_journal.reset_csv_recorded(self.args.conference, self.args.year)
+            download_journal.flush()
+        csv_file = stack.enter_context(
+            open(self.csv_file_path, mode="a", newline="", encoding="utf-8")
+        )
+        failed_log = stack.enter_context(
+            open(self.failed_log_path, "a", encoding="utf-8")
+        )
+        failed_records = stack.enter_context(
+            open(self.failed_records_path, "a", encoding="utf-8")
+        )
+        csv_writer = csv.writer(csv_file)
+        if write_headers:
+            csv_writer.writerow(CSV_FIELDS)
+
+        self.parsed = _ParsedPapers(self.args, papers, download_journal)
+        stack.enter_context(contextlib.closing(self.parsed))
+        self.recorder = _RunRecorder(
+            self.args,
+            csv_writer,
+            csv_file,
+            failed_log,
+            failed_records,
+            download_journal,
+        )
+        # Commit the journal, and so write the held-back rows, before the
+        # CSV file is closed.
+        stack.callback(download_journal.flush)
+        return True
+
+    def compact_failures(self) -> None:
+        """Drop failure records of papers that have been downloaded since."""
+        if self.parsed is None:
+            return
+        self.remaining_failures = failed_downloads.compact_failures(
+            self.failed_records_path,
+            lambda record: _is_downloaded(self.args, self.existing, record["title"]),
+        )
 
-    return True
+    def log_summary(self) -> None:
+        """Log the paper counts of this target."""
+        if self.skipped is not None:
+            logger.info("Skipped: %s", self.skipped)
+            return
+        if self.parsed is None:
+            logger.info("Not started: the download limit was reached")
+            return
+        if self.parsed.error is not None:
+            logger.info(
+                "Papers parsed before stopping: %d (%s)",
+                self.parsed.count,
+                self.parsed.error,
+            )
+        elif self.total_papers is None:
+            if self.parsed.exhausted:
+                logger.info("Total papers found: %d", self.parsed.count)
+            else:
+                logger.info("Papers parsed before stopping: %d", self.parsed.count)
+        logger.info("Papers Processed: %d", self.count)
+        if self.remaining_failures is not None:
+            logger.info("Failed Papers Remaining: %d", self.remaining_failures)
+
+
+def _started_runs(
+    runs: list[_TargetRun],
+    stack: contextlib.ExitStack,
+    download_journal: journal.DownloadJournal,
+    html_backend: str | None,
+) -> Iterator[_TargetRun]:
+    """Start each target when the batch reaches it, skipping unparseable ones."""
+    for run in runs:
+        if run.start(stack, download_journal, html_backend):
+            yield run
+
+
+def _assign_rate_limiters(args: Namespace, runs: list[_TargetRun]) -> None:
+    """Give every target a limiter of its (rate, burst) on shared host buckets.
+
+    All targets share one token bucket per host, running at the lowest rate
+    of the targets using that host. Two years of a venue, or two venues on
+    one publisher host, therefore never exceed the host's rate between
+    them. A ``--rate-limit CONF=R`` for the target's conference wins over
+    the global ``--rate-limit``.
+    """
+    buckets = rate_limit.HostRateLimiter(None)
+    for run in runs:
+        rate, burst = rate_limit.resolve_rate_limit(
+            run.args.conference,
+            args.conference_rate_limits.get(run.args.conference, args.rate_limit),
+            args.burst,
+            float(args.seconds_between_downloads),
+        )
+        run.rate_limiter = buckets.shared(rate, burst)
 
 
-def _record_csv_row(
+def _download_and_record(
     args: Namespace,
-    paper: dict[str, str],
-    safe_filename: str,
-    csv_writer: Any,
-    csv_file: TextIO,
-) -> None:
-    """Append one paper metadata row to the CSV output."""
-    csv_writer.writerow(
-        [
-            args.conference,
-            args.year,
-            safe_filename,
-            paper["title"],
-            paper["authors"],
-            paper["category"],
-            paper["pdf_url"],
-        ]
+    session: requests.Session,
+    controller: concurrency.ConcurrencyController,
+    runs: list[_TargetRun],
+    started: Iterable[_TargetRun],
+    reporter: progress.ProgressReporter,
+) -> int:
+    """Download the PDFs of every target on one worker pool, returning the count.
+
+    All targets share the session, the per-host concurrency controller and
+    the rate limiters, so a batch is scheduled like a single run. Targets
+    are taken from ``started`` only when the scheduler reaches them. Worker
+    threads only fetch and write PDFs; CSV rows, failure log lines, journal
+    updates and progress output are all produced on this thread as
+    downloads complete. ``reporter`` tracks throughput, attempts in flight,
+    retries and failures.
+    """
+    count = 0
+    _assign_rate_limiters(args, runs)
+
+    def download(job: _DownloadJob) -> float:
+        reporter.started()
+        try:
+            job.result = downloader.download_pdf(
+                session,
+                job.paper.pdf_url,
+                job.pdf_file_path,
+                job.run.rate_limiter,
+                admitted=True,
+            )
+        finally:
+            reporter.finished()
+        return job.result.latency
+
+    def on_result(job: _DownloadJob, error: Exception | None) -> bool:
+        nonlocal count
+        paper = job.paper
+        run = job.run
+        total = _progress_total(args, runs)
+        reporter.total = total
+
+        if error is not None:
+            logger.warning(
+                "Failed to download %s: %s",
+                paper.title,
+                error,
+                extra=logs.fields(pdf_url=paper.pdf_url),
+            )
+            run.recorder.record_failure(paper, error)
+            reporter.failed()
+            return False
+
+        logger.info(
+            "[%d/%s] Downloaded: %s -> %s",
+            count + 1,
+            "?" if total is None else total,
+            paper.title,
+            job.pdf_file_path,
+            extra=logs.progress(count=count + 1, total=total),
+        )
+        run.recorder.record_download(job)
+        run.existing.add(job.safe_filename)
+        run.count += 1
+        count += 1
+        if job.result is not None:
+            reporter.downloaded(job.result.num_bytes)
+        return True
+
+    def on_retry(job: _DownloadJob, error: Exception, delay: float) -> None:
+        logger.info("Retrying in %.1fs: %s: %s", delay, job.paper.title, error)
+        reporter.retried()
+
+    def admit(job: _DownloadJob) -> float:
+        if job.run.rate_limiter is None:
+            return 0.0
+        return job.run.rate_limiter.try_acquire(job.paper.pdf_url)
+
+    jobs = itertools.chain.from_iterable(_pending_downloads(run) for run in started)
+    downloader.run_downloads(
+        jobs,
+        download,
+        on_result,
+        workers=int(args.workers),
+        limit=int(args.num_papers_to_download),
+        host_of=lambda job: rate_limit.url_host(job.paper.pdf_url),
+        controller=controller,
+        retries=int(args.download_retries),
+        on_retry=on_retry,
+        admit=admit,
     )
-    csv_file.flush()
+    return count
 
 
-def main() -> None:
-    """Run the paper parsing and download pipeline from CLI arguments."""
-    args = command_args.args(sys.argv[1:])
-    _print_run_banner(args)
+def _record_rows(args: Namespace, started: Iterable[_TargetRun]) -> int:
+    """Write CSV rows without downloading, returning the number written."""
+    count = 0
+    limit = int(args.num_papers_to_download)
+    for run in started:
+        for paper in run.parsed:
+            safe_filename = generate_safe_filename.generate_safe_filename(
+                run.args.conference, run.args.year, paper.title
+            )
+            if not run.recorder.record_row(paper, safe_filename):
+                continue
+            run.count += 1
+            count += 1
 
-    download_path, csv_file_path = _build_output_paths(args)
-    os.makedirs(download_path, exist_ok=True)
+            if limit != -1 and count >= limit:
+                return count
+    return count
 
-    parser = _create_parser(args.conference, args.year)
-    papers = parser.parse()
 
-    total_papers = len(papers)
-    print(f"Total papers found: {total_papers}")
+def _csv_row(args: Namespace, paper: Paper, safe_filename: str) -> list[str]:
+    """Return the CSV metadata row of one paper."""
+    return [
+        args.conference,
+        args.year,
+        safe_filename,
+        paper.title,
+        paper.authors,
+        paper.category,
+        paper.pdf_url,
+    ]
 
-    if int(args.num_papers_to_download) != -1:
-        num_papers_to_download = args.num_papers_to_download
-    else:
-        num_papers_to_download = total_papers
 
-    write_headers = not os.path.exists(csv_file_path)
-    failed_log_path = os.path.join(download_path, "failed_downloads.log")
+def _progress_total(args: Namespace, runs: list[_TargetRun]) -> int | None:
+    """Return the number of PDFs the run should download, None if unknown.
 
-    with (
-        open(csv_file_path, mode="a", newline="", encoding="utf-8") as csv_file,
-        open(failed_log_path, "a", encoding="utf-8") as failed_log,
-    ):
-        csv_writer = csv.writer(csv_file)
+    ``--num-papers-to-download`` caps the sum of the targets' expected
+    downloads; without a limit the total is known once every target's is.
+    """
+    limit = int(args.num_papers_to_download)
+    expected = [run.expected_downloads() for run in runs if run.skipped is None]
+    known = None if None in expected else sum(e or 0 for e in expected)
+    if limit == -1:
+        return known
+    return limit if known is None else min(limit, known)
 
-        if write_headers:
-            csv_writer.writerow(CSV_FIELDS)
 
-        count = 0
+def _status_interval(args: Namespace) -> float:
+    """Return the seconds between status records, 0 when they are disabled.
 
-        for paper in papers:
-            safe_filename = generate_safe_filename.generate_safe_filename(
-                args.conference, args.year, paper["title"]
-            )
-            pdf_file_path = f"{download_path}/{safe_filename}"
+    A terminal gets a live line redrawn every ``REFRESH_INTERVAL``; other
+    outputs get a summary every ``--status-interval`` seconds.
+    """
+    if args.status_interval <= 0:
+        return 0
+    if logs.live_status(args.log_format):
+        return progress.REFRESH_INTERVAL
+    return args.status_interval
 
-            if args.no_download_pdf:
-                _record_csv_row(args, paper, safe_filename, csv_writer, csv_file)
-            else:
-                downloaded = _download_and_record(
-                    args,
-                    paper,
-                    safe_filename,
-                    pdf_file_path,
-                    count,
-                    num_papers_to_download,
-                    csv_writer,
-                    csv_file,
-                    failed_log,
-                )
-                if not downloaded:
-                    continue
 
-            count += 1
+def main() -> None:
+    """Run the paper parsing and download pipeline from CLI arguments.
+
+    Several conferences and years run as one batch: their papers feed a
+    single download scheduler and their PDFs share one connection pool.
+    """
+    args = command_args.args(sys.argv[1:])
+    with logs.configure(args.log_level, args.log_format, args.progress_interval):
+        _run(args)
 
-            if int(args.num_papers_to_download) != -1:
-                if count >= int(num_papers_to_download):
-                    break
 
-    print("========================================================================")
-    print(f"Papers Processed: {count}")
-    print("========================================================================")
+def _run(args: Namespace) -> None:
+    """Parse and download every target of the parsed arguments."""
+    html_backend = None
+    if not args.retry_failed:
+        html_backend = soup.resolve_backend(args.html_backend)
+
+    runs = [_TargetRun(target) for target in command_args.targets(args)]
+    os.makedirs(args.save_dir, exist_ok=True)
+
+    with (
+        journal.DownloadJournal(
+            os.path.join(args.save_dir, journal.JOURNAL_NAME)
+        ) as download_journal,
+        contextlib.ExitStack() as stack,
+    ):
+        started = _started_runs(runs, stack, download_journal, html_backend)
+
+        connection_stats = None
+        controller = None
+        reporter = None
+
+        if args.no_download_pdf:
+            count = _record_rows(args, started)
+        else:
+            with downloader.create_session(
+                pool_size=max(int(args.pool_size), int(args.workers)),
+                max_retries=int(args.max_retries),
+                timeout=(float(args.connect_timeout), float(args.read_timeout)),
+            ) as session:
+                controller = _create_controller(args)
+                reporter = progress.ProgressReporter(
+                    _progress_total(args, runs), _status_interval(args)
+                )
+                with reporter:
+                    count = _download_and_record(
+                        args, session, controller, runs, started, reporter
+                    )
+                connection_stats = downloader.connection_stats(session)
+
+    if not args.no_download_pdf:
+        for run in runs:
+            run.compact_failures()
+
+    logger.info(
+        "========================================================================"
+    )
+    for run in runs:
+        if len(runs) > 1:
+            logger.info("Conference: %s Year: %s", run.args.conference, run.args.year)
+        run.log_summary()
+    if len(runs) > 1:
+        logger.info("Total Papers Processed: %d", count)
+    if reporter is not None:
+        reporter.log_report()
+    if connection_stats is not None:
+        connections, requests_sent = connection_stats
+        logger.info(
+            "HTTP Requests: %d Connections Opened: %d Reused: %d",
+            requests_sent,
+            connections,
+            max(requests_sent - connections, 0),
+        )
+    if controller is not None:
+        for host, (level, peak, throttled) in controller.summary().items():
+            logger.info(
+                "Host: %s Concurrency: %d Peak: %d Throttled: %d",
+                host,
+                level,
+                peak,
+                throttled,
+            )
+    logger.info(
+        "========================================================================"
+    )
@@ -0,0 +1,167 @@
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from ai_paper_downloader import openreview_fetch
+
+OPENREVIEW_CACHE_DIR_NAME = "openreview_cache"
+# Bump when the on-disk layout changes.
+CACHE_FORMAT = 1
+# use: read recorded notes, fetching and recording on a miss.
+# refresh: always fetch and re-record. replay: never touch the network.
+CACHE_MODES = ("use", "refresh", "replay", "off")
+
+
+class OpenReviewCacheMiss(LookupError):
+    """A replayed query has no recorded notes."""
+
+
+def note_payload(note: Any) -> dict[str, Any]:
+    """Return the raw JSON of a note, including the details it was fetched with."""
+    return {**note.to_json(), "details": getattr(note, "details", None)}
+
+
+class OpenReviewCache:
+    """Raw OpenReview note listings, one gzipped JSON file per query.
+
+    Entries are keyed by the cache format, the API version, the client
+    method and its query (conference id, invitation, details), so a query
+    with different parameters never replays another one's notes.
+    """
+
+    def __init__(self, cache_dir: str, mode: str = "use"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"unknown OpenReview cache mode {mode!r}")
+        self.cache_dir = cache_dir
+        self.mode = mode
+
+    def key(self, api_version: int, method: str, query: dict[str, Any]) -> str:
+        """Return the cache key of one client query."""
+        identity = json.dumps(
+            [CACHE_FORMAT, api_version, method, query], sort_keys=True, default=str
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    def load(self, key: str) -> list[dict[str, Any]] | None:
+        """Return the recorded note payloads of ``key``, or None on a miss."""
+        try:
+            with gzip.open(self._path(key), "rt", encoding="utf-8") as cache_file:
+                return json.load(cache_file)["notes"]
+        except (OSError, EOFError, ValueError, KeyError):
+            return None
+
+    def store(
+        self,
+        key: str,
+        api_version: int,
+        method: str,
+        query: dict[str, Any],
+        payloads: list[dict[str, Any]],
+    ) -> None:
+        """Record the note payloads of a query atomically."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    "format": CACHE_FORMAT,
+                    "api_version": api_version,
+                    "method": method,
+                    "query": query,
+                    "notes": payloads,
+                },
+                cache_file,
+                ensure_ascii=False,
+                separators=(",", ":"),
+                default=str,
+            )
+        os.replace(temp_path, path)
+
+
+class CachedClient:
+    """OpenReview client stand-in serving note queries from the cache.
+
+    ``connect`` logs in to the real API and is only called on the first
+    query that has to be fetched, so cache hits need neither network access
+    nor credentials. In replay mode a miss raises ``OpenReviewCacheMiss``.
+    """
+
+    def __init__(
+        self,
+        cache: OpenReviewCache,
+        api_version: int,
+        connect: Callable[[], Any],
+        note_from_json: Callable[[dict[str, Any]], Any],
+        workers: int = openreview_fetch.FETCH_WORKERS,
+    ):
+        self.cache = cache
+        self.api_version = api_version
+        self.workers = workers
+        self._connect = connect
+        self._note_from_json = note_from_json
+        self._client: Any = None
+
+    def _upstream(self) -> Any:
+        if self._client is None:
+            self._client = self._connect()
+        return self._client
+
+    def _recorded(
+        self, method: str, query: dict[str, Any]
+    ) -> tuple[str, list[dict[str, Any]] | None]:
+        """Return the key of a query and its recorded payloads, if usable."""
+        key = self.cache.key(self.api_version, method, query)
+        payloads = None if self.cache.mode == "refresh" else self.cache.load(key)
+        if payloads is None and self.cache.mode == "replay":
+            raise OpenReviewCacheMiss(
+                f"No recorded OpenReview notes for {method}({query}) "
+                f"on API v{self.api_version}"
+            )
+        return key, payloads
+
+    def iter_all_notes(self, **query: Any) -> Iterator[Any]:
+        """Yield every note matching ``query``.
+
+        On a miss the pages are fetched concurrently and their notes yielded
+        as they arrive; the listing is recorded once it is complete.
+        """
+        key, payloads = self._recorded("get_all_notes", query)
+        if payloads is not None:
+            for payload in payloads:
+                yield self._note_from_json(payload)
+            return
+
+        payloads = []
+        for note in openreview_fetch.iter_all_notes(
+            self._upstream(), query, workers=self.workers
+        ):
+            payloads.append(note_payload(note))
+            yield note
+        self.cache.store(key, self.api_version, "get_all_notes", query, payloads)
+
+    def get_all_notes(self, **query: Any) -> list[Any]:
+        """Return every note matching ``query``, like the OpenReview client."""
+        return list(self.iter_all_notes(**query))
+
+    def get_notes(self, **query: Any) -> list[Any]:
+        """Return one page of notes matching ``query``."""
+        key, payloads = self._recorded("get_notes", query)
+        if payloads is not None:
+            return [self._note_from_json(payload) for payload in payloads]
+
+        notes = self._upstream().get_notes(**query)
+        self.cache.store(
+            key,
+            self.api_version,
+            "get_notes",
+            query,
+            [note_payload(note) for note in notes],
+        )
+        return notes
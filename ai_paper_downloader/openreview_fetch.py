@@ -0,0 +1,73 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any
+
+# Notes per request, the OpenReview API maximum.
+PAGE_SIZE = 1000
+# Pages requested at the same time.
+FETCH_WORKERS = 4
+
+
+def _unique(notes: Iterable[Any], seen: set[str]) -> Iterator[Any]:
+    """Drop notes already yielded, in case the listing shifted between pages."""
+    for note in notes:
+        if note.id not in seen:
+            seen.add(note.id)
+            yield note
+
+
+def iter_all_notes(
+    client: Any,
+    query: dict[str, Any],
+    page_size: int = PAGE_SIZE,
+    workers: int = FETCH_WORKERS,
+) -> Iterator[Any]:
+    """Yield every note matching ``query``, fetching pages concurrently.
+
+    The first page also returns the total count, which splits the rest of
+    the listing into offset pages. Up to ``workers`` pages are in flight at
+    once, and each page is yielded in offset order as soon as it and every
+    page before it have arrived, so callers start on the first notes while
+    later pages are still loading.
+    """
+    first_page, total = client.get_notes(**query, limit=page_size, with_count=True)
+    seen: set[str] = set()
+    yield from _unique(first_page, seen)
+
+    offsets = iter(range(page_size, total, page_size))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+
+        def fetch(offset: int) -> Future[list[Any]]:
+            return executor.submit(
+                client.get_notes, **query, offset=offset, limit=page_size
+            )
+
+        pending = deque(fetch(offset) for offset in islice(offsets, max(1, workers)))
+        try:
+            while pending:
+                notes = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(fetch(next_offset))
+                yield from _unique(notes, seen)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class PagedClient:
+    """Wrap an OpenReview client so full listings are fetched page-parallel."""
+
+    def __init__(self, client: Any, workers: int = FETCH_WORKERS):
+        self.client = client
+        self.workers = workers
+
+    def iter_all_notes(self, **query: Any) -> Iterator[Any]:
+        """Yield every note matching ``query`` as its page arrives."""
+        return iter_all_notes(self.client, query, workers=self.workers)
+
+    def get_notes(self, **query: Any) -> list[Any]:
+        """Return one page of notes matching ``query``."""
+        return self.client.get_notes(**query)
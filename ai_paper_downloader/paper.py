@@ -0,0 +1,16 @@
+import sys
+from typing import NamedTuple
+
+
+class Paper(NamedTuple):
+    """Metadata of one paper, as produced by every venue parser."""
+
+    title: str
+    authors: str
+    category: str | None
+    pdf_url: str
+
+
+def intern_category(category: str | None) -> str | None:
+    """Share one string object for a category repeated across many papers."""
+    return None if category is None else sys.intern(category)
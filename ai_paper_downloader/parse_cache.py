@@ -0,0 +1,138 @@
+import gzip
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser import soup
+
+PARSE_CACHE_DIR_NAME = "parse_cache"
+# Bump when the on-disk layout changes.
+CACHE_FORMAT = 1
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _file_digest(path: str | os.PathLike[str]) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parser_version(parser: Any) -> str:
+    """Fingerprint the source of the parser's module and the soup helpers."""
+    digest = hashlib.sha256()
+    for module in (sys.modules[type(parser).__module__], soup):
+        with open(module.__file__, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def cache_key(parser: Any, year: Any = None) -> str | None:
+    """Return the cache key of a parser's current inputs.
+
+    The key covers the parser class, its source code, the year (``year``
+    or the parser's own), the HTML backend and the SHA-256 of every input
+    file, so editing either the HTML or the parser invalidates the entry.
+    Returns None for parsers whose papers do not come from local files.
+    """
+    input_files = parser.input_files()
+    if input_files is None:
+        return None
+
+    digest = hashlib.sha256()
+    for part in (
+        str(CACHE_FORMAT),
+        type(parser).__qualname__,
+        parser_version(parser),
+        str(parser.year if year is None else year),
+        str(getattr(parser, "backend", None) or soup.DEFAULT_BACKEND),
+        *(_file_digest(path) for path in input_files),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Gzipped JSON parse results keyed by ``cache_key``, one file per key."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    def load(self, key: str) -> list[Paper] | None:
+        """Return the cached papers of ``key``, or None on a miss."""
+        try:
+            with gzip.open(self._path(key), "rt", encoding="utf-8") as cache_file:
+                rows = json.load(cache_file)
+        except (OSError, EOFError, ValueError):
+            return None
+        return [
+            Paper(title, authors, intern_category(category), pdf_url)
+            for title, authors, category, pdf_url in rows
+        ]
+
+    def store(self, key: str, papers: list[Paper]) -> None:
+        """Write the papers of ``key`` atomically, as rows of field values."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as cache_file:
+            json.dump(
+                papers,
+                cache_file,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, path)
+
+    def iter_papers(
+        self, parser: Any, on_count: Callable[[int], None] | None = None
+    ) -> Iterator[Paper]:
+        """Yield the parser's papers from the cache, parsing on a miss.
+
+        On a miss the papers are yielded as the parser produces them and
+        stored once it finishes; a stream abandoned early is not stored.
+        Parsers with ``papers_by_year`` store every year they index.
+        When the full list is loaded before the first paper is yielded (a
+        cache hit or an all-years parse), ``on_count`` receives its length.
+        """
+        key = cache_key(parser)
+        if key is None:
+            yield from parser.iter_papers()
+            return
+
+        cached = self.load(key)
+        if cached is not None:
+            if on_count is not None:
+                on_count(len(cached))
+            yield from cached
+            return
+
+        papers_by_year = getattr(parser, "papers_by_year", None)
+        if papers_by_year is not None:
+            # One parse of an all-years source fills the cache for every year.
+            index = papers_by_year()
+            for year, year_papers in index.items():
+                year_key = key if year == parser.year else cache_key(parser, year)
+                if year_key is not None:
+                    self.store(year_key, list(year_papers))
+            year_papers = index.get(parser.year, ())
+            if on_count is not None:
+                on_count(len(year_papers))
+            yield from year_papers
+            return
+
+        papers: list[Paper] = []
+        for paper in parser.iter_papers():
+            papers.append(paper)
+            yield paper
+        self.store(key, papers)
@@ -1,15 +1,34 @@
 #!/usr/bin/env python
 
-from bs4 import BeautifulSoup
+from collections.abc import Iterator
+
+from bs4 import SoupStrainer
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser import parallel
+from ai_paper_downloader.parser.soup import has_class, make_soup
+
+# Track headings and paper entries of the legacy WordPress pages.
+LEGACY_STRAINER = SoupStrainer(class_=has_class("track-wrap", "paper-wrap"))
+# Track sections of the OJS pages used since 2023.
+SECTION_STRAINER = SoupStrainer("div", class_=has_class("section"))
+
 
 class AAAIParser:
     """Parse AAAI proceedings HTML files into normalized paper metadata."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(
+        self,
+        html_file_path: str,
+        year: str,
+        workers: int = 1,
+        backend: str | None = None,
+    ):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.workers = workers
+        self.backend = backend
 
         self.html_files = {
             2014: ["2014.html"],
@@ -164,12 +183,12 @@ class AAAIParser:
             ],
         }
 
-    def parse_2014(self, html_file_path: str) -> list[dict[str, str]]:
+    def parse_2014(self, html_file_path: str) -> list[Paper]:
         """Parse legacy AAAI page structures used through 2022."""
         with open(html_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, LEGACY_STRAINER)
 
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
         current_category = None
 
         for tag in soup.find_all(True):
@@ -178,7 +197,9 @@ class AAAIParser:
 
             if tag.name == "div" and "track-wrap" in tag.get("class", []):
                 h2 = tag.find("h2")
-                current_category = h2.get_text(strip=True) if h2 else None
+                current_category = (
+                    intern_category(h2.get_text(strip=True)) if h2 else None
+                )
 
             elif tag.name == "li" and "paper-wrap" in tag.get("class", []):
                 title_tag = tag.find("h5")
@@ -193,22 +214,22 @@ class AAAIParser:
                 )
 
                 papers_metadata.append(
-                    {
-                        "title": title,
-                        "authors": authors,
-                        "category": current_category,
-                        "pdf_url": pdf_url,
-                    }
+                    Paper(
+                        title=title,
+                        authors=authors,
+                        category=current_category,
+                        pdf_url=pdf_url,
+                    )
                 )
 
         return papers_metadata
 
-    def parse_2023(self, html_file_path: str) -> list[dict[str, str]]:
+    def parse_2023(self, html_file_path: str) -> list[Paper]:
         """Parse modern AAAI page structures used in 2023+."""
         with open(html_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, SECTION_STRAINER)
 
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
 
         sections = soup.find_all("div", class_="section")
 
@@ -216,7 +237,7 @@ class AAAIParser:
             if not isinstance(section, Tag):
                 continue
 
-            category = (
+            category = intern_category(
                 section.find("h2").text.strip()
                 if section.find("h2")
                 else "Unknown Category"
@@ -238,27 +259,28 @@ class AAAIParser:
                 pdf_url = pdf_tag["href"] if pdf_tag else "No PDF available"
 
                 papers_metadata.append(
-                    {
-                        "title": title,
-                        "authors": authors,
-                        "category": category,
-                        "pdf_url": pdf_url,
-                    }
+                    Paper(
+                        title=title,
+                        authors=authors,
+                        category=category,
+                        pdf_url=pdf_url,
+                    )
                 )
 
         return papers_metadata
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse all configured AAAI HTML files for the selected year."""
-        papers_metadata: list[dict[str, str]] = []
+    def input_files(self) -> list[str]:
+        """Return the track files of the selected year, in parse order."""
+        return [
+            f"{self.html_file_path}/{html_file}"
+            for html_file in self.html_files[self.year]
+        ]
 
-        if self.year <= 2022:
-            for html_file in self.html_files[self.year]:
-                html_file_path = f"{self.html_file_path}/{html_file}"
-                papers_metadata.extend(self.parse_2014(html_file_path))
-        elif self.year >= 2023:
-            for html_file in self.html_files[self.year]:
-                html_file_path = f"{self.html_file_path}/{html_file}"
-                papers_metadata.extend(self.parse_2023(html_file_path))
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield papers track file by track file for the selected year."""
+        parse_file = self.parse_2014 if self.year <= 2022 else self.parse_2023
+        yield from parallel.parse_files(parse_file, self.input_files(), self.workers)
 
-        return papers_metadata
+    def parse(self) -> list[Paper]:
+        """Parse all configured AAAI HTML files for the selected year."""
+        return list(self.iter_papers())
@@ -1,21 +1,40 @@
 #!/usr/bin/env python
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser import parallel, year_index
+from ai_paper_downloader.parser.soup import backend_name, has_class, make_soup
+
 DMLR_BASE_URL = "https://data.mlr.press"
 YEAR_REGEX = re.compile(r",\s*(19|20)\d{2}\.")
+# The volume title and the paper list items.
+PAPER_STRAINER = SoupStrainer(class_=has_class("post-title", "list-group-item"))
 
 
 class DMLRParser:
-    """Parse DMLR volume HTML files and filter papers by requested year."""
-
-    def __init__(self, html_file_path: str, year: str):
+    """Parse DMLR volume HTML files and filter papers by requested year.
+
+    Volumes mix years, so all of them are parsed once per process into a
+    year index shared by all DMLR parsers reading the same files.
+    """
+
+    def __init__(
+        self,
+        html_file_path: str,
+        year: str,
+        workers: int = 1,
+        backend: str | None = None,
+    ):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.workers = workers
+        self.backend = backend
 
     def _resolve_pdf_url(self, href: str) -> str:
         """Resolve DMLR PDF link to an absolute URL."""
@@ -33,19 +52,19 @@ class DMLRParser:
             return None
         return int(match.group(0).split(",")[-1].replace(".", "").strip())
 
-    def _parse_volume_file(self, html_path: Path) -> list[dict[str, str]]:
-        """Parse one DMLR volume file and return matching-year papers."""
+    def _parse_volume_file(self, html_path: Path) -> list[tuple[int | None, Paper]]:
+        """Parse one DMLR volume file into (year, paper) rows."""
         with html_path.open("r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, PAPER_STRAINER)
 
         category_tag = soup.find("h1", class_="post-title")
-        category = (
+        category = intern_category(
             category_tag.get_text(" ", strip=True)
             if isinstance(category_tag, Tag)
             else "Unknown"
         )
 
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[tuple[int | None, Paper]] = []
         for item in soup.find_all("li", class_="list-group-item"):
             item_tag = item if isinstance(item, Tag) else None
             if item_tag is None:
@@ -63,8 +82,6 @@ class DMLRParser:
                 continue
 
             parsed_year = self._extract_year(details_tag)
-            if parsed_year != self.year:
-                continue
 
             author_tags = details_tag.find_all("i")
             authors = ", ".join(
@@ -86,28 +103,47 @@ class DMLRParser:
                 continue
 
             papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": category,
-                    "pdf_url": pdf_url,
-                }
+                (
+                    parsed_year,
+                    Paper(
+                        title=title,
+                        authors=authors,
+                        category=category,
+                        pdf_url=pdf_url,
+                    ),
+                )
             )
 
         return papers_metadata
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse all DMLR volume files and return papers for the selected year."""
+    def input_files(self) -> list[Path]:
+        """Return the volume files to parse, in sorted order."""
         base_path = Path(self.html_file_path)
         if base_path.is_file():
-            html_files = [base_path]
-        elif base_path.is_dir():
-            html_files = sorted(base_path.glob("*.html"))
-        else:
-            raise FileNotFoundError(f"No such file or directory: {self.html_file_path}")
+            return [base_path]
+        if base_path.is_dir():
+            return sorted(base_path.glob("*.html"))
+        raise FileNotFoundError(f"No such file or directory: {self.html_file_path}")
+
+    def papers_by_year(self) -> year_index.YearIndex:
+        """Return the papers of every year, parsing each volume once."""
+        paths = self.input_files()
+        key = (
+            type(self).__qualname__,
+            backend_name(self.backend),
+            year_index.file_identity(paths),
+        )
+        return year_index.cached(
+            key,
+            lambda: year_index.partition(
+                parallel.parse_files(self._parse_volume_file, paths, self.workers)
+            ),
+        )
 
-        papers_metadata: list[dict[str, str]] = []
-        for html_file in html_files:
-            papers_metadata.extend(self._parse_volume_file(html_file))
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield papers of the selected year, in volume order."""
+        yield from self.papers_by_year().get(self.year, ())
 
-        return papers_metadata
+    def parse(self) -> list[Paper]:
+        """Parse all DMLR volume files and return papers for the selected year."""
+        return list(self.iter_papers())
@@ -1,40 +1,118 @@
 #!/usr/bin/env python
 
+import logging
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
 import openreview
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from bs4.element import Tag
 import yaml
 
+from ai_paper_downloader import logs
+from ai_paper_downloader.openreview_cache import CachedClient, OpenReviewCache
+from ai_paper_downloader.openreview_fetch import PagedClient
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser.soup import has_class, make_soup
+
+logger = logging.getLogger(__name__)
+
+PROCEEDINGS_STRAINER = SoupStrainer("li", class_=has_class("conference"))
+# Reply invitation suffix -> content field holding the decision.
+DECISION_FIELDS = {
+    "Acceptance_Decision": "decision",
+    "Decision": "decision",
+    "Meta_Review": "recommendation",
+}
+
+
+class DecisionTally:
+    """Count the final decisions of OpenReview submissions.
+
+    Each reply's invitation suffix is looked up once in ``DECISION_FIELDS``;
+    the last decision-bearing reply wins. ``counts`` tallies the decisions
+    so a run reports them once instead of printing per reply.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+
+    def add(self, note: Any) -> str | None:
+        """Count a submission with ``directReplies`` and return its decision."""
+        decision = None
+        for reply in note.details["directReplies"]:
+            field = DECISION_FIELDS.get(reply["invitation"].rpartition("/")[2])
+            if field is not None:
+                decision = reply["content"][field]
+        self.counts["No decision" if decision is None else decision] += 1
+        return decision
+
+    def summary(self) -> str:
+        """Return the decision counts, most frequent first."""
+        return ", ".join(
+            f"{decision}: {count}" for decision, count in self.counts.most_common()
+        )
+
 
 class ICLRParser:
     """Parse ICLR proceedings from OpenReview and legacy static HTML pages."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(
+        self,
+        html_file_path: str,
+        year: str,
+        backend: str | None = None,
+        openreview_cache: OpenReviewCache | None = None,
+    ):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.backend = backend
+        self.openreview_cache = openreview_cache
         self.arxiv_base_url = "https://arxiv.org/pdf/"
 
-    def parse_openreview(self) -> list[dict[str, str]]:
-        """Parse ICLR submissions and accepted papers from OpenReview APIs."""
+    def _connect(self, api_version: int) -> Any:
+        """Log in to the OpenReview API with ``openreview_pass.yaml``."""
         with open("openreview_pass.yaml", "r", encoding="utf-8") as yamlfile:
             credentials = yaml.safe_load(yamlfile)
 
-        if int(self.year) >= 2024:
-            print("Using API V2")
-            api_version = 2
-            client = openreview.api.OpenReviewClient(
+        if api_version == 2:
+            return openreview.api.OpenReviewClient(
                 baseurl="https://api2.openreview.net",
                 username=credentials["username"],
                 password=credentials["password"],
             )
+        return openreview.Client(
+            baseurl="https://api.openreview.net",
+            username=credentials["username"],
+            password=credentials["password"],
+        )
+
+    def _client(self, api_version: int) -> Any:
+        """Return a page-parallel client, cached when a cache is set."""
+        if self.openreview_cache is None:
+            return PagedClient(self._connect(api_version))
+        note_class = openreview.api.Note if api_version == 2 else openreview.Note
+        return CachedClient(
+            self.openreview_cache,
+            api_version,
+            lambda: self._connect(api_version),
+            note_class.from_json,
+        )
+
+    def iter_openreview(self) -> Iterator[Paper]:
+        """Yield accepted ICLR papers from the OpenReview APIs.
+
+        Submission pages are fetched concurrently and classified as they
+        arrive, so papers stream out before the whole listing is loaded.
+        """
+        if int(self.year) >= 2024:
+            logger.info("Using API V2")
+            api_version = 2
         else:
-            print("Using API V1")
+            logger.info("Using API V1")
             api_version = 1
-            client = openreview.Client(
-                baseurl="https://api.openreview.net",
-                username=credentials["username"],
-                password=credentials["password"],
-            )
+        client = self._client(api_version)
 
         if int(self.year) >= 2018:
             conference_id = f"ICLR.cc/{self.year}/Conference"
@@ -43,10 +121,10 @@ class ICLRParser:
 
         if api_version == 2:
             # API v2 exposes accepted submissions via venue id.
-            submissions = client.get_all_notes(content={"venueid": conference_id})
+            submissions = client.iter_all_notes(content={"venueid": conference_id})
         elif api_version == 1:
             if int(self.year) >= 2018:
-                submissions = client.get_all_notes(
+                submissions = client.iter_all_notes(
                     invitation=f"{conference_id}/-/Blind_Submission",
                     details="directReplies",
                 )
@@ -55,8 +133,7 @@ class ICLRParser:
                     invitation=f"{conference_id}/-/submission"
                 )
 
-        papers_metadata: list[dict[str, str]] = []
-
+        decisions = DecisionTally()
         for paper in submissions:
             if api_version == 2:
                 title = paper.content.get("title", {}).get("value", "No title")
@@ -84,41 +161,39 @@ class ICLRParser:
                     continue
 
             if api_version == 1 and int(self.year) >= 2018:
-                for reply in paper.details["directReplies"]:
-                    print(title)
-                    if "/Acceptance_Decision" in reply["invitation"]:
-                        category = reply["content"]["decision"]
-                    if "/Decision" in reply["invitation"]:
-                        category = reply["content"]["decision"]
-                    if "/Meta_Review" in reply["invitation"]:
-                        category = reply["content"]["recommendation"]
-
-                if "reject" in category.lower():
-                    continue
-                elif category == "None":
-                    print(f"Paper without category, skipping {title}")
+                decision = decisions.add(paper)
+                if decision is None or "reject" in decision.lower():
                     continue
+                category = decision
 
             if api_version == 2:
                 category = venue
 
-            papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": category,
-                    "pdf_url": pdf_url,
-                }
+            yield Paper(
+                title=title,
+                authors=authors,
+                category=intern_category(category),
+                pdf_url=pdf_url,
             )
 
-        return papers_metadata
+        if decisions.counts:
+            logger.info(
+                "ICLR %d decisions: %s",
+                self.year,
+                decisions.summary(),
+                extra=logs.fields(decisions=dict(decisions.counts)),
+            )
 
-    def parse_2015_2016(self) -> list[dict[str, str]]:
+    def parse_openreview(self) -> list[Paper]:
+        """Parse ICLR submissions and accepted papers from OpenReview APIs."""
+        return list(self.iter_openreview())
+
+    def parse_2015_2016(self) -> list[Paper]:
         """Parse 2015-2016 ICLR static pages with oral/poster sections."""
         with open(self.html_file_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f, "html.parser")
+            soup = make_soup(f, self.backend)
 
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
 
         sections = {
             "Oral Presentations": "oral",
@@ -147,22 +222,22 @@ class ICLRParser:
                             authors = authors.removeprefix(", ")
 
                             papers_metadata.append(
-                                {
-                                    "title": title,
-                                    "authors": authors,
-                                    "category": category,
-                                    "pdf_url": f"{self.arxiv_base_url}{arxiv_id}.pdf",
-                                }
+                                Paper(
+                                    title=title,
+                                    authors=authors,
+                                    category=category,
+                                    pdf_url=f"{self.arxiv_base_url}{arxiv_id}.pdf",
+                                )
                             )
 
         return papers_metadata
 
-    def parse_2014(self) -> list[dict[str, str]]:
+    def parse_2014(self) -> list[Paper]:
         """Parse 2014 ICLR static HTML and assign oral/poster/workshop labels."""
         with open(self.html_file_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f, "html.parser")
+            soup = make_soup(f, self.backend)
 
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
         seen_papers = set()
 
         oral_headers = ["Monday April 14:", "Tuesday April 15:", "Wednesday April 16:"]
@@ -201,22 +276,22 @@ class ICLRParser:
                 if paper_id not in seen_papers:
                     seen_papers.add(paper_id)
                     papers_metadata.append(
-                        {
-                            "title": title,
-                            "authors": authors,
-                            "category": active_session if active_session else "unknown",
-                            "pdf_url": f"{self.arxiv_base_url}{arxiv_id}.pdf",
-                        }
+                        Paper(
+                            title=title,
+                            authors=authors,
+                            category=active_session if active_session else "unknown",
+                            pdf_url=f"{self.arxiv_base_url}{arxiv_id}.pdf",
+                        )
                     )
 
         return papers_metadata
 
-    def parse_2024_plus(self) -> list[dict[str, str]]:
+    def parse_2024_plus(self) -> list[Paper]:
         """Parse 2024+ ICLR static proceedings pages."""
         with open(self.html_file_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f, "html.parser")
+            soup = make_soup(f, self.backend, PROCEEDINGS_STRAINER)
 
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
         base_url = "https://proceedings.iclr.cc"
 
         for paper in soup.find_all("li", class_="conference"):
@@ -238,25 +313,35 @@ class ICLRParser:
             )
 
             papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": "",
-                    "pdf_url": pdf_url,
-                }
+                Paper(
+                    title=title,
+                    authors=authors,
+                    category="",
+                    pdf_url=pdf_url,
+                )
             )
 
         return papers_metadata
 
-    def parse(self) -> list[dict[str, str]]:
-        """Dispatch parsing by year and source format."""
+    def input_files(self) -> list[str] | None:
+        """Return the HTML file parsed, or None when papers come from OpenReview."""
+        if 2017 <= self.year <= 2023:
+            return None
+        return [self.html_file_path]
+
+    def iter_papers(self) -> Iterator[Paper]:
+        """Dispatch parsing by year and source format, yielding papers."""
         if self.year >= 2024:
-            return self.parse_2024_plus()
+            yield from self.parse_2024_plus()
         elif self.year >= 2017:
-            return self.parse_openreview()
+            yield from self.iter_openreview()
         elif self.year == 2015 or self.year == 2016:
-            return self.parse_2015_2016()
+            yield from self.parse_2015_2016()
         elif self.year == 2014:
-            return self.parse_2014()
+            yield from self.parse_2014()
         else:
             raise ValueError("Year not supported")
+
+    def parse(self) -> list[Paper]:
+        """Dispatch parsing by year and source format."""
+        return list(self.iter_papers())
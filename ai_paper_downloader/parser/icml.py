@@ -1,23 +1,37 @@
 #!/usr/bin/env python
 
-from bs4 import BeautifulSoup
+import logging
+from collections.abc import Iterator
+
+from bs4 import SoupStrainer
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser.soup import has_class, make_soup
+
+logger = logging.getLogger(__name__)
+
+PAPER_STRAINER = SoupStrainer("div", class_=has_class("paper"))
+
 
 class ICMLParser:
     """Parse ICML proceedings HTML into normalized paper metadata."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(self, html_file_path: str, year: str, backend: str | None = None):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.backend = backend
+
+    def input_files(self) -> list[str]:
+        """Return the HTML files this parser reads."""
+        return [self.html_file_path]
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse ICML proceedings HTML into paper metadata records."""
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield paper metadata records from ICML proceedings HTML."""
         with open(self.html_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, PAPER_STRAINER)
 
         papers = soup.find_all("div", class_="paper")
-        papers_metadata: list[dict[str, str]] = []
 
         for paper in papers:
             paper_tag = paper if isinstance(paper, Tag) else None
@@ -40,16 +54,16 @@ class ICMLParser:
             category = "None"
 
             if not pdf_url:
-                print(f"Skipping: No PDF found for {title}")
+                logger.debug("Skipping: No PDF found for %s", title)
                 continue
 
-            papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": category,
-                    "pdf_url": pdf_url,
-                }
+            yield Paper(
+                title=title,
+                authors=authors,
+                category=category,
+                pdf_url=pdf_url,
             )
 
-        return papers_metadata
+    def parse(self) -> list[Paper]:
+        """Parse ICML proceedings HTML into a list of paper metadata records."""
+        return list(self.iter_papers())
@@ -1,10 +1,14 @@
 #!/usr/bin/env python
 
 import os
+from collections.abc import Iterator
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser.soup import make_soup
+
 MAIN_TRACK_CATEGORY = "Main Track"
 UNKNOWN_VALUE = "Unknown"
 IJCAI_BASE_URL = "https://www.ijcai.org"
@@ -13,9 +17,10 @@ IJCAI_BASE_URL = "https://www.ijcai.org"
 class IJCAIParser:
     """Parse IJCAI proceedings pages across old and new site layouts."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(self, html_file_path: str, year: str, backend: str | None = None):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.backend = backend
 
     def _build_proceedings_url(self, href: str) -> str:
         """Resolve relative IJCAI PDF links against the year proceedings URL."""
@@ -64,9 +69,9 @@ class IJCAIParser:
             "pdf_url": pdf_url,
         }
 
-    def _extract_new_style_papers(self, soup: BeautifulSoup) -> list[dict[str, str]]:
+    def _extract_new_style_papers(self, soup: BeautifulSoup) -> list[Paper]:
         """Extract metadata from the section/subsection-based IJCAI layout."""
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
         for section in soup.find_all("div", class_="section"):
             if not isinstance(section, Tag):
                 continue
@@ -75,7 +80,9 @@ class IJCAIParser:
                 "div", class_="section_title", recursive=False
             )
             if section_title_div and section_title_div.find("h3"):
-                track_name = section_title_div.find("h3").get_text(strip=True)
+                track_name = intern_category(
+                    section_title_div.find("h3").get_text(strip=True)
+                )
             else:
                 track_name = UNKNOWN_VALUE
 
@@ -116,19 +123,19 @@ class IJCAIParser:
                         continue
 
                     papers_metadata.append(
-                        {
-                            "title": title,
-                            "authors": authors,
-                            "category": track_name,
-                            "pdf_url": pdf_url,
-                        }
+                        Paper(
+                            title=title,
+                            authors=authors,
+                            category=track_name,
+                            pdf_url=pdf_url,
+                        )
                     )
 
         return papers_metadata
 
-    def _extract_old_style_papers(self, soup: BeautifulSoup) -> list[dict[str, str]]:
+    def _extract_old_style_papers(self, soup: BeautifulSoup) -> list[Paper]:
         """Extract metadata from the legacy IJCAI heading/paragraph layout."""
-        papers_metadata: list[dict[str, str]] = []
+        papers_metadata: list[Paper] = []
         last_category = None
         collecting = False
 
@@ -145,7 +152,7 @@ class IJCAIParser:
                     or "published by" in title_lower
                 ):
                     continue
-                last_category = title
+                last_category = intern_category(title)
                 collecting = True
                 continue
 
@@ -159,31 +166,33 @@ class IJCAIParser:
                 else last_category
             )
             papers_metadata.append(
-                {
-                    "title": paper["title"],
-                    "authors": paper["authors"],
-                    "category": category,
-                    "pdf_url": paper["pdf_url"],
-                }
+                Paper(
+                    title=paper["title"],
+                    authors=paper["authors"],
+                    category=category,
+                    pdf_url=paper["pdf_url"],
+                )
             )
 
         return papers_metadata
 
-    def _deduplicate_by_pdf_url(
-        self, papers_metadata: list[dict[str, str]]
-    ) -> list[dict[str, str]]:
+    def _deduplicate_by_pdf_url(self, papers_metadata: list[Paper]) -> list[Paper]:
         """Keep first occurrence of each paper keyed by PDF URL."""
-        unique: dict[str, dict[str, str]] = {}
+        unique: dict[str, Paper] = {}
         for paper in papers_metadata:
-            key = paper["pdf_url"]
+            key = paper.pdf_url
             if key not in unique:
                 unique[key] = paper
         return list(unique.values())
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse IJCAI HTML and return deduplicated paper metadata."""
+    def input_files(self) -> list[str]:
+        """Return the HTML files this parser reads."""
+        return [self.html_file_path]
+
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield deduplicated IJCAI paper metadata."""
         with open(self.html_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend)
 
         sections = soup.find_all("div", class_="section")
         if sections:
@@ -191,4 +200,8 @@ class IJCAIParser:
         else:
             papers_metadata = self._extract_old_style_papers(soup)
 
-        return self._deduplicate_by_pdf_url(papers_metadata)
+        yield from self._deduplicate_by_pdf_url(papers_metadata)
+
+    def parse(self) -> list[Paper]:
+        """Parse IJCAI HTML and return deduplicated paper metadata."""
+        return list(self.iter_papers())
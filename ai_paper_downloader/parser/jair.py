@@ -1,17 +1,33 @@
 #!/usr/bin/env python
 
-from bs4 import BeautifulSoup
+from collections.abc import Iterator
+
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser import parallel
+from ai_paper_downloader.parser.soup import has_class, make_soup
+
 JAIR_BASE_URL = "https://www.jair.org"
+# The breadcrumb naming the issue and the article summaries.
+PAPER_STRAINER = SoupStrainer(class_=has_class("active", "article-summary"))
 
 
 class JAIRParser:
     """Parse JAIR issue HTML files into normalized paper metadata."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(
+        self,
+        html_file_path: str,
+        year: str,
+        workers: int = 1,
+        backend: str | None = None,
+    ):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.workers = workers
+        self.backend = backend
         self.html_files = {
             supported_year: [
                 f"{supported_year}-1.html",
@@ -58,13 +74,13 @@ class JAIRParser:
             return "Unknown"
         return active_tag.get_text(" ", strip=True)
 
-    def _parse_issue(self, issue_file_path: str) -> list[dict[str, str]]:
+    def _parse_issue(self, issue_file_path: str) -> list[Paper]:
         """Parse one JAIR issue HTML file."""
         with open(issue_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, PAPER_STRAINER)
 
-        category = self._extract_category(soup)
-        papers_metadata: list[dict[str, str]] = []
+        category = intern_category(self._extract_category(soup))
+        papers_metadata: list[Paper] = []
 
         for article in soup.find_all("div", class_="article-summary"):
             article_tag = article if isinstance(article, Tag) else None
@@ -87,23 +103,32 @@ class JAIRParser:
                 continue
 
             papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": category,
-                    "pdf_url": pdf_url,
-                }
+                Paper(
+                    title=title,
+                    authors=authors,
+                    category=category,
+                    pdf_url=pdf_url,
+                )
             )
 
         return papers_metadata
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse all JAIR issue files for the selected year."""
+    def input_files(self) -> list[str]:
+        """Return the issue files of the selected year, in parse order."""
         if self.year not in self.html_files:
             raise ValueError("Year not supported")
 
-        papers_metadata: list[dict[str, str]] = []
-        for issue_file in self.html_files[self.year]:
-            issue_file_path = f"{self.html_file_path}/{issue_file}"
-            papers_metadata.extend(self._parse_issue(issue_file_path))
-        return papers_metadata
+        return [
+            f"{self.html_file_path}/{issue_file}"
+            for issue_file in self.html_files[self.year]
+        ]
+
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield papers issue file by issue file for the selected year."""
+        yield from parallel.parse_files(
+            self._parse_issue, self.input_files(), self.workers
+        )
+
+    def parse(self) -> list[Paper]:
+        """Parse all JAIR issue files for the selected year."""
+        return list(self.iter_papers())
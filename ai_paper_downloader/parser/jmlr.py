@@ -1,17 +1,25 @@
 #!/usr/bin/env python
 
-from bs4 import BeautifulSoup
+from collections.abc import Iterator
+
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper, intern_category
+from ai_paper_downloader.parser.soup import make_soup
+
 JMLR_BASE_URL = "https://jmlr.org"
+# The volume heading and the paper entries.
+PAPER_STRAINER = SoupStrainer(["h1", "dl"])
 
 
 class JMLRParser:
     """Parse JMLR volume HTML files into normalized paper metadata."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(self, html_file_path: str, year: str, backend: str | None = None):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.backend = backend
 
     def _extract_category(self, soup: BeautifulSoup) -> str:
         """Extract the volume label from the top-level heading."""
@@ -28,13 +36,16 @@ class JMLRParser:
             return f"{JMLR_BASE_URL}{href}"
         return f"{JMLR_BASE_URL}/{href}"
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse JMLR HTML into paper metadata records."""
+    def input_files(self) -> list[str]:
+        """Return the HTML files this parser reads."""
+        return [self.html_file_path]
+
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield paper metadata records from JMLR HTML."""
         with open(self.html_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, PAPER_STRAINER)
 
-        category = self._extract_category(soup)
-        papers_metadata: list[dict[str, str]] = []
+        category = intern_category(self._extract_category(soup))
 
         for paper in soup.find_all("dl"):
             paper_tag = paper if isinstance(paper, Tag) else None
@@ -66,13 +77,13 @@ class JMLRParser:
             if not pdf_url:
                 continue
 
-            papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": category,
-                    "pdf_url": pdf_url,
-                }
+            yield Paper(
+                title=title,
+                authors=authors,
+                category=category,
+                pdf_url=pdf_url,
             )
 
-        return papers_metadata
+    def parse(self) -> list[Paper]:
+        """Parse JMLR HTML into a list of paper metadata records."""
+        return list(self.iter_papers())
@@ -1,15 +1,24 @@
 #!/usr/bin/env python
 
-from bs4 import BeautifulSoup
+from collections.abc import Iterator
+
+from bs4 import SoupStrainer
 from bs4.element import Tag
 
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser.soup import make_soup
+
+# Papers are read from list items only, so nothing else is built.
+PAPER_STRAINER = SoupStrainer("li")
+
 
 class NeurIPSParser:
     """Parse NeurIPS proceedings HTML into normalized paper metadata."""
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(self, html_file_path: str, year: str, backend: str | None = None):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.backend = backend
         self.base_url = "https://proceedings.neurips.cc"
 
     def _build_pdf_url(self, relative_url: str) -> str:
@@ -38,12 +47,16 @@ class NeurIPSParser:
 
         return authors_tag.text.strip() if authors_tag else "Unknown"
 
-    def parse(self) -> list[dict[str, str]]:
+    def input_files(self) -> list[str]:
+        """Return the HTML files this parser reads."""
+        return [self.html_file_path]
+
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield main-track paper metadata records from NeurIPS HTML."""
         with open(self.html_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+            soup = make_soup(file, self.backend, PAPER_STRAINER)
 
         papers = soup.find_all("a", title="paper title")
-        papers_metadata: list[dict[str, str]] = []
 
         for paper in papers:
             if not isinstance(paper, Tag):
@@ -60,13 +73,13 @@ class NeurIPSParser:
             authors = self._extract_authors(parent_li)
             pdf_url = self._build_pdf_url(str(paper["href"]))
 
-            papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": "conference",
-                    "pdf_url": pdf_url,
-                }
+            yield Paper(
+                title=title,
+                authors=authors,
+                category="conference",
+                pdf_url=pdf_url,
             )
 
-        return papers_metadata
+    def parse(self) -> list[Paper]:
+        """Parse NeurIPS proceedings HTML into a list of paper metadata records."""
+        return list(self.iter_papers())
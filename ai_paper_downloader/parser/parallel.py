@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+PathT = TypeVar("PathT")
+ItemT = TypeVar("ItemT")
+
+
+def resolve_workers(workers: int) -> int:
+    """Return the number of parse processes, using every core for 0."""
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def parse_files(
+    parse_file: Callable[[PathT], list[ItemT]],
+    paths: Sequence[PathT],
+    workers: int = 1,
+) -> Iterator[ItemT]:
+    """Parse files in a process pool, yielding their items in file order.
+
+    HTML parsing is CPU-bound, so files are spread over ``workers``
+    processes rather than threads. ``parse_file`` must be picklable, e.g. a
+    module-level function or a method of a picklable parser. Items are
+    still yielded file by file in the order of ``paths``.
+    """
+    workers = min(resolve_workers(workers), len(paths))
+    if workers <= 1:
+        for path in paths:
+            yield from parse_file(path)
+        return
+
+    # Spawned workers are safe to start from the parse prefetch thread,
+    # unlike forked ones.
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        for papers in executor.map(parse_file, paths):
+            yield from papers
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+import importlib
+from typing import Any
+
+# Conference -> (module, class). Modules are imported only when selected, so
+# e.g. a JMLR run never loads openreview and yaml for the ICLR parser.
+PARSERS: dict[str, tuple[str, str]] = {
+    "AAAI": ("ai_paper_downloader.parser.aaai", "AAAIParser"),
+    "DMLR": ("ai_paper_downloader.parser.dmlr", "DMLRParser"),
+    "ICLR": ("ai_paper_downloader.parser.iclr", "ICLRParser"),
+    "ICML": ("ai_paper_downloader.parser.icml", "ICMLParser"),
+    "IJCAI": ("ai_paper_downloader.parser.ijcai", "IJCAIParser"),
+    "JAIR": ("ai_paper_downloader.parser.jair", "JAIRParser"),
+    "JMLR": ("ai_paper_downloader.parser.jmlr", "JMLRParser"),
+    "NeurIPS": ("ai_paper_downloader.parser.neurips", "NeurIPSParser"),
+    "TMLR": ("ai_paper_downloader.parser.tmlr", "TMLRParser"),
+}
+# Venues read from a directory of HTML files, parsed in a process pool.
+MULTI_FILE_PARSERS = frozenset({"AAAI", "DMLR", "JAIR"})
+# Venues read from a directory holding one listing file.
+DIRECTORY_PARSERS = frozenset({"TMLR"})
+# Venues that may fetch papers from OpenReview.
+OPENREVIEW_PARSERS = frozenset({"ICLR"})
+STATIC_HTML_DIR = "static_html"
+
+
+def parser_class(conference: str) -> type:
+    """Import and return the parser class registered for ``conference``."""
+    module_name, class_name = PARSERS[conference]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_parser(
+    conference: str,
+    year: str,
+    parse_workers: int = 1,
+    html_backend: str | None = None,
+    openreview_cache: Any = None,
+) -> Any:
+    """Create the conference-specific parser instance for the requested year.
+
+    ``openreview_cache`` is passed only to parsers that query OpenReview.
+    """
+    cls = parser_class(conference)
+    if conference in MULTI_FILE_PARSERS:
+        return cls(f"{STATIC_HTML_DIR}/{conference}", year, parse_workers, html_backend)
+    if conference in DIRECTORY_PARSERS:
+        return cls(f"{STATIC_HTML_DIR}/{conference}", year, html_backend)
+    html_file_path = f"{STATIC_HTML_DIR}/{conference}/{year}.html"
+    if conference in OPENREVIEW_PARSERS:
+        return cls(html_file_path, year, html_backend, openreview_cache)
+    return cls(html_file_path, year, html_backend)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+import logging
+from collections.abc import Callable
+from typing import IO
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+logger = logging.getLogger(__name__)
+
+# BeautifulSoup tree builders the parsers are tested against, fastest last.
+HTML_BACKENDS = ("html.parser", "lxml")
+BACKEND_CHOICES = ("auto", *HTML_BACKENDS)
+DEFAULT_BACKEND = "html.parser"
+
+
+def backend_available(backend: str) -> bool:
+    """Return whether BeautifulSoup could load the tree builder."""
+    return builder_registry.lookup(backend) is not None
+
+
+def resolve_backend(backend: str) -> str:
+    """Map a ``--html-backend`` choice to an installed tree builder.
+
+    ``auto`` picks lxml when it is installed. An explicitly requested
+    backend that is missing falls back to ``html.parser`` with a warning.
+    """
+    if backend == "auto":
+        return "lxml" if backend_available("lxml") else DEFAULT_BACKEND
+    if not backend_available(backend):
+        logger.warning(
+            "HTML backend %s is not installed, using %s", backend, DEFAULT_BACKEND
+        )
+        return DEFAULT_BACKEND
+    return backend
+
+
+def backend_name(backend: str | None) -> str:
+    """Return the tree builder ``make_soup`` uses for ``backend``."""
+    return backend or DEFAULT_BACKEND
+
+
+def has_class(*names: str) -> Callable[[str | None], bool]:
+    """Match a class attribute containing any of ``names``, for SoupStrainer.
+
+    While a document is being built the class attribute is still one
+    unsplit string, so ``SoupStrainer(class_="item")`` would miss
+    ``class="item new"``. This matcher compares whitespace-separated tokens.
+    """
+    wanted = frozenset(names)
+
+    def matches(value: str | None) -> bool:
+        return value is not None and not wanted.isdisjoint(value.split())
+
+    return matches
+
+
+def make_soup(
+    markup: IO[str] | str,
+    backend: str | None = None,
+    parse_only: SoupStrainer | None = None,
+) -> BeautifulSoup:
+    """Parse ``markup`` with ``backend``, or the default tree builder.
+
+    ``parse_only`` limits the tree to the elements a parser reads, which
+    keeps large proceedings pages from being materialized in full.
+    """
+    return BeautifulSoup(markup, backend_name(backend), parse_only=parse_only)
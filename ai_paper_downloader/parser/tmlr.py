@@ -2,19 +2,30 @@
 
 import os
 import re
+from collections.abc import Iterator
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from bs4.element import NavigableString, Tag
 
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser import year_index
+from ai_paper_downloader.parser.soup import backend_name, has_class, make_soup
+
 YEAR_REGEX = re.compile(r"\b(19|20)\d{2}\b")
+PAPER_STRAINER = SoupStrainer("li", class_=has_class("item"))
 
 
 class TMLRParser:
-    """Parse TMLR accepted-paper listings and filter by requested year."""
+    """Parse TMLR accepted-paper listings and filter by requested year.
+
+    The listing holds every year, so it is parsed once per process into a
+    year index shared by all TMLR parsers reading the same file.
+    """
 
-    def __init__(self, html_file_path: str, year: str):
+    def __init__(self, html_file_path: str, year: str, backend: str | None = None):
         self.html_file_path = html_file_path
         self.year = int(year)
+        self.backend = backend
 
     def _resolve_html_file_path(self) -> str:
         """Resolve the source HTML path from a file or known directory layout."""
@@ -50,13 +61,14 @@ class TMLRParser:
 
         return None
 
-    def parse(self) -> list[dict[str, str]]:
-        """Parse TMLR HTML and return papers for the requested year only."""
-        source_file_path = self._resolve_html_file_path()
-        with open(source_file_path, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+    def input_files(self) -> list[str]:
+        """Return the HTML file this parser reads."""
+        return [self._resolve_html_file_path()]
 
-        papers_metadata: list[dict[str, str]] = []
+    def _paper_rows(self, source_file_path: str) -> Iterator[tuple[int, Paper]]:
+        """Yield the year and record of every dated paper in the listing."""
+        with open(source_file_path, "r", encoding="utf-8") as file:
+            soup = make_soup(file, self.backend, PAPER_STRAINER)
 
         for item in soup.find_all("li", class_="item"):
             item_tag = item if isinstance(item, Tag) else None
@@ -79,7 +91,7 @@ class TMLRParser:
             authors = authors_tag.get_text(" ", strip=True)
 
             paper_year = self._extract_year(paragraph_tag, authors_tag)
-            if paper_year != self.year:
+            if paper_year is None:
                 continue
 
             pdf_url = None
@@ -94,13 +106,29 @@ class TMLRParser:
             if not pdf_url:
                 continue
 
-            papers_metadata.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "category": "",
-                    "pdf_url": pdf_url,
-                }
+            yield paper_year, Paper(
+                title=title,
+                authors=authors,
+                category="",
+                pdf_url=pdf_url,
             )
 
-        return papers_metadata
+    def papers_by_year(self) -> year_index.YearIndex:
+        """Return the papers of every year, parsing the listing once."""
+        source_file_path = self._resolve_html_file_path()
+        key = (
+            type(self).__qualname__,
+            backend_name(self.backend),
+            year_index.file_identity([source_file_path]),
+        )
+        return year_index.cached(
+            key, lambda: year_index.partition(self._paper_rows(source_file_path))
+        )
+
+    def iter_papers(self) -> Iterator[Paper]:
+        """Yield TMLR papers for the requested year only."""
+        yield from self.papers_by_year().get(self.year, ())
+
+    def parse(self) -> list[Paper]:
+        """Parse TMLR HTML into a list of papers for the requested year."""
+        return list(self.iter_papers())
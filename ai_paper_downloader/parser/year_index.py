@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+
+from ai_paper_downloader.paper import Paper
+
+YearIndex = dict[int, tuple[Paper, ...]]
+
+# Year indexes kept per process, least recently used dropped first.
+MAX_INDEXES = 8
+_indexes: OrderedDict[Hashable, YearIndex] = OrderedDict()
+_lock = threading.Lock()
+
+
+def partition(rows: Iterable[tuple[int | None, Paper]]) -> YearIndex:
+    """Group papers by year in document order, dropping undated papers."""
+    by_year: dict[int, list[Paper]] = {}
+    for year, paper in rows:
+        if year is not None:
+            by_year.setdefault(year, []).append(paper)
+    return {year: tuple(papers) for year, papers in by_year.items()}
+
+
+def file_identity(paths: Iterable[str | os.PathLike[str]]) -> tuple:
+    """Return the path, size and mtime of each file, to detect edits."""
+    identity = []
+    for path in paths:
+        stat = os.stat(path)
+        identity.append((os.fspath(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(identity)
+
+
+def cached(key: Hashable, build: Callable[[], YearIndex]) -> YearIndex:
+    """Return the index stored under ``key``, building it on first use.
+
+    Parsers of all-years sources key the index by their input files, so
+    every year requested in one process shares a single parse.
+    """
+    with _lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = build()
+            _indexes[key] = index
+            if len(_indexes) > MAX_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
+
+
+def clear() -> None:
+    """Drop every cached index."""
+    with _lock:
+        _indexes.clear()
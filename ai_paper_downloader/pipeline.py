@@ -0,0 +1,62 @@
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TypeVar, cast
+
+T = TypeVar("T")
+
+# Parsed papers buffered ahead of the download scheduler.
+PREFETCH_SIZE = 256
+_PUT_TIMEOUT = 0.1
+_DONE = object()
+
+
+class _ProducerError:
+    """Exception raised by the producer, passed through the queue."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(items: Iterable[T], maxsize: int = PREFETCH_SIZE) -> Iterator[T]:
+    """Iterate ``items`` on a background thread through a bounded queue.
+
+    The producer runs at most ``maxsize`` items ahead of the consumer, so
+    memory stays flat however long ``items`` is. Exceptions raised by the
+    producer are re-raised in the consumer. Closing the returned generator
+    (or abandoning it early) stops the producer at its next item.
+    """
+    buffer: queue.Queue[object] = queue.Queue(maxsize=max(1, maxsize))
+    stopped = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as error:
+            put(_ProducerError(error))
+        else:
+            put(_DONE)
+
+    producer = threading.Thread(target=produce, name="parse-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield cast(T, item)
+    finally:
+        stopped.set()
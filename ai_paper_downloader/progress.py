@@ -0,0 +1,202 @@
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from types import TracebackType
+
+from ai_paper_downloader import logs
+
+logger = logging.getLogger(__name__)
+
+# Seconds of recent downloads the throughput and ETA are computed over.
+THROUGHPUT_WINDOW = 20.0
+# Seconds between redraws of the live status line on a terminal.
+REFRESH_INTERVAL = 0.5
+# Default seconds between status summaries when output is not a terminal.
+STATUS_INTERVAL = 30.0
+
+
+def format_duration(seconds: float) -> str:
+    """Return ``seconds`` as a compact duration such as ``1h02m`` or ``3m05s``."""
+    seconds = max(0, round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{seconds:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressReporter:
+    """Track download throughput, in-flight work, retries and failures.
+
+    Worker threads call ``started``/``finished`` around every attempt; the
+    result callbacks call ``downloaded``, ``failed`` and ``retried``. Papers
+    and bytes per second cover the last ``window`` seconds, so the status
+    reflects the current rate rather than the run average. While the
+    reporter is entered, a thread logs a status record every ``interval``
+    seconds: a single redrawn line on a terminal, a periodic summary
+    elsewhere. The line is erased on exit, which also fixes the elapsed
+    time of the final report. An interval of 0 disables the status records.
+    """
+
+    def __init__(
+        self,
+        total: int | None,
+        interval: float,
+        window: float = THROUGHPUT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total = total
+        self.interval = interval
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._recent: deque[tuple[float, int]] = deque()
+        self._started_at = clock()
+        self._finished_at: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.papers = 0
+        self.num_bytes = 0
+        self.retries = 0
+        self.failures = 0
+
+    def started(self) -> None:
+        """Count one download attempt as in flight."""
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        """Count one download attempt as no longer in flight."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def downloaded(self, num_bytes: int) -> None:
+        """Record one completed download of ``num_bytes``."""
+        with self._lock:
+            self.papers += 1
+            self.num_bytes += num_bytes
+            self._recent.append((self._clock(), num_bytes))
+
+    def failed(self) -> None:
+        """Record one download that failed for good."""
+        with self._lock:
+            self.failures += 1
+
+    def retried(self) -> None:
+        """Record one attempt that will be retried."""
+        with self._lock:
+            self.retries += 1
+
+    def rates(self) -> tuple[float, float]:
+        """Return papers and bytes per second over the sliding window."""
+        now = self._clock()
+        with self._lock:
+            while self._recent and self._recent[0][0] <= now - self.window:
+                self._recent.popleft()
+            span = min(self.window, now - self._started_at)
+            if span <= 0:
+                return 0.0, 0.0
+            received = sum(num_bytes for _, num_bytes in self._recent)
+            return len(self._recent) / span, received / span
+
+    def eta(self, papers_per_second: float) -> float | None:
+        """Return the seconds left at ``papers_per_second``, None if unknown."""
+        if self.total is None or papers_per_second <= 0:
+            return None
+        remaining = max(0, self.total - self.papers - self.failures)
+        return remaining / papers_per_second
+
+    def status(self) -> str:
+        """Return the one-line status of the downloads so far."""
+        papers_per_second, bytes_per_second = self.rates()
+        total = "?" if self.total is None else self.total
+        eta = self.eta(papers_per_second)
+        return (
+            f"{self.papers}/{total} papers | {papers_per_second:.1f} papers/s | "
+            f"{bytes_per_second / 1e6:.1f} MB/s | in flight {self.in_flight} | "
+            f"retries {self.retries} | failures {self.failures} | "
+            f"ETA {'?' if eta is None else format_duration(eta)}"
+        )
+
+    def log_status(self) -> None:
+        """Log the current status as a status record."""
+        papers_per_second, bytes_per_second = self.rates()
+        logger.info(
+            "%s",
+            self.status(),
+            extra=logs.status(
+                papers=self.papers,
+                total=self.total,
+                papers_per_second=round(papers_per_second, 2),
+                bytes_per_second=round(bytes_per_second),
+                in_flight=self.in_flight,
+                retries=self.retries,
+                failures=self.failures,
+            ),
+        )
+
+    def log_report(self) -> None:
+        """Log the final throughput report of the whole run."""
+        finished_at = self._clock() if self._finished_at is None else self._finished_at
+        elapsed = finished_at - self._started_at
+        attempted = self.papers + self.failures
+        failure_rate = 100 * self.failures / attempted if attempted else 0.0
+        papers_per_second = self.papers / elapsed if elapsed > 0 else 0.0
+        bytes_per_second = self.num_bytes / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            "Downloaded: %d papers, %.1f MB in %s (%.1f papers/s, %.1f MB/s)",
+            self.papers,
+            self.num_bytes / 1e6,
+            format_duration(elapsed),
+            papers_per_second,
+            bytes_per_second / 1e6,
+            extra=logs.fields(
+                papers=self.papers,
+                bytes=self.num_bytes,
+                seconds=round(elapsed, 3),
+            ),
+        )
+        logger.info(
+            "Retries: %d Failures: %d (%.1f%%) Peak In Flight: %d",
+            self.retries,
+            self.failures,
+            failure_rate,
+            self.peak_in_flight,
+            extra=logs.fields(
+                retries=self.retries,
+                failures=self.failures,
+                peak_in_flight=self.peak_in_flight,
+            ),
+        )
+
+    def _tick(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.log_status()
+
+    def __enter__(self) -> "ProgressReporter":
+        self._started_at = self._clock()
+        if self.interval > 0:
+            self._thread = threading.Thread(
+                target=self._tick, name="progress", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._finished_at = self._clock()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            logger.info("", extra=logs.status())
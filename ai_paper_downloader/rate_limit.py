@@ -0,0 +1,145 @@
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urlsplit
+
+# Default (requests per second, burst) per conference when no rate is given.
+CONFERENCE_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "AAAI": (4.0, 8),
+    "ICLR": (2.0, 4),
+    "TMLR": (2.0, 4),
+}
+
+
+def url_host(url: str) -> str:
+    """Return the lowercase network location of a URL."""
+    return urlsplit(url).netloc.lower()
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers until a token is free."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def tighten(self, rate: float, burst: int) -> None:
+        """Lower the rate and burst to ``rate`` and ``burst`` if they are smaller."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.rate, rate)
+            self.burst = min(self.burst, max(1, burst))
+            self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return the wait."""
+        with self._lock:
+            self._refill()
+            # Reserve the token now so concurrent callers queue up behind us.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def try_acquire(self) -> float:
+        """Take one token if it is free and return 0, else the wait for one.
+
+        Unlike ``acquire`` this never sleeps or reserves a token, so a
+        scheduler can start other work until the returned delay has passed.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class HostRateLimiter:
+    """Keep one token bucket per URL host, created on first use.
+
+    Limiters made with ``shared`` use the same buckets with their own rate.
+    A host's bucket runs at the lowest rate and burst of all the limiters
+    that have used it, so targets on one host never add up past its limit.
+    A limiter without a rate still waits on a bucket that others created.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def shared(self, rate: float | None, burst: int = 1) -> "HostRateLimiter":
+        """Return a limiter with its own rate that shares these buckets."""
+        limiter = HostRateLimiter(rate, burst, self._clock, self._sleep)
+        limiter._buckets = self._buckets
+        limiter._lock = self._lock
+        return limiter
+
+    def _bucket(self, url: str) -> TokenBucket | None:
+        host = url_host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if self.rate is None:
+                return bucket
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst, self._clock, self._sleep)
+                self._buckets[host] = bucket
+            elif bucket.rate > self.rate or bucket.burst > self.burst:
+                bucket.tighten(self.rate, self.burst)
+        return bucket
+
+    def acquire(self, url: str) -> float:
+        """Wait for the bucket of ``url``'s host; unlimited if it has none."""
+        bucket = self._bucket(url)
+        return 0.0 if bucket is None else bucket.acquire()
+
+    def try_acquire(self, url: str) -> float:
+        """Take a token of ``url``'s host without waiting; see ``TokenBucket``."""
+        bucket = self._bucket(url)
+        return 0.0 if bucket is None else bucket.try_acquire()
+
+
+def resolve_rate_limit(
+    conference: str,
+    rate_limit: float | None,
+    burst: int | None,
+    seconds_between_downloads: float,
+) -> tuple[float | None, int]:
+    """Pick the (rate, burst) for a run from CLI flags and conference defaults."""
+    if rate_limit is not None:
+        return (rate_limit if rate_limit > 0 else None), burst or 1
+    if seconds_between_downloads > 0:
+        return 1 / seconds_between_downloads, burst or 1
+
+    default_rate, default_burst = CONFERENCE_RATE_LIMITS.get(conference, (None, 1))
+    return default_rate, burst or default_burst
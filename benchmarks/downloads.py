@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+"""Benchmark the download pipeline against a local stand-in PDF server.
+
+Run from the repository root; arguments after ``--`` go to the downloader:
+
+    uv run python -m benchmarks.downloads --papers 500 --latency-ms 50 \
+        -- --workers 8
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from ai_paper_downloader import downloader, main_entry
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser import registry
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PDF_HEADER = b"%PDF-1.4\n"
+
+
+class ServerConfig:
+    """Behaviour of the stand-in server, shared with its process."""
+
+    def __init__(
+        self,
+        size_kb: int = 256,
+        latency_ms: float = 20,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        self.size_kb = size_kb
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.seed = seed
+
+
+def _make_handler(
+    config: ServerConfig, statuses: Counter[int]
+) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler serving synthetic PDFs per ``config``."""
+    body = PDF_HEADER + b"0" * max(0, config.size_kb * 1024 - len(PDF_HEADER))
+    rng = random.Random(config.seed)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            with lock:
+                roll = rng.random()
+            time.sleep(config.latency_ms / 1000)
+
+            if roll < config.throttle_rate:
+                status = 429
+            elif roll < config.throttle_rate + config.error_rate:
+                status = 500
+            else:
+                status = 200
+            with lock:
+                statuses[status] += 1
+
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", str(config.retry_after))
+            payload = body if status == 200 else b""
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            del format, args
+
+    return Handler
+
+
+def _serve(config: ServerConfig, ready: Any, stop: Any, report: Any) -> None:
+    """Serve until ``stop`` is set, then report the status counts."""
+    statuses: Counter[int] = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(config, statuses))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    ready.put(server.server_address[1])
+    stop.wait()
+    server.shutdown()
+    server.server_close()
+    report.put(dict(statuses))
+
+
+@contextlib.contextmanager
+def stand_in_server(config: ServerConfig) -> Iterator[tuple[str, dict[int, int]]]:
+    """Run the server in its own process and yield its base URL.
+
+    The process keeps the server's CPU time out of the benchmarked
+    process. Once the block exits, the yielded dict holds the number of
+    responses sent per HTTP status.
+    """
+    context = multiprocessing.get_context("spawn")
+    ready, report = context.Queue(), context.Queue()
+    stop = context.Event()
+    process = context.Process(target=_serve, args=(config, ready, stop, report))
+    process.start()
+    statuses: dict[int, int] = {}
+    try:
+        port = ready.get(timeout=30)
+        yield f"http://127.0.0.1:{port}", statuses
+    finally:
+        stop.set()
+        with contextlib.suppress(Exception):
+            statuses.update(report.get(timeout=10))
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+
+
+class _RewrittenParser:
+    """Parser stand-in yielding papers already pointed at the local server."""
+
+    def __init__(self, papers: list[Paper]):
+        self.papers = papers
+
+    def input_files(self) -> None:
+        return None
+
+    def iter_papers(self) -> Iterator[Paper]:
+        yield from self.papers
+
+
+def rewritten_papers(
+    conference: str, year: str, base_url: str, limit: int
+) -> list[Paper]:
+    """Parse a venue/year and point each paper's PDF URL at ``base_url``."""
+    parser = registry.create_parser(conference, year)
+    papers = []
+    for index, paper in enumerate(parser.iter_papers()):
+        if index >= limit:
+            break
+        papers.append(paper._replace(pdf_url=f"{base_url}/{index}.pdf"))
+    return papers
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of ``values``."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run(
+    conference: str,
+    year: str,
+    papers: int,
+    config: ServerConfig,
+    cli_args: Sequence[str] = (),
+) -> dict[str, Any]:
+    """Download ``papers`` PDFs of a venue/year from the stand-in server.
+
+    ``main_entry.main()`` runs unchanged except that the parser yields the
+    rewritten papers and every ``download_pdf`` call is timed. The
+    downloader's own rate limits are disabled unless ``cli_args`` set one.
+    """
+    latencies: list[float] = []
+    received = 0
+    lock = threading.Lock()
+    download_pdf = downloader.download_pdf
+
+    def timed_download_pdf(*args: Any, **kwargs: Any) -> downloader.DownloadResult:
+        nonlocal received
+        started = time.perf_counter()
+        result = download_pdf(*args, **kwargs)
+        with lock:
+            latencies.append(time.perf_counter() - started)
+            received += result.num_bytes
+        return result
+
+    with (
+        stand_in_server(config) as (base_url, statuses),
+        tempfile.TemporaryDirectory() as save_dir,
+    ):
+        parsed = rewritten_papers(conference, year, base_url, papers)
+        argv = [
+            "download_papers.py",
+            "--conference",
+            conference,
+            "--year",
+            year,
+            "--save-dir",
+            save_dir,
+            "--rate-limit",
+            "0",
+            *cli_args,
+        ]
+        with (
+            mock.patch.object(
+                registry, "create_parser", lambda *_args: _RewrittenParser(parsed)
+            ),
+            mock.patch.object(downloader, "download_pdf", timed_download_pdf),
+            mock.patch.object(sys, "argv", argv),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            cpu_started = _cpu_seconds()
+            started = time.perf_counter()
+            main_entry.main()
+            elapsed = time.perf_counter() - started
+            cpu = _cpu_seconds() - cpu_started
+
+    downloaded = len(latencies)
+    return {
+        "papers": len(parsed),
+        "downloaded": downloaded,
+        "seconds": round(elapsed, 3),
+        "papers_per_second": round(downloaded / elapsed, 1),
+        "mb_per_second": round(received / elapsed / 1e6, 2),
+        "p50_latency_ms": _milliseconds(_percentile(latencies, 0.50)),
+        "p99_latency_ms": _milliseconds(_percentile(latencies, 0.99)),
+        "cpu_percent": round(100 * cpu / elapsed, 1),
+        "server_statuses": {str(code): count for code, count in statuses.items()},
+    }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the CLI parser of the benchmark harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--conference",
+        help="Venue whose parsed papers are downloaded",
+        choices=sorted(registry.PARSERS),
+        default="JMLR",
+    )
+    parser.add_argument(
+        "--year", help="Year whose parsed papers are downloaded", default="2024"
+    )
+    parser.add_argument(
+        "--papers", help="Number of papers to download", type=int, default=200
+    )
+    parser.add_argument(
+        "--size-kb", help="Size of every synthetic PDF", type=int, default=256
+    )
+    parser.add_argument(
+        "--latency-ms",
+        help="Delay before the server answers each request",
+        type=float,
+        default=20,
+    )
+    parser.add_argument(
+        "--error-rate",
+        help="Fraction of requests answered with 500",
+        type=float,
+        default=0.0,
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        help="Fraction of requests answered with 429",
+        type=float,
+        default=0.0,
+    )
+    parser.add_argument(
+        "--retry-after",
+        help="Whole Retry-After seconds sent with every 429",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--seed", help="Seed of the error and 429 rolls", type=int, default=0
+    )
+    parser.add_argument("--json", help="Print the report as JSON", action="store_true")
+    parser.add_argument(
+        "cli_args",
+        help="Downloader arguments, after --",
+        nargs=argparse.REMAINDER,
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the download benchmark and print its report."""
+    args = _build_parser().parse_args(argv)
+    cli_args = args.cli_args[1:] if args.cli_args[:1] == ["--"] else args.cli_args
+    os.chdir(REPO_ROOT)
+    report = run(
+        args.conference,
+        args.year,
+        args.papers,
+        ServerConfig(
+            args.size_kb,
+            args.latency_ms,
+            args.error_rate,
+            args.throttle_rate,
+            args.retry_after,
+            args.seed,
+        ),
+        cli_args,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, value in report.items():
+            print(f"{name}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
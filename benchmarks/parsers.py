@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+"""Time and memory-profile every parser over the bundled static_html corpus.
+
+Run from the repository root:
+
+    uv run python -m benchmarks.parsers --save-baseline  # record a baseline
+    uv run python -m benchmarks.parsers                  # compare to baseline
+
+Timings only compare within one machine, so baselines are local files in
+``benchmarks/baselines/`` and are not committed.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ai_paper_downloader import command_args
+from ai_paper_downloader.parser import registry, soup, year_index
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BASELINE_DIR = REPO_ROOT / "benchmarks" / "baselines"
+# Allowed slowdown and peak RSS growth over the baseline, as fractions.
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.20
+# Slowdowns below this many seconds are timer noise on small files.
+TIME_SLACK_SECONDS = 0.05
+# Errors of venue/years with no bundled HTML or no static parser.
+SKIPPED_ERRORS = (FileNotFoundError, KeyError, ValueError)
+
+
+def baseline_path(backend: str) -> Path:
+    """Return the default baseline file of an HTML backend."""
+    return BASELINE_DIR / f"parsers-{backend}.json"
+
+
+def measure(
+    conference: str, year: str, backend: str, repeat: int = 3
+) -> dict[str, Any] | None:
+    """Parse one venue/year ``repeat`` times and return its best timing.
+
+    Returns None when the venue/year has no bundled HTML. Peak RSS is that
+    of the calling process, so run each target in a fresh process.
+    """
+    parser = registry.create_parser(conference, year, 1, backend)
+    try:
+        if parser.input_files() is None:
+            return None
+    except SKIPPED_ERRORS:
+        return None
+
+    best = float("inf")
+    papers = 0
+    for _ in range(max(1, repeat)):
+        # Year-indexed parsers would otherwise reuse the first parse.
+        year_index.clear()
+        started = time.perf_counter()
+        try:
+            papers = len(parser.parse())
+        except SKIPPED_ERRORS:
+            return None
+        best = min(best, time.perf_counter() - started)
+
+    return {
+        "papers": papers,
+        "seconds": round(best, 4),
+        "papers_per_second": round(papers / best, 1) if best > 0 else None,
+        # ru_maxrss is in kilobytes on Linux.
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def _measure_in_child(target: tuple[str, str, str, int]) -> dict[str, Any] | None:
+    os.chdir(REPO_ROOT)
+    return measure(*target)
+
+
+def run(
+    conferences: Sequence[str],
+    years: Sequence[str],
+    backend: str,
+    repeat: int = 3,
+) -> dict[str, dict[str, Any]]:
+    """Measure every venue/year, one fresh process at a time."""
+    results: dict[str, dict[str, Any]] = {}
+    # One task per process keeps each peak RSS to a single target, and
+    # running them one at a time keeps timings free of contention.
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        for conference in conferences:
+            for year in sorted(years):
+                target = (conference, year, backend, repeat)
+                result = executor.submit(_measure_in_child, target).result()
+                if result is None:
+                    continue
+                results[f"{conference}-{year}"] = result
+                print(
+                    f"{conference} {year}: {result['papers']} papers in "
+                    f"{result['seconds']:.3f}s ({result['papers_per_second']}/s), "
+                    f"peak RSS {result['peak_rss_kb'] / 1024:.0f} MB"
+                )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    time_threshold: float = TIME_THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD,
+) -> list[str]:
+    """Return a description of every regression against ``baseline``.
+
+    A target regresses when it finds a different number of papers, or when
+    its time or peak RSS grows by more than the threshold; slowdowns under
+    ``TIME_SLACK_SECONDS`` are ignored. Targets missing from either side
+    are not compared.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["papers"] != base["papers"]:
+            regressions.append(
+                f"{name}: {result['papers']} papers, baseline {base['papers']}"
+            )
+        allowed_seconds = max(
+            base["seconds"] * (1 + time_threshold),
+            base["seconds"] + TIME_SLACK_SECONDS,
+        )
+        if result["seconds"] > allowed_seconds:
+            regressions.append(
+                f"{name}: {result['seconds']:.3f}s, baseline {base['seconds']:.3f}s"
+            )
+        if result["peak_rss_kb"] > base["peak_rss_kb"] * (1 + memory_threshold):
+            regressions.append(
+                f"{name}: peak RSS {result['peak_rss_kb']} KB, "
+                f"baseline {base['peak_rss_kb']} KB"
+            )
+    return regressions
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the CLI parser of the benchmark runner."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--conference",
+        dest="conferences",
+        help="Benchmark only this conference; may be repeated",
+        choices=sorted(registry.PARSERS),
+        action="append",
+    )
+    parser.add_argument(
+        "--year",
+        dest="years",
+        help="Benchmark only this year; may be repeated",
+        choices=command_args.YEAR_CHOICES,
+        action="append",
+    )
+    parser.add_argument(
+        "--html-backend",
+        dest="html_backend",
+        help="The HTML parser backend to benchmark",
+        default="html.parser",
+        choices=soup.BACKEND_CHOICES,
+    )
+    parser.add_argument(
+        "--repeat",
+        help="Parse each target this many times and keep the fastest",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Baseline JSON file (default: benchmarks/baselines/parsers-BACKEND.json)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        help="Write the results to the baseline file instead of comparing",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--time-threshold",
+        help="Allowed slowdown over the baseline, as a fraction",
+        type=float,
+        default=TIME_THRESHOLD,
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        help="Allowed peak RSS growth over the baseline, as a fraction",
+        type=float,
+        default=MEMORY_THRESHOLD,
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the parser benchmarks; return 1 if any target regressed.
+
+    Without a baseline the results are only reported.
+    """
+    args = _build_parser().parse_args(argv)
+    backend = soup.resolve_backend(args.html_backend)
+    results = run(
+        args.conferences or sorted(registry.PARSERS),
+        args.years or command_args.YEAR_CHOICES,
+        backend,
+        args.repeat,
+    )
+    path = Path(args.baseline) if args.baseline else baseline_path(backend)
+
+    if args.save_baseline:
+        baseline = {}
+        if path.exists():
+            baseline = json.loads(path.read_text(encoding="utf-8"))
+        baseline.update(results)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(dict(sorted(baseline.items())), indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"Saved {len(results)} results to {path}")
+        return 0
+
+    if not path.exists():
+        print(
+            f"{len(results)} targets; no baseline at {path} to compare with, "
+            "run with --save-baseline to record one on this machine"
+        )
+        return 0
+    regressions = compare(
+        results,
+        json.loads(path.read_text(encoding="utf-8")),
+        args.time_threshold,
+        args.memory_threshold,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(results)} targets, {len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,30 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+from ai_paper_downloader.parser import soup, year_index
+
+
+@pytest.fixture(
+    params=[
+        backend for backend in soup.HTML_BACKENDS if soup.backend_available(backend)
+    ]
+)
+def html_backend(request, monkeypatch):
+    """Run a parser test once per installed HTML backend."""
+    monkeypatch.setattr(soup, "DEFAULT_BACKEND", request.param)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def _clear_year_indexes():
+    """Keep parsers from reusing year indexes built by another test."""
+    year_index.clear()
+    yield
+    year_index.clear()
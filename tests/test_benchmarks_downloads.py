@@ -0,0 +1,47 @@
+import requests
+
+from benchmarks import downloads
+
+
+def test_stand_in_server_serves_pdfs_and_counts_statuses():
+    config = downloads.ServerConfig(size_kb=2, latency_ms=0)
+
+    with downloads.stand_in_server(config) as (base_url, statuses):
+        response = requests.get(f"{base_url}/0.pdf", timeout=10)
+
+    assert response.status_code == 200
+    assert response.content.startswith(downloads.PDF_HEADER)
+    assert len(response.content) == 2048
+    assert statuses == {200: 1}
+
+
+def test_stand_in_server_throttles_with_retry_after():
+    config = downloads.ServerConfig(latency_ms=0, throttle_rate=1.0, retry_after=3)
+
+    with downloads.stand_in_server(config) as (base_url, statuses):
+        response = requests.get(f"{base_url}/0.pdf", timeout=10)
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+    assert statuses == {429: 1}
+
+
+def test_run_downloads_rewritten_papers_and_reports_throughput(monkeypatch):
+    monkeypatch.chdir(downloads.REPO_ROOT)
+    config = downloads.ServerConfig(size_kb=4, latency_ms=0)
+
+    report = downloads.run("JMLR", "2014", 5, config, ["--workers", "2"])
+
+    assert report["papers"] == 5
+    assert report["downloaded"] == 5
+    assert report["server_statuses"] == {"200": 5}
+    assert report["papers_per_second"] > 0
+    assert report["p50_latency_ms"] <= report["p99_latency_ms"]
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert downloads._percentile(values, 0.50) == 50.0
+    assert downloads._percentile(values, 0.99) == 99.0
+    assert downloads._percentile([], 0.50) is None
@@ -0,0 +1,85 @@
+import json
+
+from benchmarks import parsers
+
+
+def _result(papers=10, seconds=1.0, peak_rss_kb=100_000):
+    return {
+        "papers": papers,
+        "seconds": seconds,
+        "papers_per_second": papers / seconds,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def test_compare_accepts_results_within_thresholds():
+    baseline = {"JMLR-2024": _result()}
+    results = {"JMLR-2024": _result(seconds=1.2, peak_rss_kb=110_000)}
+
+    assert parsers.compare(results, baseline) == []
+
+
+def test_compare_reports_slowdown_memory_growth_and_count_change():
+    baseline = {"JMLR-2024": _result()}
+    results = {"JMLR-2024": _result(papers=9, seconds=1.5, peak_rss_kb=130_000)}
+
+    regressions = parsers.compare(results, baseline)
+
+    assert len(regressions) == 3
+    assert all(regression.startswith("JMLR-2024:") for regression in regressions)
+
+
+def test_compare_ignores_timer_noise_and_unknown_targets():
+    baseline = {"JMLR-2014": _result(seconds=0.01)}
+    results = {
+        "JMLR-2014": _result(seconds=0.05),
+        "ICML-2024": _result(seconds=100.0),
+    }
+
+    assert parsers.compare(results, baseline) == []
+
+
+def test_measure_parses_bundled_html_and_skips_missing_years(monkeypatch):
+    monkeypatch.chdir(parsers.REPO_ROOT)
+    result = parsers.measure("JMLR", "2014", "html.parser", repeat=1)
+
+    assert result is not None
+    assert result["papers"] > 0
+    assert result["peak_rss_kb"] > 0
+    assert parsers.measure("ICLR", "2020", "html.parser", repeat=1) is None
+
+
+def test_main_fails_on_regression(tmp_path, monkeypatch, capsys):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"JMLR-2014": _result(seconds=0.1)}))
+    monkeypatch.setattr(
+        parsers, "run", lambda *_args: {"JMLR-2014": _result(seconds=1.0)}
+    )
+
+    status = parsers.main(["--baseline", str(baseline)])
+
+    assert status == 1
+    assert "REGRESSION JMLR-2014" in capsys.readouterr().out
+
+
+def test_main_without_baseline_only_reports(tmp_path, monkeypatch, capsys):
+    backends = []
+
+    def run(_conferences, _years, backend, _repeat):
+        backends.append(backend)
+        return {"JMLR-2014": _result()}
+
+    monkeypatch.setattr(parsers, "run", run)
+    monkeypatch.setattr(parsers, "BASELINE_DIR", tmp_path)
+
+    assert parsers.main([]) == 0
+    assert backends == ["html.parser"]
+    assert "no baseline at" in capsys.readouterr().out
+
+
+def test_main_saves_baseline(tmp_path, monkeypatch):
+    baseline = tmp_path / "baseline.json"
+    monkeypatch.setattr(parsers, "run", lambda *_args: {"JMLR-2014": _result()})
+
+    assert parsers.main(["--baseline", str(baseline), "--save-baseline"]) == 0
+    assert json.loads(baseline.read_text()) == {"JMLR-2014": _result()}
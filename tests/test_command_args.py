@@ -1,15 +1,41 @@
+import pytest
+
 from ai_paper_downloader import command_args
+from ai_paper_downloader.parser import soup
 
 
 def test_args_defaults():
     parsed = command_args.args(["--conference", "ICML", "--year", "2024"])
 
-    assert parsed.conference == "ICML"
-    assert parsed.year == "2024"
+    assert parsed.conferences == ("ICML",)
+    assert parsed.years == ("2024",)
     assert parsed.save_dir == "papers"
     assert parsed.num_papers_to_download == -1
     assert parsed.no_download_pdf is False
     assert parsed.seconds_between_downloads == 0
+    assert parsed.workers == 1
+    assert parsed.host_limits == []
+    assert parsed.connect_timeout == 10.0
+    assert parsed.read_timeout == 60.0
+    assert parsed.rate_limit is None
+    assert parsed.conference_rate_limits == {}
+    assert parsed.burst is None
+    assert parsed.parse_workers == 0
+    assert parsed.html_backend == "auto"
+    assert parsed.no_parse_cache is False
+    assert parsed.openreview_cache == "use"
+    assert parsed.log_level == "INFO"
+    assert parsed.log_format == "text"
+    assert parsed.progress_interval == 1.0
+    assert parsed.status_interval == 30.0
+
+
+def test_workers_flag_parses_int():
+    parsed = command_args.args(
+        ["--conference", "ICML", "--year", "2024", "--workers", "8"]
+    )
+
+    assert parsed.workers == 8
 
 
 def test_no_download_pdf_flag_sets_true():
@@ -23,23 +49,160 @@ def test_no_download_pdf_flag_sets_true():
 def test_jair_is_supported_conference_choice():
     parsed = command_args.args(["--conference", "JAIR", "--year", "2024"])
 
-    assert parsed.conference == "JAIR"
+    assert parsed.conferences == ("JAIR",)
 
 
 def test_jmlr_is_supported_conference_choice():
     parsed = command_args.args(["--conference", "JMLR", "--year", "2024"])
 
-    assert parsed.conference == "JMLR"
+    assert parsed.conferences == ("JMLR",)
 
 
 def test_tmlr_is_supported_conference_choice():
     parsed = command_args.args(["--conference", "TMLR", "--year", "2026"])
 
-    assert parsed.conference == "TMLR"
-    assert parsed.year == "2026"
+    assert parsed.conferences == ("TMLR",)
+    assert parsed.years == ("2026",)
 
 
 def test_dmlr_is_supported_conference_choice():
     parsed = command_args.args(["--conference", "DMLR", "--year", "2025"])
 
-    assert parsed.conference == "DMLR"
+    assert parsed.conferences == ("DMLR",)
+
+
+def test_host_limits_are_parsed_per_host():
+    parsed = command_args.args(
+        [
+            "--conference",
+            "AAAI",
+            "--year",
+            "2025",
+            "--host-limit",
+            "OJS.aaai.org=3",
+            "--host-limit",
+            "arxiv.org=1",
+        ]
+    )
+
+    assert parsed.host_limits == [("ojs.aaai.org", 3), ("arxiv.org", 1)]
+
+
+def test_host_limit_rejects_malformed_value():
+    with pytest.raises(SystemExit):
+        command_args.args(
+            ["--conference", "AAAI", "--year", "2025", "--host-limit", "arxiv.org"]
+        )
+
+
+def test_rate_limit_flags_accept_fractional_values():
+    parsed = command_args.args(
+        [
+            "--conference",
+            "ICML",
+            "--year",
+            "2024",
+            "--seconds-between-downloads",
+            "0.25",
+            "--rate-limit",
+            "2.5",
+            "--burst",
+            "4",
+        ]
+    )
+
+    assert parsed.seconds_between_downloads == 0.25
+    assert parsed.rate_limit == 2.5
+    assert parsed.burst == 4
+
+
+def test_rate_limit_accepts_per_conference_overrides():
+    parsed = command_args.args(
+        [
+            "--conference",
+            "AAAI,ICML",
+            "--year",
+            "2024",
+            "--rate-limit",
+            "AAAI=1.5",
+            "--rate-limit",
+            "3",
+            "--rate-limit",
+            "ICML=0",
+            "--rate-limit",
+            "AAAI=0.5",
+        ]
+    )
+
+    assert parsed.rate_limit == 3.0
+    assert parsed.conference_rate_limits == {"AAAI": 0.5, "ICML": 0.0}
+
+
+@pytest.mark.parametrize("value", ["fast", "AAAI=", "ACL=2", "-1", "AAAI=-1"])
+def test_rate_limit_rejects_malformed_value(value):
+    with pytest.raises(SystemExit):
+        command_args.args(
+            ["--conference", "AAAI", "--year", "2025", "--rate-limit", value]
+        )
+
+
+def test_retry_failed_conflicts_with_no_download_pdf():
+    parsed = command_args.args(
+        ["--conference", "ICML", "--year", "2024", "--retry-failed"]
+    )
+    assert parsed.retry_failed is True
+
+    with pytest.raises(SystemExit):
+        command_args.args(
+            [
+                "--conference",
+                "ICML",
+                "--year",
+                "2024",
+                "--retry-failed",
+                "--no-download-pdf",
+            ]
+        )
+
+
+def test_html_backend_choices_match_soup_backends():
+    assert command_args.HTML_BACKEND_CHOICES == soup.BACKEND_CHOICES
+
+
+def test_conference_and_year_accept_lists_and_ranges():
+    parsed = command_args.args(
+        ["--conference", "NeurIPS,ICML", "--year", "2020-2022,2025,2021"]
+    )
+
+    assert parsed.conferences == ("NeurIPS", "ICML")
+    assert parsed.years == ("2020", "2021", "2022", "2025")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--conference", "ICML,CVPR", "--year", "2024"],
+        ["--conference", "ICML", "--year", "2013"],
+        ["--conference", "ICML", "--year", "2025-2020"],
+        ["--conference", "ICML", "--year", "2020-2030"],
+    ],
+)
+def test_conference_and_year_reject_unknown_values(argv):
+    with pytest.raises(SystemExit):
+        command_args.args(argv)
+
+
+def test_targets_pair_every_conference_with_every_year():
+    parsed = command_args.args(
+        ["--conference", "NeurIPS,ICML", "--year", "2023-2024", "--workers", "4"]
+    )
+
+    targets = command_args.targets(parsed)
+
+    assert [(target.conference, target.year) for target in targets] == [
+        ("NeurIPS", "2023"),
+        ("NeurIPS", "2024"),
+        ("ICML", "2023"),
+        ("ICML", "2024"),
+    ]
+    assert all(target.workers == 4 for target in targets)
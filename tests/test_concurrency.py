@@ -0,0 +1,52 @@
+import pytest
+
+from ai_paper_downloader import concurrency
+
+
+def test_fixed_controller_uses_host_limit_and_ignores_feedback():
+    controller = concurrency.ConcurrencyController(8, {"arxiv.org": 2})
+
+    controller.record_success("arxiv.org", 0.1)
+    controller.record_throttle("arxiv.org", 0)
+
+    assert controller.capacity("arxiv.org") == 2
+    assert controller.capacity("example.com") == 8
+
+
+def test_adaptive_controller_grows_additively_up_to_cap():
+    controller = concurrency.ConcurrencyController(3, adaptive=True)
+
+    assert controller.capacity("h") == 1
+    controller.record_success("h", 0.1)
+    assert controller.capacity("h") == 2
+    for _ in range(20):
+        controller.record_success("h", 0.1)
+
+    assert controller.capacity("h") == 3
+    assert controller.summary() == {"h": (3, 3, 0)}
+
+
+def test_adaptive_controller_halves_and_pauses_on_throttle():
+    now = [100.0]
+    controller = concurrency.ConcurrencyController(
+        8, adaptive=True, initial_level=8, clock=lambda: now[0]
+    )
+
+    controller.record_throttle("h", retry_after=30)
+
+    assert controller.capacity("h") == 4
+    assert controller.paused_until("h") == pytest.approx(130.0)
+    controller.record_throttle("h", retry_after=None)
+    assert controller.capacity("h") == 2
+    assert controller.paused_until("h") == pytest.approx(130.0)
+    assert controller.summary()["h"] == (2, 8, 2)
+
+
+def test_adaptive_controller_backs_off_when_latency_degrades():
+    controller = concurrency.ConcurrencyController(10, adaptive=True, initial_level=10)
+    controller.record_success("h", 0.1)
+
+    for _ in range(10):
+        controller.record_success("h", 5.0)
+
+    assert controller.capacity("h") < 10
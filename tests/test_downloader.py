@@ -0,0 +1,588 @@
+import os
+import threading
+from datetime import timedelta
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from ai_paper_downloader import concurrency
+from ai_paper_downloader import downloader
+from ai_paper_downloader import rate_limit
+
+
+def test_run_downloads_records_results_on_calling_thread():
+    caller = threading.get_ident()
+    result_threads = []
+    results = []
+
+    def download(job):
+        if job == "bad":
+            raise requests.exceptions.RequestException("boom")
+
+    def on_result(job, error):
+        result_threads.append(threading.get_ident())
+        results.append((job, str(error) if error else None))
+        return error is None
+
+    count = downloader.run_downloads(
+        ["a", "bad", "b", "c"], download, on_result, workers=3
+    )
+
+    assert count == 3
+    assert sorted(results) == [
+        ("a", None),
+        ("b", None),
+        ("bad", "boom"),
+        ("c", None),
+    ]
+    assert set(result_threads) == {caller}
+
+
+def test_run_downloads_limit_is_exact_with_failures():
+    started = []
+    lock = threading.Lock()
+
+    def download(job):
+        with lock:
+            started.append(job)
+        if job % 2 == 0:
+            raise requests.exceptions.RequestException("even")
+
+    count = downloader.run_downloads(
+        range(1, 20), download, lambda _job, error: error is None, workers=4, limit=3
+    )
+
+    assert count == 3
+    assert len([job for job in started if job % 2 == 1]) == 3
+
+
+def test_run_downloads_propagates_unexpected_errors():
+    def download(job):
+        raise ValueError("not a network error")
+
+    with pytest.raises(ValueError, match="not a network error"):
+        downloader.run_downloads(["a"], download, lambda *_: True, workers=2)
+
+
+def test_run_downloads_enforces_per_host_limits():
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    release = threading.Event()
+
+    def download(job):
+        host = job.split("/")[0]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        if host == "slow":
+            release.wait(timeout=5)
+        else:
+            time.sleep(0.05)
+        with lock:
+            active[host] -= 1
+
+    finished = []
+
+    def on_result(job, error):
+        assert error is None
+        finished.append(job)
+        if len([job for job in finished if job.startswith("fast")]) == 6:
+            release.set()
+        return True
+
+    jobs = [f"slow/{index}" for index in range(4)] + [
+        f"fast/{index}" for index in range(6)
+    ]
+    count = downloader.run_downloads(
+        jobs,
+        download,
+        on_result,
+        workers=4,
+        host_of=lambda job: job.split("/")[0],
+        controller=concurrency.ConcurrencyController(4, {"slow": 1, "fast": 3}),
+    )
+
+    assert count == 10
+    assert peak == {"slow": 1, "fast": 3}
+    # The blocked host must not hold back the other host's downloads.
+    assert sorted(finished[:6]) == [f"fast/{index}" for index in range(6)]
+
+
+def test_run_downloads_runs_every_worker_at_once():
+    workers = min(32, (os.cpu_count() or 1) + 4) + 1
+    barrier = threading.Barrier(workers, timeout=5)
+
+    def download(job):
+        del job
+        barrier.wait()
+
+    count = downloader.run_downloads(
+        range(workers),
+        download,
+        lambda _job, error: error is None,
+        workers=workers,
+        host_of=lambda _job: "h",
+    )
+
+    assert count == workers
+
+
+def test_run_downloads_downloads_from_local_server(tmp_path):
+    payloads = {"/a.pdf": b"%PDF-a", "/b.pdf": b"%PDF-b"}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = payloads.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = {}
+    session = downloader.create_session(pool_size=2, max_retries=0)
+    try:
+        count = downloader.run_downloads(
+            ["/a.pdf", "/missing.pdf", "/b.pdf"],
+            lambda path: downloader.download_pdf(
+                session, f"{base_url}{path}", str(tmp_path / path.strip("/"))
+            ).latency,
+            lambda path, error: results.setdefault(path, error) is None,
+            workers=2,
+            host_of=lambda path: rate_limit.url_host(f"{base_url}{path}"),
+        )
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert count == 2
+    assert (tmp_path / "a.pdf").read_bytes() == b"%PDF-a"
+    assert (tmp_path / "b.pdf").read_bytes() == b"%PDF-b"
+    assert isinstance(results["/missing.pdf"], requests.exceptions.HTTPError)
+
+
+def test_create_session_reuses_connections(tmp_path):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b"%PDF"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    session = downloader.create_session(pool_size=1, max_retries=0)
+    try:
+        for index in range(3):
+            downloader.download_pdf(
+                session,
+                f"http://127.0.0.1:{server.server_port}/{index}.pdf",
+                str(tmp_path / f"{index}.pdf"),
+            )
+        assert downloader.connection_stats(session) == (1, 3)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert session.headers["User-Agent"] == downloader.USER_AGENT
+
+
+def test_create_session_leaves_throttles_with_retry_after_to_scheduler(tmp_path):
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests_seen.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args):
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    session = downloader.create_session(pool_size=1, max_retries=3)
+    started = time.monotonic()
+    try:
+        with pytest.raises(downloader.ThrottledError) as raised:
+            downloader.download_pdf(
+                session,
+                f"http://127.0.0.1:{server.server_port}/paper.pdf",
+                str(tmp_path / "paper.pdf"),
+            )
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert requests_seen == ["/paper.pdf"]
+    assert raised.value.retry_after == 1.0
+    assert time.monotonic() - started < 1
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b"%PDF-0123456789"
+    honor_range = True
+    # Start of the partial body sent for any range, instead of the requested one.
+    misaligned_start: int | None = None
+    ranges_seen: list[str | None] = []
+
+    def do_GET(self):
+        requested = self.headers.get("Range")
+        type(self).ranges_seen.append(requested)
+        body = self.body
+        if requested and self.honor_range:
+            start = int(requested.removeprefix("bytes=").rstrip("-"))
+            if self.misaligned_start is not None:
+                start = self.misaligned_start
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def range_server():
+    _RangeHandler.ranges_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/paper.pdf"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("honor_range", [True, False])
+def test_download_pdf_resumes_partial_file(
+    monkeypatch, tmp_path, range_server, honor_range
+):
+    monkeypatch.setattr(_RangeHandler, "honor_range", honor_range)
+    pdf_path = tmp_path / "paper.pdf"
+    (tmp_path / "paper.pdf.part").write_bytes(b"%PDF-01234")
+
+    with downloader.create_session(max_retries=0) as session:
+        result = downloader.download_pdf(session, range_server, str(pdf_path))
+
+    assert _RangeHandler.ranges_seen == ["bytes=10-"]
+    assert result.http_status == (206 if honor_range else 200)
+    assert result.num_bytes == (5 if honor_range else 15)
+    assert pdf_path.read_bytes() == b"%PDF-0123456789"
+    assert not (tmp_path / "paper.pdf.part").exists()
+
+
+def test_download_pdf_restarts_when_partial_content_starts_elsewhere(
+    monkeypatch, tmp_path, range_server
+):
+    monkeypatch.setattr(_RangeHandler, "misaligned_start", 3)
+    pdf_path = tmp_path / "paper.pdf"
+    (tmp_path / "paper.pdf.part").write_bytes(b"%PDF-01234")
+
+    with downloader.create_session(max_retries=0) as session:
+        result = downloader.download_pdf(session, range_server, str(pdf_path))
+
+    assert _RangeHandler.ranges_seen == ["bytes=10-", None]
+    assert result.http_status == 200
+    assert pdf_path.read_bytes() == b"%PDF-0123456789"
+    assert not (tmp_path / "paper.pdf.part").exists()
+
+
+def test_download_pdf_rejects_unrequested_partial_content(tmp_path):
+    class PartialResponse:
+        status_code = 206
+        headers = {"Content-Range": "bytes 3-14/15"}
+        elapsed = timedelta(0)
+
+        def raise_for_status(self):
+            return None
+
+        def iter_content(self, chunk_size):
+            del chunk_size
+            yield b"F-0123456789"
+
+        def close(self):
+            return None
+
+    class PartialSession:
+        def get(self, url, headers, stream):
+            del url, headers, stream
+            return PartialResponse()
+
+    pdf_path = tmp_path / "paper.pdf"
+    with pytest.raises(requests.exceptions.HTTPError):
+        downloader.download_pdf(PartialSession(), "https://x/p.pdf", str(pdf_path))
+
+    assert not pdf_path.exists()
+    assert not (tmp_path / "paper.pdf.part").exists()
+
+
+def test_download_pdf_leaves_only_part_file_when_interrupted(tmp_path):
+    class BrokenResponse:
+        status_code = 200
+        elapsed = timedelta(0)
+
+        def raise_for_status(self):
+            return None
+
+        def iter_content(self, chunk_size):
+            del chunk_size
+            yield b"%PDF-half"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        def close(self):
+            return None
+
+    class BrokenSession:
+        def get(self, url, headers, stream):
+            del url, headers, stream
+            return BrokenResponse()
+
+    pdf_path = tmp_path / "paper.pdf"
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        downloader.download_pdf(BrokenSession(), "https://x/p.pdf", str(pdf_path))
+
+    assert not pdf_path.exists()
+    assert (tmp_path / "paper.pdf.part").read_bytes() == b"%PDF-half"
+
+
+def test_run_downloads_requeues_throttled_jobs_until_they_succeed():
+    attempts = []
+
+    def download(job):
+        attempts.append(job)
+        if attempts.count(job) < 3:
+            response = requests.Response()
+            response.status_code = 429
+            response.headers["Retry-After"] = "0"
+            raise downloader.ThrottledError("429", response=response)
+        return 0.01
+
+    results = []
+    retried = []
+    controller = concurrency.ConcurrencyController(2, adaptive=True, initial_level=2)
+    count = downloader.run_downloads(
+        ["a"],
+        download,
+        lambda job, error: results.append((job, error)) or error is None,
+        workers=2,
+        host_of=lambda _job: "h",
+        controller=controller,
+        on_retry=lambda job, error, delay: retried.append((job, type(error), delay)),
+    )
+
+    assert count == 1
+    assert attempts == ["a", "a", "a"]
+    assert results == [("a", None)]
+    assert retried == [("a", downloader.ThrottledError, 0.0)] * 2
+    assert controller.summary()["h"][2] == 2
+
+
+def test_run_downloads_admits_jobs_by_rate_limit_without_blocking_workers():
+    limiter = rate_limit.HostRateLimiter(5.0, burst=1)
+    started = []
+    started_at = []
+
+    def download(job):
+        started.append(job)
+        started_at.append(time.monotonic())
+
+    def admit(job):
+        if job.startswith("slow"):
+            return limiter.try_acquire(f"https://slow.example/{job}.pdf")
+        return 0.0
+
+    count = downloader.run_downloads(
+        ["slow1", "slow2", "slow3", "fast1", "fast2", "fast3"],
+        download,
+        lambda _job, error: error is None,
+        workers=1,
+        host_of=lambda job: job[:4],
+        admit=admit,
+    )
+
+    assert count == 6
+    # The only worker keeps downloading from the fast host while the slow
+    # host waits for its next token, instead of sleeping on it.
+    assert started == ["slow1", "fast1", "fast2", "fast3", "slow2", "slow3"]
+    assert started_at[-1] - started_at[0] >= 0.35
+
+
+def test_run_downloads_fails_job_after_throttle_retries(monkeypatch):
+    monkeypatch.setattr(downloader, "MAX_THROTTLE_RETRIES", 1)
+
+    def download(job):
+        response = requests.Response()
+        response.status_code = 503
+        response.headers["Retry-After"] = "0"
+        raise downloader.ThrottledError("503", response=response)
+
+    errors = []
+    count = downloader.run_downloads(
+        ["a"], download, lambda _job, error: errors.append(error) or False
+    )
+
+    assert count == 0
+    assert len(errors) == 1
+    assert isinstance(errors[0], downloader.ThrottledError)
+
+
+def test_parse_retry_after_handles_seconds_and_dates():
+    assert downloader.parse_retry_after("120") == 120.0
+    assert downloader.parse_retry_after(None) is None
+    assert downloader.parse_retry_after("garbage") is None
+    assert downloader.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_run_downloads_requeues_transient_errors_with_backoff(monkeypatch):
+    monkeypatch.setattr(downloader, "requeue_delay", lambda attempt: 0.01 * attempt)
+    attempts = []
+
+    def download(job):
+        attempts.append(job)
+        if job == "flaky" and attempts.count(job) < 3:
+            raise requests.exceptions.ConnectionError("reset")
+        if job == "dead":
+            raise requests.exceptions.ConnectionError("down")
+
+    retried = []
+    results = {}
+    count = downloader.run_downloads(
+        ["flaky", "dead"],
+        download,
+        lambda job, error: results.setdefault(job, error) is None,
+        retries=2,
+        on_retry=lambda job, error, delay: retried.append((job, delay)),
+    )
+
+    assert count == 1
+    assert results["flaky"] is None
+    assert isinstance(results["dead"], requests.exceptions.ConnectionError)
+    assert attempts.count("flaky") == 3
+    assert attempts.count("dead") == 3
+    assert sorted(retried) == [
+        ("dead", 0.0),
+        ("dead", 0.01),
+        ("flaky", 0.0),
+        ("flaky", 0.01),
+    ]
+
+
+def test_stalled_download_times_out_and_is_requeued(monkeypatch, tmp_path):
+    monkeypatch.setattr(downloader, "requeue_delay", lambda attempt: 0)
+    stall = threading.Event()
+    stall.set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if stall.is_set():
+                stall.clear()
+                time.sleep(1)
+            body = b"%PDF"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = downloader.create_session(max_retries=0, timeout=(1, 0.2))
+    retried = []
+    results = []
+    try:
+        count = downloader.run_downloads(
+            ["paper.pdf"],
+            lambda job: downloader.download_pdf(
+                session,
+                f"http://127.0.0.1:{server.server_port}/{job}",
+                str(tmp_path / job),
+            ).latency,
+            lambda job, error: results.append(error) or error is None,
+            retries=1,
+            on_retry=lambda job, error, delay: retried.append(error),
+        )
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert count == 1
+    assert results == [None]
+    assert len(retried) == 1
+    # urllib3 reports the read timeout through its retry wrapper.
+    assert downloader.is_transient(retried[0])
+    assert "Read timed out" in str(retried[0])
+    assert (tmp_path / "paper.pdf").read_bytes() == b"%PDF"
+
+
+def test_is_transient_classifies_errors():
+    server_error = requests.Response()
+    server_error.status_code = 502
+    not_found = requests.Response()
+    not_found.status_code = 404
+
+    assert downloader.is_transient(requests.exceptions.ReadTimeout())
+    assert downloader.is_transient(requests.exceptions.HTTPError(response=server_error))
+    assert not downloader.is_transient(
+        requests.exceptions.HTTPError(response=not_found)
+    )
+    assert not downloader.is_transient(requests.exceptions.InvalidURL())
+
+
+def test_requeue_delay_grows_exponentially_with_jitter():
+    assert downloader.requeue_delay(0, lambda low, high: high) == 2.0
+    assert downloader.requeue_delay(3, lambda low, high: low) == 8.0
+    assert downloader.requeue_delay(20, lambda low, high: high) == 120.0
+
+
+def test_existing_files_lists_regular_files_above_min_size(tmp_path):
+    (tmp_path / "full.pdf").write_bytes(b"x" * 10)
+    (tmp_path / "empty.pdf").write_bytes(b"")
+    (tmp_path / "sub").mkdir()
+
+    assert downloader.existing_files(str(tmp_path)) == {"full.pdf", "empty.pdf"}
+    assert downloader.existing_files(str(tmp_path), min_size=1) == {"full.pdf"}
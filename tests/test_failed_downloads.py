@@ -0,0 +1,58 @@
+import io
+import json
+
+from ai_paper_downloader import failed_downloads
+from ai_paper_downloader.paper import Paper
+
+
+def _paper(title, url):
+    return Paper(title=title, authors="A", category="C", pdf_url=url)
+
+
+def test_append_failure_writes_text_and_json_records():
+    failed_log = io.StringIO()
+    failed_records = io.StringIO()
+
+    failed_downloads.append_failure(
+        failed_log, failed_records, _paper("P", "https://x/p.pdf"), OSError("boom")
+    )
+
+    assert failed_log.getvalue() == "P | https://x/p.pdf | boom\n"
+    record = json.loads(failed_records.getvalue())
+    assert record["title"] == "P"
+    assert record["pdf_url"] == "https://x/p.pdf"
+    assert record["error"] == "boom"
+    assert "failed_at" in record
+
+
+def test_load_failures_keeps_latest_record_per_url(tmp_path):
+    records_path = tmp_path / failed_downloads.FAILED_RECORDS_NAME
+    with records_path.open("w", encoding="utf-8") as records_file:
+        for title, url in [("A", "u1"), ("B", "u2"), ("A again", "u1")]:
+            failed_downloads.append_failure(
+                io.StringIO(), records_file, _paper(title, url), OSError("x")
+            )
+        records_file.write('{"title": "trunc')
+
+    assert failed_downloads.load_failures(str(records_path)) == [
+        _paper("B", "u2"),
+        _paper("A again", "u1"),
+    ]
+    assert failed_downloads.load_failures(str(tmp_path / "missing.jsonl")) == []
+
+
+def test_compact_failures_drops_resolved_and_duplicate_records(tmp_path):
+    records_path = tmp_path / failed_downloads.FAILED_RECORDS_NAME
+    with records_path.open("w", encoding="utf-8") as records_file:
+        for title, url in [("A", "u1"), ("B", "u2"), ("A", "u1")]:
+            failed_downloads.append_failure(
+                io.StringIO(), records_file, _paper(title, url), OSError("x")
+            )
+
+    remaining = failed_downloads.compact_failures(
+        str(records_path), lambda record: record["title"] == "B"
+    )
+
+    assert remaining == 1
+    lines = records_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["pdf_url"] for line in lines] == ["u1"]
@@ -0,0 +1,85 @@
+import sqlite3
+
+from ai_paper_downloader import journal
+from ai_paper_downloader.paper import Paper
+
+
+def _paper(title):
+    return Paper(
+        title=title,
+        authors="A",
+        category="C",
+        pdf_url=f"https://x/{title}.pdf",
+    )
+
+
+def _parsed(*titles):
+    return [
+        (journal.paper_id("ICML", "2024", title), _paper(title), f"{title}.pdf")
+        for title in titles
+    ]
+
+
+def test_paper_id_is_stable_and_longer_than_filename_hash():
+    pid = journal.paper_id("ICML", "2024", "My Title")
+
+    assert pid == journal.paper_id("icml", "2024", "  my title ")
+    assert len(pid) == journal.PAPER_ID_LENGTH
+
+
+def test_journal_batches_writes_until_flush(tmp_path):
+    journal_path = str(tmp_path / journal.JOURNAL_NAME)
+    download_journal = journal.DownloadJournal(journal_path, batch_size=10)
+    download_journal.record_parsed("ICML", "2024", _parsed("P1", "P2"))
+
+    with sqlite3.connect(journal_path) as reader:
+        assert reader.execute("SELECT COUNT(*) FROM papers").fetchone() == (0,)
+
+    download_journal.close()
+
+    with sqlite3.connect(journal_path) as reader:
+        assert reader.execute("SELECT COUNT(*) FROM papers").fetchone() == (2,)
+
+
+def test_journal_tracks_download_status_and_csv_rows(tmp_path):
+    journal_path = str(tmp_path / journal.JOURNAL_NAME)
+    (p1, _, _), (p2, _, _), (p3, _, _) = _parsed("P1", "P2", "P3")
+
+    with journal.DownloadJournal(journal_path, batch_size=2) as download_journal:
+        download_journal.record_parsed("ICML", "2024", _parsed("P1", "P2", "P3"))
+        download_journal.mark_failed(p1, "boom", 500)
+        download_journal.mark_downloaded(p1, 1234, 200)
+        download_journal.mark_csv_recorded(p1)
+        download_journal.mark_failed(p2, "gone", 404)
+
+        assert download_journal.csv_recorded_ids("ICML", "2024") == {p1}
+        assert download_journal.csv_recorded_ids("ICML", "2023") == set()
+
+    with journal.DownloadJournal(journal_path) as download_journal:
+        # Re-parsing refreshes metadata without resetting download state.
+        download_journal.record_parsed("ICML", "2024", _parsed("P1"))
+        assert download_journal.csv_recorded_ids("ICML", "2024") == {p1}
+
+    with sqlite3.connect(journal_path) as reader:
+        row = reader.execute(
+            "SELECT status, bytes, http_status, error, attempts FROM papers "
+            "WHERE paper_id = ?",
+            (p1,),
+        ).fetchone()
+    assert row == ("downloaded", 1234, 200, None, 2)
+
+
+def test_journal_resets_csv_rows_of_one_conference_and_year(tmp_path):
+    journal_path = str(tmp_path / journal.JOURNAL_NAME)
+    (p1, _, _), (p2, _, _) = _parsed("P1", "P2")
+    other = journal.paper_id("ICML", "2023", "P1")
+
+    with journal.DownloadJournal(journal_path) as download_journal:
+        download_journal.record_parsed("ICML", "2024", _parsed("P1", "P2"))
+        download_journal.record_parsed("ICML", "2023", [(other, _paper("P1"), "")])
+        for pid in (p1, p2, other):
+            download_journal.mark_csv_recorded(pid)
+        download_journal.reset_csv_recorded("ICML", "2024")
+
+        assert download_journal.csv_recorded_ids("ICML", "2024") == set()
+        assert download_journal.csv_recorded_ids("ICML", "2023") == {other}
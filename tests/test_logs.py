@@ -0,0 +1,107 @@
+import io
+import json
+import logging
+
+from ai_paper_downloader import logs
+
+logger = logging.getLogger("ai_paper_downloader.test")
+
+
+def _record(**extra):
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "msg %s", ("a",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_progress_filter_rate_limits_only_progress_records():
+    now = [0.0]
+    progress_filter = logs.ProgressFilter(1.0, clock=lambda: now[0])
+
+    assert progress_filter.filter(_record(**logs.progress(count=1)))
+    now[0] = 0.5
+    assert not progress_filter.filter(_record(**logs.progress(count=2)))
+    assert progress_filter.filter(_record())
+    now[0] = 1.0
+    assert progress_filter.filter(_record(**logs.progress(count=3)))
+
+
+def test_progress_filter_interval_zero_passes_everything():
+    progress_filter = logs.ProgressFilter(0, clock=lambda: 0.0)
+
+    assert all(
+        progress_filter.filter(_record(**logs.progress(count=count)))
+        for count in range(3)
+    )
+
+
+def test_json_formatter_includes_fields():
+    line = logs.JsonFormatter().format(_record(**logs.fields(year="2024")))
+
+    entry = json.loads(line)
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "msg a"
+    assert entry["year"] == "2024"
+
+
+def test_configure_flushes_records_and_restores_logger():
+    stream = io.StringIO()
+    package_logger = logging.getLogger(logs.LOGGER_NAME)
+    handlers = package_logger.handlers[:]
+
+    with logs.configure("INFO", "json", progress_interval=0, stream=stream):
+        logger.debug("hidden")
+        logger.info("Papers Processed: %d", 2, extra=logs.fields(count=2))
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(entry["message"], entry["count"]) for entry in entries] == [
+        ("Papers Processed: 2", 2)
+    ]
+    assert package_logger.handlers == handlers
+    assert package_logger.propagate is True
+
+
+def test_configure_text_format_writes_bare_messages():
+    stream = io.StringIO()
+
+    with logs.configure("DEBUG", "text", stream=stream):
+        logger.debug("Skipping (already exists): %s", "a.pdf")
+
+    assert stream.getvalue() == "Skipping (already exists): a.pdf\n"
+
+
+class _Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_live_status_only_on_text_terminals():
+    assert logs.live_status("text", _Terminal())
+    assert not logs.live_status("json", _Terminal())
+    assert not logs.live_status("text", io.StringIO())
+
+
+def test_configure_keeps_status_as_live_bottom_line_on_terminal():
+    stream = _Terminal()
+
+    with logs.configure("INFO", "text", stream=stream):
+        logger.info("1/? papers", extra=logs.status())
+        logger.info("Failed to download A")
+        logger.info("2/? papers", extra=logs.status())
+        logger.info("", extra=logs.status())
+        logger.info("Papers Processed: 2")
+
+    clear = logs.CLEAR_LINE
+    assert stream.getvalue() == (
+        f"{clear}1/? papers{clear}Failed to download A\n1/? papers"
+        f"{clear}2/? papers{clear}{clear}Papers Processed: 2\n"
+    )
+
+
+def test_configure_writes_status_as_plain_lines_off_terminal():
+    stream = io.StringIO()
+
+    with logs.configure("INFO", "text", stream=stream):
+        logger.info("1/? papers", extra=logs.status())
+        logger.info("", extra=logs.status())
+
+    assert stream.getvalue() == "1/? papers\n"
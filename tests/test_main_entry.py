@@ -1,20 +1,30 @@
 import csv
-from types import SimpleNamespace
+import itertools
+import json
+from datetime import timedelta
 
 import pytest
+import requests
 
 from ai_paper_downloader import main_entry
+from ai_paper_downloader.paper import Paper
 
 
 class _FakeParser:
     def __init__(self, papers):
         self._papers = papers
 
-    def parse(self):
-        return self._papers
+    def input_files(self):
+        return None
+
+    def iter_papers(self):
+        yield from self._papers
 
 
 class _FakeResponse:
+    status_code = 200
+    elapsed = timedelta(0)
+
     def __init__(self, chunks):
         self._chunks = chunks
 
@@ -26,33 +36,59 @@ class _FakeResponse:
         for chunk in self._chunks:
             yield chunk
 
+    def close(self):
+        return None
+
+
+class _FakeSession(requests.Session):
+    def __init__(self, get):
+        super().__init__()
+        self._get = get
+
+    def get(self, url, headers=None, stream=False, **_kwargs):
+        return self._get(url, headers, stream)
+
+
+def _make_args(tmp_path, **overrides):
+    args = main_entry.command_args.args(
+        ["--conference", "ICML", "--year", "2024", "--save-dir", str(tmp_path)]
+    )
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+
+def _use_fake_session(monkeypatch, get):
+    monkeypatch.setattr(
+        main_entry.downloader, "create_session", lambda **_: _FakeSession(get)
+    )
+
+
+def _use_parser(monkeypatch, parser_cls):
+    monkeypatch.setattr(
+        main_entry.registry, "parser_class", lambda _conference: parser_cls
+    )
+
 
 def test_main_downloads_pdfs_and_writes_csv(monkeypatch, tmp_path, capsys):
     papers = [
-        {
-            "title": "Paper One",
-            "authors": "Alice",
-            "category": "C1",
-            "pdf_url": "https://example.com/1.pdf",
-        },
-        {
-            "title": "Paper Two",
-            "authors": "Bob",
-            "category": "C2",
-            "pdf_url": "https://example.com/2.pdf",
-        },
+        Paper(
+            title="Paper One",
+            authors="Alice",
+            category="C1",
+            pdf_url="https://example.com/1.pdf",
+        ),
+        Paper(
+            title="Paper Two",
+            authors="Bob",
+            category="C2",
+            pdf_url="https://example.com/2.pdf",
+        ),
     ]
-    args = SimpleNamespace(
-        conference="ICML",
-        year="2024",
-        save_dir=str(tmp_path),
-        num_papers_to_download="-1",
-        no_download_pdf=False,
-        seconds_between_downloads="0",
-    )
+    args = _make_args(tmp_path)
 
     monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
-    monkeypatch.setattr(main_entry, "ICMLParser", lambda *_: _FakeParser(papers))
+    _use_parser(monkeypatch, lambda *_: _FakeParser(papers))
     monkeypatch.setattr(
         main_entry.generate_safe_filename,
         "generate_safe_filename",
@@ -65,12 +101,7 @@ def test_main_downloads_pdfs_and_writes_csv(monkeypatch, tmp_path, capsys):
         get_calls.append((url, headers, stream))
         return _FakeResponse([f"content:{url}".encode("utf-8")])
 
-    sleep_calls = []
-
-    monkeypatch.setattr(main_entry.requests, "get", fake_get)
-    monkeypatch.setattr(
-        main_entry.time, "sleep", lambda value: sleep_calls.append(value)
-    )
+    _use_fake_session(monkeypatch, fake_get)
 
     main_entry.main()
 
@@ -109,38 +140,202 @@ def test_main_downloads_pdfs_and_writes_csv(monkeypatch, tmp_path, capsys):
 
     assert len(get_calls) == 2
     assert all(call[2] is True for call in get_calls)
-    assert sleep_calls == [0, 0]
-    assert "Total papers found: 2" in capsys.readouterr().out
+    out = capsys.readouterr().out
+    assert "Total papers found: 2" in out
+    assert "HTTP Requests: 0 Connections Opened: 0 Reused: 0" in out
+    assert "Downloaded: 2 papers" in out
+    assert "Retries: 0 Failures: 0 (0.0%) Peak In Flight: 1" in out
+    assert "Host: example.com Concurrency: 1 Peak: 1 Throttled: 0" in out
+
+
+def test_main_batch_skips_targets_that_cannot_be_parsed(monkeypatch, tmp_path, capsys):
+    args = main_entry.command_args.args(
+        [
+            "--conference",
+            "ICML,NeurIPS",
+            "--year",
+            "2023-2024",
+            "--save-dir",
+            str(tmp_path),
+            "--no-download-pdf",
+        ]
+    )
+
+    class _TargetParser(_FakeParser):
+        def __init__(self, html_file_path, year, _backend):
+            self.conference = html_file_path.split("/")[1]
+            self.year = year
+            if (self.conference, year) == ("NeurIPS", "2023"):
+                raise FileNotFoundError(html_file_path)
+            super().__init__(
+                [
+                    Paper(
+                        title=f"{self.conference} {year}",
+                        authors="A",
+                        category="C",
+                        pdf_url="https://example.com/paper.pdf",
+                    )
+                ]
+            )
+
+        def iter_papers(self):
+            if (self.conference, self.year) == ("ICML", "2024"):
+                raise ValueError("Year not supported")
+            yield from super().iter_papers()
+
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, _TargetParser)
+
+    main_entry.main()
+
+    assert sorted(path.name for path in tmp_path.glob("*.csv")) == [
+        "ICML_2023.csv",
+        "NeurIPS_2024.csv",
+    ]
+    assert not (tmp_path / "ICML" / "2024").exists()
+    assert not (tmp_path / "NeurIPS" / "2023").exists()
+    out = capsys.readouterr().out
+    assert "Skipping ICML 2024: Year not supported" in out
+    assert "Skipping NeurIPS 2023: static_html/NeurIPS/2023.html" in out
+    assert "Total Papers Processed: 2" in out
+
+
+def test_main_batch_skips_targets_missing_from_openreview_replay(
+    monkeypatch, tmp_path, capsys
+):
+    args = main_entry.command_args.args(
+        [
+            "--conference",
+            "ICLR,JMLR",
+            "--year",
+            "2018",
+            "--save-dir",
+            str(tmp_path),
+            "--openreview-cache",
+            "replay",
+            "--no-download-pdf",
+        ]
+    )
+
+    class _ReplayParser(_FakeParser):
+        def __init__(self, html_file_path, _year, _backend, _notes_cache=None):
+            self.conference = html_file_path.split("/")[1]
+            super().__init__(
+                [
+                    Paper(
+                        title="JMLR paper",
+                        authors="A",
+                        category="C",
+                        pdf_url="https://example.com/paper.pdf",
+                    )
+                ]
+            )
+
+        def iter_papers(self):
+            if self.conference == "ICLR":
+                raise main_entry.openreview_cache.OpenReviewCacheMiss(
+                    "No recorded OpenReview notes"
+                )
+            yield from super().iter_papers()
+
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, _ReplayParser)
+
+    main_entry.main()
+
+    assert [path.name for path in tmp_path.glob("*.csv")] == ["JMLR_2018.csv"]
+    out = capsys.readouterr().out
+    assert "Skipping ICLR 2018: No recorded OpenReview notes" in out
+    assert "Total Papers Processed: 1" in out
+
+
+def test_main_batch_downloads_every_target_in_one_session(
+    monkeypatch, tmp_path, capsys
+):
+    args = main_entry.command_args.args(
+        [
+            "--conference",
+            "ICML,NeurIPS",
+            "--year",
+            "2023-2024",
+            "--save-dir",
+            str(tmp_path),
+            "--workers",
+            "2",
+        ]
+    )
+    created = []
+
+    class _TargetParser(_FakeParser):
+        def __init__(self, html_file_path, year, _backend):
+            conference = html_file_path.split("/")[1]
+            created.append((conference, year))
+            super().__init__(
+                [
+                    Paper(
+                        title=f"{conference} {year}",
+                        authors="Alice",
+                        category=None,
+                        pdf_url=f"https://{conference.lower()}.example/{year}.pdf",
+                    )
+                ]
+            )
+
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, _TargetParser)
+    sessions = []
+
+    def create_session(**_kwargs):
+        session = _FakeSession(lambda url, _h, _s: _FakeResponse([url.encode()]))
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(main_entry.downloader, "create_session", create_session)
+
+    main_entry.main()
+
+    assert created == [
+        ("ICML", "2023"),
+        ("ICML", "2024"),
+        ("NeurIPS", "2023"),
+        ("NeurIPS", "2024"),
+    ]
+    assert len(sessions) == 1
+    for conference, year in created:
+        with (tmp_path / f"{conference}_{year}.csv").open(
+            "r", encoding="utf-8", newline=""
+        ) as f:
+            rows = list(csv.reader(f))
+        assert [row[:2] for row in rows[1:]] == [[conference, year]]
+        assert len(list((tmp_path / conference / year).glob("*.pdf"))) == 1
+    out = capsys.readouterr().out
+    assert "Conference: NeurIPS Year: 2024" in out
+    assert "Total Papers Processed: 4" in out
+    assert "Host: icml.example" in out
+    assert "Host: neurips.example" in out
 
 
 def test_main_no_download_flag_skips_download_and_csv_rows(
     monkeypatch, tmp_path, capsys
 ):
     papers = [
-        {
-            "title": "P1",
-            "authors": "A",
-            "category": "C",
-            "pdf_url": "https://example.com/1.pdf",
-        },
-        {
-            "title": "P2",
-            "authors": "B",
-            "category": "C",
-            "pdf_url": "https://example.com/2.pdf",
-        },
+        Paper(
+            title="P1",
+            authors="A",
+            category="C",
+            pdf_url="https://example.com/1.pdf",
+        ),
+        Paper(
+            title="P2",
+            authors="B",
+            category="C",
+            pdf_url="https://example.com/2.pdf",
+        ),
     ]
-    args = SimpleNamespace(
-        conference="ICML",
-        year="2024",
-        save_dir=str(tmp_path),
-        num_papers_to_download="-1",
-        no_download_pdf=True,
-        seconds_between_downloads="0",
-    )
+    args = _make_args(tmp_path, no_download_pdf=True)
 
     monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
-    monkeypatch.setattr(main_entry, "ICMLParser", lambda *_: _FakeParser(papers))
+    _use_parser(monkeypatch, lambda *_: _FakeParser(papers))
     monkeypatch.setattr(
         main_entry.generate_safe_filename,
         "generate_safe_filename",
@@ -149,11 +344,10 @@ def test_main_no_download_flag_skips_download_and_csv_rows(
 
     def fail_if_called(*_args, **_kwargs):
         raise AssertionError(
-            "requests.get should not be called when no_download_pdf is True"
+            "no session should be created when no_download_pdf is True"
         )
 
-    monkeypatch.setattr(main_entry.requests, "get", fail_if_called)
-    monkeypatch.setattr(main_entry.time, "sleep", lambda _value: None)
+    monkeypatch.setattr(main_entry.downloader, "create_session", fail_if_called)
 
     main_entry.main()
 
@@ -184,32 +378,136 @@ def test_main_no_download_flag_skips_download_and_csv_rows(
     assert "Papers Processed: 2" in capsys.readouterr().out
 
 
-def test_main_logs_failed_download_and_continues(monkeypatch, tmp_path, capsys):
+def test_main_rerun_does_not_duplicate_csv_rows(monkeypatch, tmp_path, capsys):
     papers = [
-        {
-            "title": "Broken",
-            "authors": "A",
-            "category": "C",
-            "pdf_url": "https://example.com/broken.pdf",
-        },
-        {
-            "title": "Working",
-            "authors": "B",
-            "category": "C",
-            "pdf_url": "https://example.com/working.pdf",
-        },
+        Paper(
+            title="P1",
+            authors="A",
+            category="C",
+            pdf_url="https://example.com/1.pdf",
+        ),
     ]
-    args = SimpleNamespace(
-        conference="ICML",
-        year="2024",
-        save_dir=str(tmp_path),
-        num_papers_to_download="-1",
-        no_download_pdf=False,
-        seconds_between_downloads="0",
+    _use_parser(monkeypatch, lambda *_: _FakeParser(papers))
+    monkeypatch.setattr(
+        main_entry.generate_safe_filename,
+        "generate_safe_filename",
+        lambda _c, _y, title: f"{title}.pdf",
     )
+    _use_fake_session(monkeypatch, lambda *_: _FakeResponse([b"pdf"]))
 
+    for no_download_pdf in (True, True, False):
+        args = _make_args(tmp_path, no_download_pdf=no_download_pdf)
+        monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+        main_entry.main()
+
+    with (tmp_path / "ICML_2024.csv").open("r", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows == [
+        ["Conference", "Year", "Filename", "Title", "Authors", "Category", "PDF_URL"],
+        ["ICML", "2024", "P1.pdf", "P1", "A", "C", "https://example.com/1.pdf"],
+    ]
+    assert (tmp_path / "ICML" / "2024" / "P1.pdf").read_bytes() == b"pdf"
+    assert capsys.readouterr().out.count("Papers Processed: 0") == 1
+
+    # A deleted CSV is rebuilt instead of staying header-only.
+    (tmp_path / "ICML_2024.csv").unlink()
+    args = _make_args(tmp_path, no_download_pdf=True)
     monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
-    monkeypatch.setattr(main_entry, "ICMLParser", lambda *_: _FakeParser(papers))
+    main_entry.main()
+
+    with (tmp_path / "ICML_2024.csv").open("r", encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f)) == rows
+
+
+def test_main_streams_papers_and_stops_parsing_at_limit(monkeypatch, tmp_path, capsys):
+    class _EndlessParser:
+        def input_files(self):
+            return None
+
+        def iter_papers(self):
+            for number in itertools.count():
+                yield Paper(
+                    title=f"Paper {number}",
+                    authors="A",
+                    category="C",
+                    pdf_url=f"https://example.com/{number}.pdf",
+                )
+
+    args = _make_args(tmp_path, no_download_pdf=True, num_papers_to_download="2")
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, lambda *_: _EndlessParser())
+
+    main_entry.main()
+
+    with (tmp_path / "ICML_2024.csv").open("r", encoding="utf-8", newline="") as f:
+        titles = [row[3] for row in csv.reader(f)][1:]
+    assert titles == ["Paper 0", "Paper 1"]
+    out = capsys.readouterr().out
+    assert "Papers parsed before stopping: 2" in out
+    assert "Papers Processed: 2" in out
+
+
+def test_main_skips_existing_pdfs_from_directory_scan(monkeypatch, tmp_path, capsys):
+    papers = [
+        Paper(
+            title=title,
+            authors="A",
+            category="C",
+            pdf_url=f"https://example.com/{title}.pdf",
+        )
+        for title in ("Done", "Empty", "New")
+    ]
+    download_dir = tmp_path / "ICML" / "2024"
+    download_dir.mkdir(parents=True)
+    (download_dir / "Done.pdf").write_bytes(b"%PDF-done")
+    (download_dir / "Empty.pdf").write_bytes(b"")
+
+    args = _make_args(tmp_path, min_pdf_size=1, log_level="DEBUG")
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, lambda *_: _FakeParser(papers))
+    monkeypatch.setattr(
+        main_entry.generate_safe_filename,
+        "generate_safe_filename",
+        lambda _c, _y, title: f"{title}.pdf",
+    )
+    fetched = []
+
+    def fake_get(url, headers, stream):
+        del headers, stream
+        fetched.append(url)
+        return _FakeResponse([b"%PDF-new"])
+
+    _use_fake_session(monkeypatch, fake_get)
+
+    main_entry.main()
+
+    assert fetched == ["https://example.com/Empty.pdf", "https://example.com/New.pdf"]
+    assert (download_dir / "Empty.pdf").read_bytes() == b"%PDF-new"
+    assert f"Skipping (already exists): {download_dir}/Done.pdf" in (
+        capsys.readouterr().out
+    )
+
+
+def test_main_logs_failed_download_and_continues(monkeypatch, tmp_path, capsys):
+    papers = [
+        Paper(
+            title="Broken",
+            authors="A",
+            category="C",
+            pdf_url="https://example.com/broken.pdf",
+        ),
+        Paper(
+            title="Working",
+            authors="B",
+            category="C",
+            pdf_url="https://example.com/working.pdf",
+        ),
+    ]
+    args = _make_args(tmp_path)
+
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, lambda *_: _FakeParser(papers))
     monkeypatch.setattr(
         main_entry.generate_safe_filename,
         "generate_safe_filename",
@@ -225,11 +523,10 @@ def test_main_logs_failed_download_and_continues(monkeypatch, tmp_path, capsys):
         del headers, stream
         item = responses.pop(0)
         if item is pytest.raises:
-            raise main_entry.requests.exceptions.RequestException("boom")
+            raise requests.exceptions.RequestException("boom")
         return item
 
-    monkeypatch.setattr(main_entry.requests, "get", fake_get)
-    monkeypatch.setattr(main_entry.time, "sleep", lambda _value: None)
+    _use_fake_session(monkeypatch, fake_get)
 
     main_entry.main()
 
@@ -256,65 +553,224 @@ def test_main_logs_failed_download_and_continues(monkeypatch, tmp_path, capsys):
     assert "Papers Processed: 1" in capsys.readouterr().out
 
 
-def test_create_parser_for_jair_uses_static_directory(monkeypatch):
-    captured = {}
+def test_main_retry_failed_downloads_only_recorded_papers(
+    monkeypatch, tmp_path, capsys
+):
+    args = _make_args(tmp_path, retry_failed=True)
+    download_dir = tmp_path / "ICML" / "2024"
+    download_dir.mkdir(parents=True)
+    records = [
+        {
+            "title": "Retry Me",
+            "authors": "A",
+            "category": "C",
+            "pdf_url": "https://example.com/retry.pdf",
+            "error": "boom",
+        },
+        {
+            "title": "Still Broken",
+            "authors": "B",
+            "category": "C",
+            "pdf_url": "https://example.com/broken.pdf",
+            "error": "boom",
+        },
+    ]
+    (download_dir / "failed_downloads.jsonl").write_text(
+        "".join(json.dumps(record) + "\n" for record in records), encoding="utf-8"
+    )
+
+    def fail_if_parsed(*_args):
+        raise AssertionError("parser should not run in --retry-failed mode")
+
+    fetched = []
 
-    class FakeJAIRParser:
-        def __init__(self, html_file_path, year):
-            captured["html_file_path"] = html_file_path
-            captured["year"] = year
+    def fake_get(url, headers, stream):
+        del headers, stream
+        fetched.append(url)
+        if url.endswith("broken.pdf"):
+            raise requests.exceptions.RequestException("still boom")
+        return _FakeResponse([b"ok"])
 
-    monkeypatch.setattr(main_entry, "JAIRParser", FakeJAIRParser)
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, fail_if_parsed)
+    monkeypatch.setattr(
+        main_entry.generate_safe_filename,
+        "generate_safe_filename",
+        lambda _c, _y, title: f"{title.replace(' ', '_')}.pdf",
+    )
+    _use_fake_session(monkeypatch, fake_get)
 
-    parser = main_entry._create_parser("JAIR", "2024")
+    main_entry.main()
 
-    assert isinstance(parser, FakeJAIRParser)
-    assert captured == {"html_file_path": "static_html/JAIR", "year": "2024"}
+    assert (download_dir / "Retry_Me.pdf").read_bytes() == b"ok"
+    assert sorted(fetched) == [
+        "https://example.com/broken.pdf",
+        "https://example.com/retry.pdf",
+    ]
+    remaining = [
+        json.loads(line)
+        for line in (download_dir / "failed_downloads.jsonl")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    ]
+    assert [record["title"] for record in remaining] == ["Still Broken"]
+    assert remaining[0]["error"] == "still boom"
+    out = capsys.readouterr().out
+    assert "Total papers found: 2" in out
+    assert "Failed Papers Remaining: 1" in out
 
 
-def test_create_parser_for_jmlr_uses_single_html_file(monkeypatch):
-    captured = {}
+def test_run_recorder_never_writes_rows_ahead_of_the_journal(tmp_path):
+    (args,) = main_entry.command_args.targets(_make_args(tmp_path))
+    papers = [
+        Paper(title=f"P{index}", authors="A", category="C", pdf_url="u")
+        for index in range(3)
+    ]
+    csv_path = tmp_path / "papers.csv"
+    journal_path = str(tmp_path / main_entry.journal.JOURNAL_NAME)
 
-    class FakeJMLRParser:
-        def __init__(self, html_file_path, year):
-            captured["html_file_path"] = html_file_path
-            captured["year"] = year
+    def record(download_journal, csv_file):
+        download_journal.record_parsed(
+            "ICML",
+            "2024",
+            [
+                (main_entry.journal.paper_id("ICML", "2024", paper.title), paper, "")
+                for paper in papers
+            ],
+        )
+        download_journal.flush()
+        recorder = main_entry._RunRecorder(
+            args, csv.writer(csv_file), csv_file, None, None, download_journal
+        )
+        return [recorder.record_row(paper, paper.title) for paper in papers]
 
-    monkeypatch.setattr(main_entry, "JMLRParser", FakeJMLRParser)
+    # The run dies before the journal commits its second batch.
+    with open(csv_path, "a", newline="", encoding="utf-8") as csv_file:
+        crashed_journal = main_entry.journal.DownloadJournal(journal_path, batch_size=2)
+        record(crashed_journal, csv_file)
+        assert csv_path.read_text(encoding="utf-8").splitlines() == [
+            "ICML,2024,P0,P0,A,C,u",
+            "ICML,2024,P1,P1,A,C,u",
+        ]
 
-    parser = main_entry._create_parser("JMLR", "2024")
+    with (
+        open(csv_path, "a", newline="", encoding="utf-8") as csv_file,
+        main_entry.journal.DownloadJournal(journal_path) as download_journal,
+    ):
+        assert record(download_journal, csv_file) == [False, False, True]
 
-    assert isinstance(parser, FakeJMLRParser)
-    assert captured == {"html_file_path": "static_html/JMLR/2024.html", "year": "2024"}
+    rows = list(csv.reader(csv_path.open(encoding="utf-8")))
+    assert [row[3] for row in rows] == ["P0", "P1", "P2"]
 
 
-def test_create_parser_for_tmlr_uses_static_directory(monkeypatch):
-    captured = {}
+def test_main_reports_eta_without_a_download_limit(monkeypatch, tmp_path, capsys):
+    papers = [
+        Paper(
+            title=title,
+            authors="A",
+            category="C",
+            pdf_url=f"https://example.com/{title}.pdf",
+        )
+        for title in ("Done", "New1", "New2")
+    ]
+    download_dir = tmp_path / "ICML" / "2024"
+    download_dir.mkdir(parents=True)
+    (download_dir / "Done.pdf").write_bytes(b"%PDF-done")
 
-    class FakeTMLRParser:
-        def __init__(self, html_file_path, year):
-            captured["html_file_path"] = html_file_path
-            captured["year"] = year
+    args = _make_args(tmp_path, progress_interval=0)
+    monkeypatch.setattr(main_entry.command_args, "args", lambda _: args)
+    _use_parser(monkeypatch, lambda *_: _FakeParser(papers))
+    monkeypatch.setattr(
+        main_entry.generate_safe_filename,
+        "generate_safe_filename",
+        lambda _c, _y, title: f"{title}.pdf",
+    )
+    _use_fake_session(monkeypatch, lambda *_: _FakeResponse([b"%PDF-new"]))
+    statuses = []
+
+    class _RecordingReporter(main_entry.progress.ProgressReporter):
+        def downloaded(self, num_bytes):
+            super().downloaded(num_bytes)
+            statuses.append(self.status())
+
+    monkeypatch.setattr(main_entry.progress, "ProgressReporter", _RecordingReporter)
+
+    main_entry.main()
+
+    out = capsys.readouterr().out
+    assert "[1/2] Downloaded: New1" in out
+    assert "[2/2] Downloaded: New2" in out
+    assert statuses[0].startswith("1/2 papers")
+    assert "ETA ?" not in statuses[0]
+    assert statuses[1].startswith("2/2 papers")
+    assert statuses[1].endswith("ETA 0s")
+
+
+def test_conference_rate_limit_overrides_global_rate(tmp_path):
+    args = main_entry.command_args.args(
+        [
+            "--conference",
+            "AAAI,ICML,TMLR",
+            "--year",
+            "2024",
+            "--save-dir",
+            str(tmp_path),
+            "--rate-limit",
+            "3",
+            "--rate-limit",
+            "AAAI=0.5",
+            "--rate-limit",
+            "TMLR=0",
+        ]
+    )
+    runs = [
+        main_entry._TargetRun(target)
+        for target in main_entry.command_args.targets(args)
+    ]
+
+    main_entry._assign_rate_limiters(args, runs)
 
-    monkeypatch.setattr(main_entry, "TMLRParser", FakeTMLRParser)
+    assert [run.rate_limiter.rate for run in runs] == [0.5, 3.0, None]
 
-    parser = main_entry._create_parser("TMLR", "2026")
 
-    assert isinstance(parser, FakeTMLRParser)
-    assert captured == {"html_file_path": "static_html/TMLR", "year": "2026"}
+def test_targets_on_one_host_share_its_rate_limit(tmp_path):
+    args = main_entry.command_args.args(
+        [
+            "--conference",
+            "ICLR,TMLR",
+            "--year",
+            "2024",
+            "--save-dir",
+            str(tmp_path),
+            "--rate-limit",
+            "ICLR=1",
+        ]
+    )
+    iclr, tmlr = [
+        main_entry._TargetRun(target)
+        for target in main_entry.command_args.targets(args)
+    ]
 
+    main_entry._assign_rate_limiters(args, [iclr, tmlr])
 
-def test_create_parser_for_dmlr_uses_static_directory(monkeypatch):
-    captured = {}
+    assert tmlr.rate_limiter.try_acquire("https://openreview.net/pdf?id=a") == 0.0
+    assert iclr.rate_limiter.try_acquire("https://openreview.net/pdf?id=b") == 0.0
+    # TMLR's default 2/s drops to ICLR's 1/s on the shared openreview.net bucket.
+    wait = tmlr.rate_limiter.try_acquire("https://openreview.net/pdf?id=c")
+    assert wait == pytest.approx(1.0, abs=0.05)
 
-    class FakeDMLRParser:
-        def __init__(self, html_file_path, year):
-            captured["html_file_path"] = html_file_path
-            captured["year"] = year
 
-    monkeypatch.setattr(main_entry, "DMLRParser", FakeDMLRParser)
+def test_known_hosts_get_default_limits_unless_overridden(tmp_path):
+    args = _make_args(
+        tmp_path, workers=8, host_limits=[("ojs.aaai.org", 5), ("example.org", 1)]
+    )
 
-    parser = main_entry._create_parser("DMLR", "2025")
+    controller = main_entry._create_controller(args)
 
-    assert isinstance(parser, FakeDMLRParser)
-    assert captured == {"html_file_path": "static_html/DMLR", "year": "2025"}
+    assert controller.capacity("ojs.aaai.org") == 5
+    assert (
+        controller.capacity("arxiv.org")
+        == main_entry.downloader.HOST_CONCURRENCY["arxiv.org"]
+    )
+    assert controller.capacity("example.org") == 1
+    assert controller.capacity("other.org") == int(args.workers)
@@ -0,0 +1,91 @@
+import openreview
+import pytest
+
+from ai_paper_downloader import openreview_cache
+
+QUERY = {
+    "invitation": "ICLR.cc/2018/Conference/-/Blind_Submission",
+    "details": "directReplies",
+}
+
+
+def _note(note_id, title):
+    return openreview.Note.from_json(
+        {
+            "id": note_id,
+            "content": {"title": title, "authors": ["Alice"]},
+            "details": {"directReplies": [{"invitation": "x/-/Decision"}]},
+        }
+    )
+
+
+class _Upstream:
+    def __init__(self, notes):
+        self.notes = notes
+        self.queries = []
+
+    def get_notes(self, limit=None, offset=None, with_count=False, **query):
+        self.queries.append(query)
+        notes = self.notes[offset or 0 :][:limit]
+        return (notes, len(self.notes)) if with_count else notes
+
+
+def _client(cache, connect):
+    return openreview_cache.CachedClient(cache, 1, connect, openreview.Note.from_json)
+
+
+def _fail_connect():
+    raise AssertionError("cache hits must not connect")
+
+
+def test_miss_fetches_and_records_then_hit_replays_without_connecting(tmp_path):
+    upstream = _Upstream([_note("a", "First"), _note("b", "Second")])
+    cache = openreview_cache.OpenReviewCache(str(tmp_path))
+
+    fetched = _client(cache, lambda: upstream).get_all_notes(**QUERY)
+    replayed = _client(cache, _fail_connect).get_all_notes(**QUERY)
+
+    assert upstream.queries == [QUERY]
+    assert [note.id for note in replayed] == ["a", "b"]
+    assert [note.content for note in replayed] == [note.content for note in fetched]
+    assert replayed[0].details == {"directReplies": [{"invitation": "x/-/Decision"}]}
+
+
+def test_replay_mode_raises_on_missing_query(tmp_path):
+    cache = openreview_cache.OpenReviewCache(str(tmp_path), "replay")
+
+    with pytest.raises(openreview_cache.OpenReviewCacheMiss):
+        _client(cache, _fail_connect).get_all_notes(**QUERY)
+
+
+def test_refresh_mode_fetches_again_and_overwrites(tmp_path):
+    _client(
+        openreview_cache.OpenReviewCache(str(tmp_path)),
+        lambda: _Upstream([_note("a", "Old")]),
+    ).get_all_notes(**QUERY)
+    refresh = openreview_cache.OpenReviewCache(str(tmp_path), "refresh")
+    _client(refresh, lambda: _Upstream([_note("a", "New")])).get_all_notes(**QUERY)
+
+    replay = openreview_cache.OpenReviewCache(str(tmp_path), "replay")
+    notes = _client(replay, _fail_connect).get_all_notes(**QUERY)
+
+    assert notes[0].content["title"] == "New"
+
+
+def test_key_covers_api_version_method_and_query(tmp_path):
+    cache = openreview_cache.OpenReviewCache(str(tmp_path))
+    other_invitation = {**QUERY, "invitation": "ICLR.cc/2019/Conference/-/X"}
+
+    keys = {
+        cache.key(1, "get_all_notes", QUERY),
+        cache.key(2, "get_all_notes", QUERY),
+        cache.key(1, "get_notes", QUERY),
+        cache.key(1, "get_all_notes", other_invitation),
+    }
+
+    assert len(keys) == 4
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        openreview_cache.OpenReviewCache(str(tmp_path), "sometimes")
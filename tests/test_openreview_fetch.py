@@ -0,0 +1,70 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from ai_paper_downloader import openreview_fetch
+
+
+class _PagedStandIn:
+    def __init__(self, total, delay=0.0):
+        self.notes = [SimpleNamespace(id=f"n{index}") for index in range(total)]
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.offsets = []
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def get_notes(self, limit=None, offset=None, with_count=False, **_query):
+        if offset is not None:
+            self.release.wait(timeout=5)
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.offsets.append(offset)
+        # Later pages answer sooner, so completion order differs from offsets.
+        time.sleep(self.delay / (1 + (offset or 0)))
+        with self._lock:
+            self.active -= 1
+        page = self.notes[offset or 0 :][:limit]
+        return (page, len(self.notes)) if with_count else page
+
+
+def test_pages_are_reassembled_in_offset_order():
+    client = _PagedStandIn(total=23, delay=0.05)
+
+    notes = list(
+        openreview_fetch.iter_all_notes(client, {"invitation": "x"}, 5, workers=3)
+    )
+
+    assert [note.id for note in notes] == [f"n{index}" for index in range(23)]
+    assert sorted(client.offsets[1:]) == [5, 10, 15, 20]
+
+
+def test_parallelism_is_bounded_by_workers():
+    client = _PagedStandIn(total=40, delay=0.02)
+
+    list(openreview_fetch.iter_all_notes(client, {}, 2, workers=3))
+
+    assert 1 < client.peak <= 3
+
+
+def test_first_page_streams_before_later_pages_arrive():
+    client = _PagedStandIn(total=10)
+    client.release.clear()
+    notes = openreview_fetch.iter_all_notes(client, {}, 4, workers=2)
+
+    assert next(notes).id == "n0"
+
+    client.release.set()
+    assert len(list(notes)) == 9
+
+
+def test_notes_repeated_across_pages_are_yielded_once():
+    client = _PagedStandIn(total=6)
+    client.notes[4] = client.notes[1]
+
+    notes = list(openreview_fetch.iter_all_notes(client, {}, 3, workers=2))
+
+    assert [note.id for note in notes] == ["n0", "n1", "n2", "n3", "n5"]
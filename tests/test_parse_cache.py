@@ -0,0 +1,140 @@
+import gzip
+
+import pytest
+
+from ai_paper_downloader import parse_cache
+from ai_paper_downloader.parser.iclr import ICLRParser
+from ai_paper_downloader.parser import year_index
+from ai_paper_downloader.parser.jmlr import JMLRParser
+from ai_paper_downloader.parser.tmlr import TMLRParser
+
+JMLR_HTML = """
+<h1>JMLR Volume 25</h1>
+<dl>
+  <dt>{title}</dt>
+  <dd><i>Alice</i> [<a href='/papers/v25/{slug}.pdf'>pdf</a>]</dd>
+</dl>
+<dl>
+  <dt>Second Paper</dt>
+  <dd><i>Bob</i> [<a href='/papers/v25/second.pdf'>pdf</a>]</dd>
+</dl>
+"""
+
+
+def _jmlr_parser(tmp_path, title="First Paper"):
+    sample = tmp_path / "2024.html"
+    sample.write_text(JMLR_HTML.format(title=title, slug="first"), encoding="utf-8")
+    return JMLRParser(str(sample), "2024")
+
+
+def _fail_if_parsed(parser, monkeypatch):
+    def iter_papers():
+        raise AssertionError("parser should not run on a cache hit")
+
+    monkeypatch.setattr(parser, "iter_papers", iter_papers)
+
+
+def test_cache_miss_parses_and_stores_then_hit_skips_parser(tmp_path, monkeypatch):
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+    parser = _jmlr_parser(tmp_path)
+
+    parsed = list(cache.iter_papers(parser))
+    _fail_if_parsed(parser, monkeypatch)
+
+    assert [paper.title for paper in parsed] == ["First Paper", "Second Paper"]
+    assert list(cache.iter_papers(parser)) == parsed
+
+
+def test_cache_hit_reports_the_paper_count_up_front(tmp_path):
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+    parser = _jmlr_parser(tmp_path)
+    counts = []
+
+    list(cache.iter_papers(parser, counts.append))
+    assert counts == []
+
+    stream = cache.iter_papers(parser, counts.append)
+    next(stream)
+    assert counts == [2]
+
+
+def test_changed_html_invalidates_the_entry(tmp_path):
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+    list(cache.iter_papers(_jmlr_parser(tmp_path)))
+
+    papers = list(cache.iter_papers(_jmlr_parser(tmp_path, title="Renamed Paper")))
+
+    assert papers[0].title == "Renamed Paper"
+
+
+def test_changed_parser_code_changes_the_key(tmp_path, monkeypatch):
+    parser = _jmlr_parser(tmp_path)
+    key = parse_cache.cache_key(parser)
+
+    monkeypatch.setattr(parse_cache, "parser_version", lambda _parser: "edited")
+
+    assert parse_cache.cache_key(parser) != key
+
+
+def test_abandoned_stream_is_not_stored(tmp_path):
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+    parser = _jmlr_parser(tmp_path)
+
+    stream = cache.iter_papers(parser)
+    next(stream)
+    stream.close()
+
+    assert cache.load(parse_cache.cache_key(parser)) is None
+
+
+def test_corrupt_entry_is_treated_as_a_miss(tmp_path):
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+    parser = _jmlr_parser(tmp_path)
+    key = parse_cache.cache_key(parser)
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / f"{key}.json.gz").write_bytes(b"not gzip")
+
+    assert len(list(cache.iter_papers(parser))) == 2
+    with gzip.open(tmp_path / "cache" / f"{key}.json.gz", "rt") as cache_file:
+        assert "First Paper" in cache_file.read()
+
+
+@pytest.mark.parametrize("year", ["2018", "2023"])
+def test_openreview_years_are_not_cached(tmp_path, monkeypatch, year):
+    parser = ICLRParser(str(tmp_path / "missing.html"), year)
+    monkeypatch.setattr(
+        parser, "iter_papers", lambda: iter([{"title": "Live"}, {"title": "API"}])
+    )
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+
+    assert parse_cache.cache_key(parser) is None
+    assert list(cache.iter_papers(parser)) == [
+        {"title": "Live"},
+        {"title": "API"},
+    ]
+    assert not (tmp_path / "cache").exists()
+
+
+def test_year_indexed_parser_stores_every_year(tmp_path, monkeypatch):
+    sample = tmp_path / "1.html"
+    sample.write_text(
+        """
+        <li class="item"><h4><a class="paper-data-bs-title"><b>New</b></a></h4>
+          <p><i>Ann</i>, March 2024 <br>[<a href="https://openreview.net/pdf?id=new">pdf</a>]</p>
+        </li>
+        <li class="item"><h4><a class="paper-data-bs-title"><b>Old</b></a></h4>
+          <p><i>Ben</i>, May 2023 <br>[<a href="https://openreview.net/pdf?id=old">pdf</a>]</p>
+        </li>
+        """,
+        encoding="utf-8",
+    )
+    cache = parse_cache.ParseCache(str(tmp_path / "cache"))
+    list(cache.iter_papers(TMLRParser(str(sample), "2024")))
+    year_index.clear()
+
+    parser = TMLRParser(str(sample), "2023")
+    monkeypatch.setattr(
+        parser, "papers_by_year", lambda: pytest.fail("2023 should be cached")
+    )
+
+    assert [paper.title for paper in cache.iter_papers(parser)] == ["Old"]
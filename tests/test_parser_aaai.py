@@ -1,5 +1,10 @@
+import pytest
+
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.aaai import AAAIParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_legacy_layout_extracts_category_authors_and_pdf(tmp_path):
     html = """
@@ -21,12 +26,12 @@ def test_parse_legacy_layout_extracts_category_authors_and_pdf(tmp_path):
     parser.html_files[2020] = ["sample.html"]
 
     assert parser.parse() == [
-        {
-            "title": "Paper One",
-            "authors": "Alice, Bob",
-            "category": "Main Track",
-            "pdf_url": "https://example.com/p1.pdf",
-        }
+        Paper(
+            title="Paper One",
+            authors="Alice, Bob",
+            category="Main Track",
+            pdf_url="https://example.com/p1.pdf",
+        )
     ]
 
 
@@ -52,10 +57,32 @@ def test_parse_modern_layout_extracts_section_articles(tmp_path):
     parser.html_files[2023] = ["sample-2023.html"]
 
     assert parser.parse() == [
-        {
-            "title": "Modern Paper",
-            "authors": "Carol",
-            "category": "Reinforcement Learning",
-            "pdf_url": "https://example.com/modern.pdf",
-        }
+        Paper(
+            title="Modern Paper",
+            authors="Carol",
+            category="Reinforcement Learning",
+            pdf_url="https://example.com/modern.pdf",
+        )
     ]
+
+
+def test_iter_papers_yields_each_track_before_parsing_the_next(tmp_path):
+    html = """
+    <div class="section">
+      <h2>Track</h2>
+      <div class="obj_article_summary">
+        <h3 class="title"><a>First Track Paper</a></h3>
+        <div class="authors">Dan</div>
+        <a class="obj_galley_link pdf" href="https://example.com/first.pdf">PDF</a>
+      </div>
+    </div>
+    """
+    (tmp_path / "track1.html").write_text(html, encoding="utf-8")
+
+    parser = AAAIParser(str(tmp_path), "2024")
+    parser.html_files[2024] = ["track1.html", "missing.html"]
+    papers = parser.iter_papers()
+
+    assert next(papers).title == "First Track Paper"
+    with pytest.raises(FileNotFoundError):
+        next(papers)
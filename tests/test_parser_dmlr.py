@@ -1,5 +1,10 @@
+import pytest
+
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.dmlr import DMLRParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_reads_all_files_and_filters_requested_year(tmp_path):
     (tmp_path / "1.html").write_text(
@@ -47,18 +52,18 @@ def test_parse_reads_all_files_and_filters_requested_year(tmp_path):
     parser = DMLRParser(str(tmp_path), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "Paper One",
-            "authors": "Alice, Bob",
-            "category": "Volume 1",
-            "pdf_url": "https://data.mlr.press/assets/pdf/v01-1.pdf",
-        },
-        {
-            "title": "Paper Three",
-            "authors": "Dan, Eve",
-            "category": "Volume 2",
-            "pdf_url": "https://data.mlr.press/assets/pdf/v02-3.pdf",
-        },
+        Paper(
+            title="Paper One",
+            authors="Alice, Bob",
+            category="Volume 1",
+            pdf_url="https://data.mlr.press/assets/pdf/v01-1.pdf",
+        ),
+        Paper(
+            title="Paper Three",
+            authors="Dan, Eve",
+            category="Volume 2",
+            pdf_url="https://data.mlr.press/assets/pdf/v02-3.pdf",
+        ),
     ]
 
 
@@ -83,10 +88,10 @@ def test_parse_handles_single_file_input(tmp_path):
     parser = DMLRParser(str(sample), "2025")
 
     assert parser.parse() == [
-        {
-            "title": "Single File Paper",
-            "authors": "Frank",
-            "category": "Volume 9",
-            "pdf_url": "https://data.mlr.press/assets/pdf/v09-1.pdf",
-        }
+        Paper(
+            title="Single File Paper",
+            authors="Frank",
+            category="Volume 9",
+            pdf_url="https://data.mlr.press/assets/pdf/v09-1.pdf",
+        )
     ]
@@ -1,6 +1,14 @@
+import logging
+from types import SimpleNamespace
+
+import openreview
 import pytest
 
-from ai_paper_downloader.parser.iclr import ICLRParser
+from ai_paper_downloader import openreview_cache
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser.iclr import DecisionTally, ICLRParser
+
+pytestmark = pytest.mark.usefixtures("html_backend")
 
 
 def test_parse_2015_2016_extracts_arxiv_papers(tmp_path):
@@ -24,18 +32,18 @@ def test_parse_2015_2016_extracts_arxiv_papers(tmp_path):
     parser = ICLRParser(str(sample), "2015")
 
     assert parser.parse_2015_2016() == [
-        {
-            "title": "Oral Title",
-            "authors": "Alice",
-            "category": "oral",
-            "pdf_url": "https://arxiv.org/pdf/1234.5678.pdf",
-        },
-        {
-            "title": "Poster Title",
-            "authors": "Bob",
-            "category": "poster",
-            "pdf_url": "https://arxiv.org/pdf/9999.0001.pdf",
-        },
+        Paper(
+            title="Oral Title",
+            authors="Alice",
+            category="oral",
+            pdf_url="https://arxiv.org/pdf/1234.5678.pdf",
+        ),
+        Paper(
+            title="Poster Title",
+            authors="Bob",
+            category="poster",
+            pdf_url="https://arxiv.org/pdf/9999.0001.pdf",
+        ),
     ]
 
 
@@ -60,18 +68,18 @@ def test_parse_2014_extracts_session_and_deduplicates(tmp_path):
     parser = ICLRParser(str(sample), "2014")
 
     assert parser.parse_2014() == [
-        {
-            "title": "Paper One",
-            "authors": "Alice, Bob",
-            "category": "oral",
-            "pdf_url": "https://arxiv.org/pdf/1111.1111.pdf",
-        },
-        {
-            "title": "Paper Two",
-            "authors": "Carol",
-            "category": "poster",
-            "pdf_url": "https://arxiv.org/pdf/2222.2222.pdf",
-        },
+        Paper(
+            title="Paper One",
+            authors="Alice, Bob",
+            category="oral",
+            pdf_url="https://arxiv.org/pdf/1111.1111.pdf",
+        ),
+        Paper(
+            title="Paper Two",
+            authors="Carol",
+            category="poster",
+            pdf_url="https://arxiv.org/pdf/2222.2222.pdf",
+        ),
     ]
 
 
@@ -84,7 +92,7 @@ def test_parse_dispatch_by_year(monkeypatch, tmp_path):
     assert parser_2024.parse() == ["2024_plus"]
 
     parser_2018 = ICLRParser(str(sample), "2018")
-    monkeypatch.setattr(parser_2018, "parse_openreview", lambda: ["openreview"])
+    monkeypatch.setattr(parser_2018, "iter_openreview", lambda: iter(["openreview"]))
     assert parser_2018.parse() == ["openreview"]
 
     parser_2016 = ICLRParser(str(sample), "2016")
@@ -117,12 +125,12 @@ def test_parse_2024_plus_extracts_and_transforms_static_links(tmp_path):
     parser = ICLRParser(str(sample), "2025")
 
     assert parser.parse_2024_plus() == [
-        {
-            "title": "Generalization and Distributed Learning of GFlowNets",
-            "authors": "Tiago Silva, Amauri Souza, Omar Rivasplata, Vikas Garg, Samuel Kaski, Diego Mesquita",
-            "category": "",
-            "pdf_url": "https://proceedings.iclr.cc/paper_files/paper/2025/file/000eba875068854d5ff003b1fa534cd6-Paper-Conference.pdf",
-        }
+        Paper(
+            title="Generalization and Distributed Learning of GFlowNets",
+            authors="Tiago Silva, Amauri Souza, Omar Rivasplata, Vikas Garg, Samuel Kaski, Diego Mesquita",
+            category="",
+            pdf_url="https://proceedings.iclr.cc/paper_files/paper/2025/file/000eba875068854d5ff003b1fa534cd6-Paper-Conference.pdf",
+        )
     ]
 
 
@@ -134,3 +142,127 @@ def test_parse_raises_for_unsupported_year(tmp_path):
 
     with pytest.raises(ValueError, match="Year not supported"):
         parser.parse()
+
+
+class _OpenReviewStandIn:
+    def get_notes(self, limit=None, offset=None, with_count=False, **_query):
+        notes = self._notes()[offset or 0 :][:limit]
+        return (notes, len(self._notes())) if with_count else notes
+
+    def _notes(self):
+        return [
+            openreview.Note.from_json(
+                {
+                    "id": note_id,
+                    "content": {"title": title, "authors": ["Alice", "Bob"]},
+                    "details": {"directReplies": replies},
+                }
+            )
+            for note_id, title, replies in [
+                (
+                    "acc",
+                    "Accepted",
+                    [
+                        {
+                            "invitation": "ICLR.cc/2018/Conference/-/Acceptance_Decision",
+                            "content": {"decision": "Accept (Poster)"},
+                        }
+                    ],
+                ),
+                (
+                    "rej",
+                    "Rejected",
+                    [
+                        {
+                            "invitation": "ICLR.cc/2018/Conference/-/Acceptance_Decision",
+                            "content": {"decision": "Reject"},
+                        }
+                    ],
+                ),
+            ]
+        ]
+
+
+def test_parse_openreview_replays_recorded_notes_offline(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "openreview")
+    recorder = ICLRParser(
+        "unused.html",
+        "2018",
+        openreview_cache=openreview_cache.OpenReviewCache(cache_dir),
+    )
+    monkeypatch.setattr(recorder, "_connect", lambda _version: _OpenReviewStandIn())
+    recorded = recorder.parse()
+
+    replayer = ICLRParser(
+        "unused.html",
+        "2018",
+        openreview_cache=openreview_cache.OpenReviewCache(cache_dir, "replay"),
+    )
+
+    assert (
+        replayer.parse()
+        == recorded
+        == [
+            Paper(
+                title="Accepted",
+                authors="Alice, Bob",
+                category="Accept (Poster)",
+                pdf_url="https://openreview.net/pdf?id=acc",
+            )
+        ]
+    )
+
+
+def _submission(note_id, *replies):
+    return SimpleNamespace(
+        id=note_id,
+        details={
+            "directReplies": [
+                {
+                    "invitation": f"ICLR.cc/2019/Conference/-/Paper1/{suffix}",
+                    "content": content,
+                }
+                for suffix, content in replies
+            ]
+        },
+    )
+
+
+def test_decision_tally_takes_last_decision_reply_by_invitation_suffix():
+    tally = DecisionTally()
+
+    decisions = [
+        tally.add(
+            _submission(
+                "a",
+                ("Official_Review", {"rating": "8"}),
+                ("Meta_Review", {"recommendation": "Accept (Oral)"}),
+            )
+        ),
+        tally.add(
+            _submission(
+                "b",
+                ("Meta_Review", {"recommendation": "Accept (Poster)"}),
+                ("Decision", {"decision": "Reject"}),
+            )
+        ),
+        tally.add(_submission("c", ("Official_Comment", {"comment": "Thanks"}))),
+        tally.add(_submission("d", ("Acceptance_Decision", {"decision": "Reject"}))),
+    ]
+
+    assert decisions == ["Accept (Oral)", "Reject", None, "Reject"]
+    assert tally.summary() == "Reject: 2, Accept (Oral): 1, No decision: 1"
+
+
+def test_parse_openreview_reports_decision_counts_once(tmp_path, monkeypatch, caplog):
+    cache = openreview_cache.OpenReviewCache(str(tmp_path))
+    parser = ICLRParser("unused.html", "2018", openreview_cache=cache)
+    monkeypatch.setattr(parser, "_connect", lambda _version: _OpenReviewStandIn())
+
+    with caplog.at_level(logging.INFO, logger="ai_paper_downloader"):
+        parser.parse()
+
+    assert caplog.messages == [
+        "Using API V1",
+        "ICLR 2018 decisions: Accept (Poster): 1, Reject: 1",
+    ]
@@ -1,7 +1,14 @@
+import logging
+
+import pytest
+
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.icml import ICMLParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
-def test_parse_extracts_papers_and_skips_missing_pdf(tmp_path, capsys):
+def test_parse_extracts_papers_and_skips_missing_pdf(tmp_path, caplog):
     html = """
     <html>
       <body>
@@ -21,14 +28,15 @@ def test_parse_extracts_papers_and_skips_missing_pdf(tmp_path, capsys):
     sample.write_text(html, encoding="utf-8")
 
     parser = ICMLParser(str(sample), "2024")
-    parsed = parser.parse()
+    with caplog.at_level(logging.DEBUG, logger="ai_paper_downloader"):
+        parsed = parser.parse()
 
     assert parsed == [
-        {
-            "title": "Paper With PDF",
-            "authors": "Alice Bob",
-            "category": "None",
-            "pdf_url": "https://example.com/paper.pdf",
-        }
+        Paper(
+            title="Paper With PDF",
+            authors="Alice Bob",
+            category="None",
+            pdf_url="https://example.com/paper.pdf",
+        )
     ]
-    assert "Skipping: No PDF found for Paper Without PDF" in capsys.readouterr().out
+    assert "Skipping: No PDF found for Paper Without PDF" in caplog.text
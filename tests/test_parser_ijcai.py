@@ -1,5 +1,10 @@
+import pytest
+
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.ijcai import IJCAIParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_new_style_extracts_and_deduplicates(tmp_path):
     html = """
@@ -37,18 +42,18 @@ def test_parse_new_style_extracts_and_deduplicates(tmp_path):
     parser = IJCAIParser(str(sample), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "Paper One",
-            "authors": "Alice",
-            "category": "Main Track",
-            "pdf_url": "https://www.ijcai.org/proceedings/2024/papers/1.pdf",
-        },
-        {
-            "title": "Paper Two",
-            "authors": "Bob",
-            "category": "Main Track",
-            "pdf_url": "https://cdn.example.com/2.pdf",
-        },
+        Paper(
+            title="Paper One",
+            authors="Alice",
+            category="Main Track",
+            pdf_url="https://www.ijcai.org/proceedings/2024/papers/1.pdf",
+        ),
+        Paper(
+            title="Paper Two",
+            authors="Bob",
+            category="Main Track",
+            pdf_url="https://cdn.example.com/2.pdf",
+        ),
     ]
 
 
@@ -68,18 +73,18 @@ def test_parse_old_style_handles_main_track_and_h3_categories(tmp_path):
     parser = IJCAIParser(str(sample), "2015")
 
     assert parser.parse() == [
-        {
-            "title": "Pre-H3 Paper",
-            "authors": "Alice",
-            "category": "Main Track",
-            "pdf_url": "https://www.ijcai.org/proceedings/2015/1.pdf",
-        },
-        {
-            "title": "Category Paper",
-            "authors": "Bob",
-            "category": "Reasoning",
-            "pdf_url": "https://www.ijcai.org/proceedings/2015/2.pdf",
-        },
+        Paper(
+            title="Pre-H3 Paper",
+            authors="Alice",
+            category="Main Track",
+            pdf_url="https://www.ijcai.org/proceedings/2015/1.pdf",
+        ),
+        Paper(
+            title="Category Paper",
+            authors="Bob",
+            category="Reasoning",
+            pdf_url="https://www.ijcai.org/proceedings/2015/2.pdf",
+        ),
     ]
 
 
@@ -121,16 +126,16 @@ def test_parse_new_style_ignores_container_section_and_uses_track_titles(tmp_pat
     parser = IJCAIParser(str(sample), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "Track One Paper",
-            "authors": "Alice",
-            "category": "Main Track",
-            "pdf_url": "https://www.ijcai.org/proceedings/2024/papers/1.pdf",
-        },
-        {
-            "title": "Track Two Paper",
-            "authors": "Bob",
-            "category": "Survey Track",
-            "pdf_url": "https://www.ijcai.org/proceedings/2024/papers/2.pdf",
-        },
+        Paper(
+            title="Track One Paper",
+            authors="Alice",
+            category="Main Track",
+            pdf_url="https://www.ijcai.org/proceedings/2024/papers/1.pdf",
+        ),
+        Paper(
+            title="Track Two Paper",
+            authors="Bob",
+            category="Survey Track",
+            pdf_url="https://www.ijcai.org/proceedings/2024/papers/2.pdf",
+        ),
     ]
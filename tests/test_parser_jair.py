@@ -1,7 +1,10 @@
 import pytest
 
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.jair import JAIRParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_extracts_volume_category_and_download_pdf_urls(tmp_path):
     (tmp_path / "2024-1.html").write_text(
@@ -62,24 +65,24 @@ def test_parse_extracts_volume_category_and_download_pdf_urls(tmp_path):
     parser = JAIRParser(str(tmp_path), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "Paper One",
-            "authors": "Alice, Bob",
-            "category": "Vol. 79 (2024)",
-            "pdf_url": "https://www.jair.org/index.php/jair/article/download/1/10001",
-        },
-        {
-            "title": "Paper Two",
-            "authors": "Carol",
-            "category": "Vol. 80 (2024)",
-            "pdf_url": "https://www.jair.org/index.php/jair/article/download/2/10002",
-        },
-        {
-            "title": "Paper Three",
-            "authors": "Dan",
-            "category": "Vol. 81 (2024)",
-            "pdf_url": "https://www.jair.org/index.php/jair/article/download/4/10004",
-        },
+        Paper(
+            title="Paper One",
+            authors="Alice, Bob",
+            category="Vol. 79 (2024)",
+            pdf_url="https://www.jair.org/index.php/jair/article/download/1/10001",
+        ),
+        Paper(
+            title="Paper Two",
+            authors="Carol",
+            category="Vol. 80 (2024)",
+            pdf_url="https://www.jair.org/index.php/jair/article/download/2/10002",
+        ),
+        Paper(
+            title="Paper Three",
+            authors="Dan",
+            category="Vol. 81 (2024)",
+            pdf_url="https://www.jair.org/index.php/jair/article/download/4/10004",
+        ),
     ]
 
 
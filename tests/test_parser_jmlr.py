@@ -1,5 +1,10 @@
+import pytest
+
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.jmlr import JMLRParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_extracts_volume_category_and_absolute_pdf_urls(tmp_path):
     html = """
@@ -33,18 +38,18 @@ def test_parse_extracts_volume_category_and_absolute_pdf_urls(tmp_path):
     parser = JMLRParser(str(sample), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "First Paper",
-            "authors": "Alice, Bob",
-            "category": "JMLR Volume 25",
-            "pdf_url": "https://jmlr.org/papers/volume25/first/first.pdf",
-        },
-        {
-            "title": "Second Paper",
-            "authors": "Carol",
-            "category": "JMLR Volume 25",
-            "pdf_url": "https://jmlr.org/papers/volume25/second/second.pdf",
-        },
+        Paper(
+            title="First Paper",
+            authors="Alice, Bob",
+            category="JMLR Volume 25",
+            pdf_url="https://jmlr.org/papers/volume25/first/first.pdf",
+        ),
+        Paper(
+            title="Second Paper",
+            authors="Carol",
+            category="JMLR Volume 25",
+            pdf_url="https://jmlr.org/papers/volume25/second/second.pdf",
+        ),
     ]
 
 
@@ -1,5 +1,10 @@
+import pytest
+
+from ai_paper_downloader.paper import Paper
 from ai_paper_downloader.parser.neurips import NeurIPSParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_2024_layout_extracts_conference_papers_only(tmp_path):
     html = """
@@ -28,12 +33,12 @@ def test_parse_2024_layout_extracts_conference_papers_only(tmp_path):
     parser = NeurIPSParser(str(sample), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "Conf Paper",
-            "authors": "Alice",
-            "category": "conference",
-            "pdf_url": "https://proceedings.neurips.cc/file/a-Paper-Conference.pdf",
-        },
+        Paper(
+            title="Conf Paper",
+            authors="Alice",
+            category="conference",
+            pdf_url="https://proceedings.neurips.cc/file/a-Paper-Conference.pdf",
+        ),
     ]
 
 
@@ -73,12 +78,12 @@ def test_parse_2025_layout_extracts_conference_papers_only(tmp_path):
     parser = NeurIPSParser(str(sample), "2025")
 
     assert parser.parse() == [
-        {
-            "title": "Conf Paper",
-            "authors": "Alice, Alex",
-            "category": "conference",
-            "pdf_url": "https://proceedings.neurips.cc/paper_files/paper/2025/file/a-Paper-Conference.pdf",
-        },
+        Paper(
+            title="Conf Paper",
+            authors="Alice, Alex",
+            category="conference",
+            pdf_url="https://proceedings.neurips.cc/paper_files/paper/2025/file/a-Paper-Conference.pdf",
+        ),
     ]
 
 
@@ -103,10 +108,10 @@ def test_parse_2026_uses_2025_plus_layout(tmp_path):
     parser = NeurIPSParser(str(sample), "2026")
 
     assert parser.parse() == [
-        {
-            "title": "Future Conf Paper",
-            "authors": "Dana",
-            "category": "conference",
-            "pdf_url": "https://proceedings.neurips.cc/paper_files/paper/2026/file/a-Paper-Conference.pdf",
-        },
+        Paper(
+            title="Future Conf Paper",
+            authors="Dana",
+            category="conference",
+            pdf_url="https://proceedings.neurips.cc/paper_files/paper/2026/file/a-Paper-Conference.pdf",
+        ),
     ]
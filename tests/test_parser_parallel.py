@@ -0,0 +1,54 @@
+import pytest
+
+from ai_paper_downloader.parser import parallel
+from ai_paper_downloader.parser.aaai import AAAIParser
+
+TRACK_HTML = """
+<div class="section">
+  <h2>Track {number}</h2>
+  <div class="obj_article_summary">
+    <h3 class="title"><a>Paper {number}</a></h3>
+    <div class="authors">Author {number}</div>
+    <a class="obj_galley_link pdf" href="https://example.com/{number}.pdf">PDF</a>
+  </div>
+</div>
+"""
+
+
+def _write_tracks(tmp_path, count):
+    html_files = []
+    for number in range(count):
+        html_file = f"track{number}.html"
+        (tmp_path / html_file).write_text(
+            TRACK_HTML.format(number=number), encoding="utf-8"
+        )
+        html_files.append(html_file)
+    return html_files
+
+
+def test_parse_files_in_process_pool_keeps_file_order(tmp_path):
+    html_files = _write_tracks(tmp_path, 6)
+    serial = AAAIParser(str(tmp_path), "2024")
+    serial.html_files[2024] = html_files
+    pooled = AAAIParser(str(tmp_path), "2024", workers=3)
+    pooled.html_files[2024] = html_files
+
+    papers = pooled.parse()
+
+    assert papers == serial.parse()
+    assert [paper.title for paper in papers] == [f"Paper {n}" for n in range(6)]
+
+
+def test_parse_files_reraises_worker_errors(tmp_path):
+    parser = AAAIParser(str(tmp_path), "2024", workers=2)
+    parser.html_files[2024] = _write_tracks(tmp_path, 1) + ["missing.html"]
+
+    with pytest.raises(FileNotFoundError):
+        parser.parse()
+
+
+def test_resolve_workers_uses_every_core_for_zero(monkeypatch):
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 32)
+
+    assert parallel.resolve_workers(0) == 32
+    assert parallel.resolve_workers(3) == 3
@@ -0,0 +1,123 @@
+import pytest
+
+from ai_paper_downloader import command_args
+from ai_paper_downloader.parser import registry
+
+
+def test_registry_covers_every_conference_choice():
+    assert sorted(registry.PARSERS) == sorted(command_args.CONFERENCE_CHOICES)
+
+
+@pytest.mark.parametrize("conference", sorted(registry.PARSERS))
+def test_parser_class_imports_registered_parser(conference):
+    cls = registry.parser_class(conference)
+
+    assert cls.__name__ == registry.PARSERS[conference][1]
+    assert hasattr(cls, "iter_papers")
+
+
+def test_create_parser_for_jair_uses_static_directory(monkeypatch):
+    captured = {}
+
+    class FakeJAIRParser:
+        def __init__(self, html_file_path, year, workers, backend):
+            captured["html_file_path"] = html_file_path
+            captured["year"] = year
+            captured["workers"] = workers
+            captured["backend"] = backend
+
+    monkeypatch.setattr(registry, "parser_class", lambda _conference: FakeJAIRParser)
+
+    parser = registry.create_parser("JAIR", "2024", 4, "lxml")
+
+    assert isinstance(parser, FakeJAIRParser)
+    assert captured == {
+        "html_file_path": "static_html/JAIR",
+        "year": "2024",
+        "workers": 4,
+        "backend": "lxml",
+    }
+
+
+def test_create_parser_for_jmlr_uses_single_html_file(monkeypatch):
+    captured = {}
+
+    class FakeJMLRParser:
+        def __init__(self, html_file_path, year, backend):
+            captured["html_file_path"] = html_file_path
+            captured["year"] = year
+            captured["backend"] = backend
+
+    monkeypatch.setattr(registry, "parser_class", lambda _conference: FakeJMLRParser)
+
+    parser = registry.create_parser("JMLR", "2024")
+
+    assert isinstance(parser, FakeJMLRParser)
+    assert captured == {
+        "html_file_path": "static_html/JMLR/2024.html",
+        "year": "2024",
+        "backend": None,
+    }
+
+
+def test_create_parser_for_tmlr_uses_static_directory(monkeypatch):
+    captured = {}
+
+    class FakeTMLRParser:
+        def __init__(self, html_file_path, year, backend):
+            captured["html_file_path"] = html_file_path
+            captured["year"] = year
+            captured["backend"] = backend
+
+    monkeypatch.setattr(registry, "parser_class", lambda _conference: FakeTMLRParser)
+
+    parser = registry.create_parser("TMLR", "2026")
+
+    assert isinstance(parser, FakeTMLRParser)
+    assert captured == {
+        "html_file_path": "static_html/TMLR",
+        "year": "2026",
+        "backend": None,
+    }
+
+
+def test_create_parser_for_dmlr_uses_static_directory(monkeypatch):
+    captured = {}
+
+    class FakeDMLRParser:
+        def __init__(self, html_file_path, year, workers, backend):
+            captured["html_file_path"] = html_file_path
+            captured["year"] = year
+            captured["workers"] = workers
+            captured["backend"] = backend
+
+    monkeypatch.setattr(registry, "parser_class", lambda _conference: FakeDMLRParser)
+
+    parser = registry.create_parser("DMLR", "2025", 4, "lxml")
+
+    assert isinstance(parser, FakeDMLRParser)
+    assert captured == {
+        "html_file_path": "static_html/DMLR",
+        "year": "2025",
+        "workers": 4,
+        "backend": "lxml",
+    }
+
+
+def test_create_parser_passes_openreview_cache_to_iclr_only(monkeypatch):
+    captured = {}
+
+    class FakeICLRParser:
+        def __init__(self, html_file_path, year, backend, openreview_cache):
+            captured["html_file_path"] = html_file_path
+            captured["openreview_cache"] = openreview_cache
+
+    monkeypatch.setattr(registry, "parser_class", lambda _conference: FakeICLRParser)
+    cache = object()
+
+    registry.create_parser("ICLR", "2019", 1, None, cache)
+
+    assert captured == {
+        "html_file_path": "static_html/ICLR/2019.html",
+        "openreview_cache": cache,
+    }
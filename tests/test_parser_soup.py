@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from ai_paper_downloader.parser import registry, soup
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_resolve_backend_auto_prefers_lxml_when_installed(monkeypatch):
+    monkeypatch.setattr(soup, "backend_available", lambda backend: True)
+    assert soup.resolve_backend("auto") == "lxml"
+
+    monkeypatch.setattr(
+        soup, "backend_available", lambda backend: backend == "html.parser"
+    )
+    assert soup.resolve_backend("auto") == "html.parser"
+
+
+def test_resolve_backend_falls_back_when_requested_backend_is_missing(
+    monkeypatch, caplog
+):
+    monkeypatch.setattr(
+        soup, "backend_available", lambda backend: backend == "html.parser"
+    )
+
+    assert soup.resolve_backend("lxml") == "html.parser"
+    assert "HTML backend lxml is not installed" in caplog.text
+
+
+def test_make_soup_uses_default_backend(monkeypatch):
+    assert soup.backend_available("html.parser")
+    monkeypatch.setattr(soup, "DEFAULT_BACKEND", "html.parser")
+
+    document = soup.make_soup("<p class='x'>Hi</p>")
+
+    assert document.find("p", class_="x").get_text() == "Hi"
+
+
+def test_has_class_strainer_matches_multi_class_elements():
+    strainer = soup.SoupStrainer("li", class_=soup.has_class("item"))
+    html = (
+        '<li class="item new">A</li><li class="items">B</li>'
+        '<li class="item">C</li><p class="item">D</p>'
+    )
+
+    document = soup.make_soup(html, "html.parser", strainer)
+
+    assert [li.get_text() for li in document.find_all("li")] == ["A", "C"]
+    assert document.find("p") is None
+
+
+@pytest.mark.skipif(not soup.backend_available("lxml"), reason="lxml is not installed")
+@pytest.mark.parametrize(
+    ("conference", "year"),
+    [("DMLR", "2024"), ("ICLR", "2024"), ("JAIR", "2024"), ("JMLR", "2024")],
+)
+def test_backends_parse_bundled_html_into_identical_records(
+    monkeypatch, conference, year
+):
+    monkeypatch.chdir(ROOT)
+
+    records = {
+        backend: list(
+            registry.create_parser(conference, year, 1, backend).iter_papers()
+        )
+        for backend in ("html.parser", "lxml")
+    }
+
+    assert records["lxml"]
+    assert records["lxml"] == records["html.parser"]
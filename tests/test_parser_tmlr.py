@@ -1,5 +1,11 @@
+import pytest
+
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser import tmlr
 from ai_paper_downloader.parser.tmlr import TMLRParser
 
+pytestmark = pytest.mark.usefixtures("html_backend")
+
 
 def test_parse_filters_by_year_and_extracts_fields(tmp_path):
     html = """
@@ -42,12 +48,12 @@ def test_parse_filters_by_year_and_extracts_fields(tmp_path):
     parser = TMLRParser(str(sample), "2026")
 
     assert parser.parse() == [
-        {
-            "title": "From Preferences to Prejudice",
-            "authors": "Alice, Bob",
-            "category": "",
-            "pdf_url": "https://openreview.net/pdf?id=C0yxuS6jty",
-        }
+        Paper(
+            title="From Preferences to Prejudice",
+            authors="Alice, Bob",
+            category="",
+            pdf_url="https://openreview.net/pdf?id=C0yxuS6jty",
+        )
     ]
 
 
@@ -71,10 +77,55 @@ def test_parse_resolves_directory_input_with_fallback_filename(tmp_path):
     parser = TMLRParser(str(directory), "2024")
 
     assert parser.parse() == [
-        {
-            "title": "Dir Entry",
-            "authors": "Dan",
-            "category": "",
-            "pdf_url": "https://openreview.net/pdf?id=dir",
-        }
+        Paper(
+            title="Dir Entry",
+            authors="Dan",
+            category="",
+            pdf_url="https://openreview.net/pdf?id=dir",
+        )
     ]
+
+
+def _write_two_year_listing(path):
+    path.write_text(
+        """
+        <li class="item"><h4><a class="paper-data-bs-title"><b>New</b></a></h4>
+          <p><i>Ann</i>, March 2024 <br>[<a href="https://openreview.net/pdf?id=new">pdf</a>]</p>
+        </li>
+        <li class="item"><h4><a class="paper-data-bs-title"><b>Old</b></a></h4>
+          <p><i>Ben</i>, May 2023 <br>[<a href="https://openreview.net/pdf?id=old">pdf</a>]</p>
+        </li>
+        """,
+        encoding="utf-8",
+    )
+
+
+def test_parsers_for_several_years_share_one_parse(tmp_path, monkeypatch):
+    sample = tmp_path / "all.html"
+    _write_two_year_listing(sample)
+    calls = []
+    make_soup = tmlr.make_soup
+
+    def counting_make_soup(*args, **kwargs):
+        calls.append(args)
+        return make_soup(*args, **kwargs)
+
+    monkeypatch.setattr(tmlr, "make_soup", counting_make_soup)
+
+    titles = {
+        year: [paper.title for paper in TMLRParser(str(sample), year).parse()]
+        for year in ("2022", "2023", "2024")
+    }
+
+    assert titles == {"2022": [], "2023": ["Old"], "2024": ["New"]}
+    assert len(calls) == 1
+
+
+def test_edited_listing_is_parsed_again(tmp_path):
+    sample = tmp_path / "all.html"
+    _write_two_year_listing(sample)
+    assert len(TMLRParser(str(sample), "2024").parse()) == 1
+
+    sample.write_text("<ul></ul>", encoding="utf-8")
+
+    assert TMLRParser(str(sample), "2024").parse() == []
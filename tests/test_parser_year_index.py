@@ -0,0 +1,30 @@
+from ai_paper_downloader.paper import Paper
+from ai_paper_downloader.parser import year_index
+
+
+def _paper(title):
+    return Paper(title=title, authors="", category=None, pdf_url=f"{title}.pdf")
+
+
+def test_partition_groups_by_year_in_order_and_drops_undated():
+    rows = [(2024, _paper("a")), (None, _paper("b")), (2023, _paper("c"))]
+    rows.append((2024, _paper("d")))
+
+    assert year_index.partition(rows) == {
+        2024: (_paper("a"), _paper("d")),
+        2023: (_paper("c"),),
+    }
+
+
+def test_cached_builds_once_per_key_and_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(year_index, "MAX_INDEXES", 2)
+    builds = []
+
+    def build(key):
+        builds.append(key)
+        return {}
+
+    for key in ("a", "a", "b", "c", "a"):
+        year_index.cached(key, lambda key=key: build(key))
+
+    assert builds == ["a", "b", "c", "a"]
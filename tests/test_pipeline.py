@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+
+from ai_paper_downloader import pipeline
+
+
+def test_prefetch_yields_items_in_order():
+    assert list(pipeline.prefetch(range(1000), maxsize=8)) == list(range(1000))
+
+
+def test_prefetch_reraises_producer_errors():
+    def items():
+        yield 1
+        raise ValueError("bad page")
+
+    stream = pipeline.prefetch(items())
+
+    assert next(stream) == 1
+    with pytest.raises(ValueError, match="bad page"):
+        next(stream)
+
+
+def test_prefetch_stays_bounded_and_stops_when_closed():
+    produced = []
+    finished = threading.Event()
+
+    def items():
+        try:
+            for item in range(1000):
+                produced.append(item)
+                yield item
+        finally:
+            finished.set()
+
+    stream = pipeline.prefetch(items(), maxsize=4)
+    assert next(stream) == 0
+    stream.close()
+
+    assert finished.wait(timeout=2)
+    # One item taken, four buffered, at most one blocked in put().
+    assert len(produced) <= 6
@@ -0,0 +1,89 @@
+import logging
+import time
+
+from ai_paper_downloader import progress
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_format_duration():
+    assert progress.format_duration(42.4) == "42s"
+    assert progress.format_duration(185) == "3m05s"
+    assert progress.format_duration(3720) == "1h02m"
+
+
+def test_rates_cover_only_the_sliding_window():
+    clock = _Clock()
+    reporter = progress.ProgressReporter(10, interval=0, window=10, clock=clock)
+
+    clock.now = 1
+    reporter.downloaded(1_000_000)
+    clock.now = 12
+    reporter.downloaded(2_000_000)
+    reporter.downloaded(2_000_000)
+
+    assert reporter.rates() == (0.2, 400_000.0)
+    assert reporter.papers == 3
+    assert reporter.num_bytes == 5_000_000
+
+
+def test_status_reports_in_flight_retries_failures_and_eta():
+    clock = _Clock()
+    reporter = progress.ProgressReporter(12, interval=0, window=10, clock=clock)
+
+    reporter.started()
+    reporter.started()
+    reporter.finished()
+    reporter.retried()
+    reporter.failed()
+    clock.now = 5
+    reporter.downloaded(500_000)
+
+    assert reporter.status() == (
+        "1/12 papers | 0.2 papers/s | 0.1 MB/s | in flight 1 | "
+        "retries 1 | failures 1 | ETA 50s"
+    )
+    assert reporter.peak_in_flight == 2
+
+
+def test_status_eta_is_unknown_without_total_or_rate():
+    reporter = progress.ProgressReporter(None, interval=0, clock=_Clock())
+
+    assert reporter.status().endswith("ETA ?")
+    assert reporter.eta(1.0) is None
+
+
+def test_log_report_summarizes_the_run(caplog):
+    clock = _Clock()
+    reporter = progress.ProgressReporter(4, interval=0, clock=clock)
+    reporter.downloaded(3_000_000)
+    reporter.downloaded(1_000_000)
+    reporter.failed()
+    reporter.retried()
+    clock.now = 2
+
+    with caplog.at_level(logging.INFO, logger="ai_paper_downloader"):
+        reporter.log_report()
+
+    assert caplog.messages == [
+        "Downloaded: 2 papers, 4.0 MB in 2s (1.0 papers/s, 2.0 MB/s)",
+        "Retries: 1 Failures: 1 (33.3%) Peak In Flight: 0",
+    ]
+
+
+def test_reporter_logs_status_records_while_entered(caplog):
+    with caplog.at_level(logging.INFO, logger="ai_paper_downloader"):
+        with progress.ProgressReporter(None, interval=0.01) as reporter:
+            reporter.downloaded(1)
+            deadline = time.monotonic() + 5
+            while not caplog.records and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+    assert caplog.records[0].status is True
+    assert caplog.messages[0].startswith("1/? papers")
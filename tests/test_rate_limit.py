@@ -0,0 +1,108 @@
+import pytest
+
+from ai_paper_downloader import rate_limit
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces_at_rate():
+    clock = _FakeClock()
+    bucket = rate_limit.TokenBucket(2.0, burst=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, 0.5, 0.5]
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_token_bucket_refills_while_idle():
+    clock = _FakeClock()
+    bucket = rate_limit.TokenBucket(4.0, burst=2, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10
+
+    assert [bucket.acquire(), bucket.acquire(), bucket.acquire()] == [0.0, 0.0, 0.25]
+
+
+def test_token_bucket_try_acquire_never_sleeps_or_reserves():
+    clock = _FakeClock()
+    bucket = rate_limit.TokenBucket(2.0, burst=2, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 0.5]
+    clock.now += 0.25
+    assert bucket.try_acquire() == 0.25
+    clock.now += 0.25
+    assert bucket.try_acquire() == 0.0
+    assert clock.sleeps == []
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError, match="rate must be positive"):
+        rate_limit.TokenBucket(0)
+
+
+def test_host_rate_limiter_keeps_separate_buckets_per_host():
+    clock = _FakeClock()
+    limiter = rate_limit.HostRateLimiter(1.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire("https://ojs.aaai.org/a.pdf") == 0.0
+    assert limiter.acquire("https://arxiv.org/pdf/1.pdf") == 0.0
+    assert limiter.acquire("https://OJS.aaai.org/b.pdf") == 1.0
+
+
+def test_host_rate_limiter_try_acquire_shares_buckets_with_acquire():
+    clock = _FakeClock()
+    limiter = rate_limit.HostRateLimiter(1.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert limiter.try_acquire("https://ojs.aaai.org/a.pdf") == 0.0
+    assert limiter.try_acquire("https://arxiv.org/pdf/1.pdf") == 0.0
+    assert limiter.try_acquire("https://ojs.aaai.org/b.pdf") == 1.0
+    assert limiter.acquire("https://ojs.aaai.org/b.pdf") == 1.0
+
+
+def test_shared_limiters_pace_one_host_at_the_lowest_rate():
+    clock = _FakeClock()
+    buckets = rate_limit.HostRateLimiter(None, clock=clock, sleep=clock.sleep)
+    fast = buckets.shared(2.0, burst=4)
+    slow = buckets.shared(1.0, burst=1)
+    unlimited = buckets.shared(None)
+
+    assert unlimited.try_acquire("https://openreview.net/a.pdf") == 0.0
+    assert fast.try_acquire("https://openreview.net/a.pdf") == 0.0
+    assert slow.try_acquire("https://openreview.net/b.pdf") == 0.0
+    # One bucket at 1/s with a burst of 1 now paces all three limiters.
+    assert fast.try_acquire("https://openreview.net/c.pdf") == 1.0
+    assert unlimited.try_acquire("https://openreview.net/d.pdf") == 1.0
+    assert fast.try_acquire("https://arxiv.org/pdf/1.pdf") == 0.0
+
+
+def test_host_rate_limiter_without_rate_never_waits():
+    limiter = rate_limit.HostRateLimiter(None)
+
+    assert limiter.acquire("https://example.com/a.pdf") == 0.0
+    assert limiter.try_acquire("https://example.com/a.pdf") == 0.0
+
+
+def test_resolve_rate_limit_precedence():
+    assert rate_limit.resolve_rate_limit("AAAI", 3.0, None, 0) == (3.0, 1)
+    assert rate_limit.resolve_rate_limit("AAAI", 0, None, 0) == (None, 1)
+    assert rate_limit.resolve_rate_limit("ICML", None, None, 0.5) == (2.0, 1)
+    assert rate_limit.resolve_rate_limit("AAAI", None, None, 0) == (4.0, 8)
+    assert rate_limit.resolve_rate_limit("ICML", None, 5, 0) == (None, 5)
+
+
+def test_url_host_normalizes_netloc():
+    assert rate_limit.url_host("https://OJS.aaai.org/index.php/x.pdf") == "ojs.aaai.org"
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Wall-clock budget of `python -m ai_paper_downloader --help`, interpreter
+# start-up included.
+STARTUP_BUDGET_SECONDS = 1.5
+STARTUP_RUNS = 3
+# Parser dependencies that must only load once their venue is selected.
+DEFERRED_MODULES = ("openreview", "yaml", "ai_paper_downloader.parser.iclr")
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_help() -> float:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-m", "ai_paper_downloader", "--help"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+    assert "--conference" in completed.stdout
+    return elapsed
+
+
+def test_help_stays_within_startup_budget():
+    best = min(_run_help() for _ in range(STARTUP_RUNS))
+
+    assert best < STARTUP_BUDGET_SECONDS
+
+
+def test_help_does_not_import_parser_dependencies():
+    script = (
+        "import sys\n"
+        "from ai_paper_downloader import main_entry\n"
+        "try:\n"
+        "    main_entry.command_args.args(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]\n"
+        "print('loaded:', *loaded)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.splitlines()[-1] == "loaded:"